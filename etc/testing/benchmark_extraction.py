@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from g4f.tools.files import EXTRACTORS, count_pdf_pages, extract_pages, extract_document
+
+def extract(file_path: str, extractor: str) -> list[str]:
+    pages = count_pdf_pages(file_path, extractor)
+    if pages is None:
+        return extract_document(file_path, extractor)
+    return extract_pages(file_path, extractor, 0, pages)
+
+def main(files: list[str]):
+    """Time every installed extractor on the given files, to check the order of EXTRACTORS."""
+    for file_path in files:
+        extension = Path(file_path).suffix[1:]
+        print(f"{file_path}:")
+        for extractor, available in EXTRACTORS.get(extension, []):
+            if not available:
+                print(f"  {extractor}: not installed")
+                continue
+            start = perf_counter()
+            chunks = extract(file_path, extractor)
+            secs = perf_counter() - start
+            print(f"  {extractor}: {secs:.2f} secs, {sum(len(chunk or '') for chunk in chunks)} chars")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(f"Usage: {sys.argv[0]} FILE...")
+        sys.exit(1)
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+import sys
+import json
+import marshal
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from g4f.providers.model_map import MODEL_MAP_FILE, MODEL_LISTS, load_model_map
+
+def create_literal() -> str:
+    # Source of the previous any_model_map.py, written from the current artifact
+    model_map = load_model_map()
+    lines = []
+    for key in [*MODEL_LISTS, "model_map", "models_count", "parents"]:
+        value = getattr(model_map, key)
+        if key == "model_map":
+            value = {model: dict(providers) for model, providers in value.items()}
+        elif key == "parents":
+            value = {parent: list(children) for parent, children in value.items()}
+        elif key == "models_count":
+            value = dict(value)
+        else:
+            value = list(value)
+        lines.append(f"{key} = {json.dumps(value, indent=2) if isinstance(value, dict) else repr(value)}")
+    return "\n".join(lines) + "\n"
+
+def run_literal(code) -> dict:
+    namespace = {}
+    exec(code, namespace)
+    return namespace
+
+def measure(method, rounds: int = 5):
+    best = None
+    for _ in range(rounds):
+        start = perf_counter()
+        method()
+        secs = perf_counter() - start
+        best = secs if best is None else min(best, secs)
+    tracemalloc.start()
+    result = method()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, size, result
+
+def main():
+    source = create_literal()
+    code = compile(source, "any_model_map.py", "exec")
+    bytecode = marshal.dumps(code)
+    print(f"Python literal: {len(source) / 1024:.0f} KiB source, {len(bytecode) / 1024:.0f} KiB bytecode")
+    print(f"JSON artifact: {Path(MODEL_MAP_FILE).stat().st_size / 1024:.0f} KiB")
+    for name, method in (
+        ("compile + exec literal", lambda: run_literal(compile(source, "any_model_map.py", "exec"))),
+        ("unmarshal + exec literal (.pyc)", lambda: run_literal(marshal.loads(bytecode))),
+        ("load JSON artifact", load_model_map),
+    ):
+        secs, size, _ = measure(method)
+        print(f"{name}: {secs * 1000:.1f} ms, {size / 1024:.0f} KiB allocated")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import sys
+import json
+import asyncio
+from pathlib import Path
+from time import perf_counter
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from g4f.requests.sse import aiter_json, json_loads
+
+EVENTS = 20000
+CHUNK_SIZE = 1024
+
+def create_stream(delimiter: str = "\n\n") -> bytes:
+    chunks = []
+    for index in range(EVENTS):
+        data = {"id": "chatcmpl-1", "model": "gpt-4o", "choices": [{"index": 0, "delta": {"content": f"token {index} "}, "finish_reason": None}]}
+        chunks.append(f"data: {json.dumps(data)}{delimiter}")
+    chunks.append(f"data: [DONE]{delimiter}")
+    return "".join(chunks).encode()
+
+async def iter_chunks(stream: bytes):
+    for start in range(0, len(stream), CHUNK_SIZE):
+        yield stream[start:start + CHUNK_SIZE]
+
+async def iter_lines(stream: bytes):
+    # Line splitting of the previous implementation
+    buffer = b""
+    async for chunk in iter_chunks(stream):
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+async def read_previous(stream: bytes) -> int:
+    count = 0
+    async for line in iter_lines(stream):
+        if line.startswith(b"data: "):
+            if line[6:].startswith(b"[DONE]"):
+                break
+            json.loads(line[6:])
+            count += 1
+    return count
+
+class ChunkResponse:
+    def __init__(self, stream: bytes):
+        self.stream = stream
+
+    def iter_content(self):
+        return iter_chunks(self.stream)
+
+async def read_decoder(stream: bytes) -> int:
+    count = 0
+    async for _ in aiter_json(ChunkResponse(stream)):
+        count += 1
+    return count
+
+async def main(rounds: int = 5):
+    for label, delimiter in (("empty lines", "\n\n"), ("without empty lines", "\n")):
+        stream = create_stream(delimiter)
+        print(f"{EVENTS} events {label}, {len(stream) / 1024:.0f} KiB, {CHUNK_SIZE} byte chunks, json backend: {json_loads.__module__}")
+        for name, method in (("line split + json.loads", read_previous), ("SSEDecoder", read_decoder)):
+            best = None
+            for _ in range(rounds):
+                start = perf_counter()
+                count = await method(stream)
+                secs = perf_counter() - start
+                best = secs if best is None else min(best, secs)
+            print(f"{name}: {count} events in {best * 1000:.1f} ms ({count / best:.0f} events/s)")
+
+if __name__ == "__main__":
+    asyncio.run(main())
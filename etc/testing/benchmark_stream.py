@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from g4f.client import iter_response
+from g4f.client.helper import find_stop, ContentAccumulator, StopMatcher
+
+CHUNKS = 100000
+# The previous implementation is quadratic, it is timed on fewer chunks
+PREVIOUS_CHUNKS = 10000
+STOP = ["<|im_end|>", "\nUser:", "###"]
+
+def create_stream() -> list[str]:
+    return [f"token{index} " for index in range(CHUNKS)]
+
+def read_previous(chunks: list[str]) -> str:
+    # Accumulation and stop search of the previous implementation
+    content = ""
+    for chunk in chunks:
+        content = str(content) + str(chunk)
+        first, content, chunk = find_stop(STOP, content, chunk)
+        if first != -1:
+            break
+    return content
+
+def read_matcher(chunks: list[str]) -> str:
+    content = ContentAccumulator()
+    stop_matcher = StopMatcher(STOP)
+    for chunk in chunks:
+        text = content.add(chunk)
+        first = stop_matcher.feed(text)
+        if first is not None:
+            content.truncate(content.size - len(text) + first)
+            break
+    return content.get()
+
+def read_iter_response(chunks: list[str]) -> str:
+    return list(iter_response(iter(chunks), False, stop=STOP))[-1].choices[0].message.content
+
+def main(rounds: int = 3):
+    chunks = create_stream()
+    print(f"{CHUNKS} chunks, {sum(len(chunk) for chunk in chunks) / 1024:.0f} KiB, {len(STOP)} stop words")
+    for name, method, count in (
+        ("concat + find_stop", read_previous, PREVIOUS_CHUNKS),
+        ("ContentAccumulator + StopMatcher", read_matcher, PREVIOUS_CHUNKS),
+        ("ContentAccumulator + StopMatcher", read_matcher, CHUNKS),
+        ("iter_response", read_iter_response, CHUNKS),
+    ):
+        best = None
+        for _ in range(rounds):
+            start = perf_counter()
+            content = method(chunks[:count])
+            secs = perf_counter() - start
+            best = secs if best is None else min(best, secs)
+        print(f"{name}: {count} chunks, {len(content)} chars in {best * 1000:.1f} ms ({count / best:.0f} chunks/s)")
+
+if __name__ == "__main__":
+    main()
@@ -15,5 +15,24 @@ from .retry_provider import *
 from .thinking import *
 from .web_search import *
 from .models import *
+from .session_pool import *
+from .usage import *
+from .sse import *
+from .media import *
+from .derivatives import *
+from .media_store import *
+from .files import *
+from .model_pool import *
+from .retrieval import *
+from .crawler import *
+from .search_cache import *
+from .scrape import *
+from .search_backends import *
+from .uploads import *
+from .bucket_reader import *
+from .tokenizer import *
+from .registry import *
+from .model_map import *
+from .version import *
 
 unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from g4f.tools.bucket_reader import BucketReader, build_line_index, get_lines_file, read_bucket_range
+from g4f.tools.files import read_bucket, read_path_chunked
+
+TEXT = "".join(f"Line {i} äöü €\n" for i in range(1000))
+
+class TestBucketReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.bucket_dir = Path(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_read_ranges(self):
+        (self.bucket_dir / "plain.cache").write_text(TEXT, encoding="utf-8")
+        with BucketReader(self.bucket_dir) as reader:
+            self.assertEqual(reader.size, len(TEXT.encode()))
+            self.assertEqual(reader.line_count, 1000)
+            self.assertEqual(reader.read_lines(10, 2), "Line 10 äöü €\nLine 11 äöü €\n")
+            self.assertEqual(reader.read_lines(999, 10), "Line 999 äöü €\n")
+            self.assertEqual(reader.read_lines(1000, 10), "")
+            # Pages never cut a character
+            pages = []
+            offset = 0
+            while offset < reader.size:
+                text, offset = reader.read(offset, 7)
+                self.assertNotIn("�", text)
+                pages.append(text)
+            self.assertEqual("".join(pages), TEXT)
+            self.assertEqual("".join(reader.iter_chunks(100)), TEXT)
+        self.assertTrue(get_lines_file(self.bucket_dir / "plain.cache").exists())
+
+    def test_parts(self):
+        (self.bucket_dir / "spacy_0001.cache").write_text("First\npart", encoding="utf-8")
+        (self.bucket_dir / "plain_0002.cache").write_text("", encoding="utf-8")
+        (self.bucket_dir / "plain_0003.cache").write_text("Second\n", encoding="utf-8")
+        (self.bucket_dir / "plain.cache").write_text("Not used\n", encoding="utf-8")
+        self.assertEqual("".join(read_bucket(self.bucket_dir)), "First\npartSecond\n")
+        page = read_bucket_range(self.bucket_dir, line=1, lines=2)
+        self.assertEqual(page["text"], "partSecond\n")
+        self.assertEqual((page["lines"], page["next_line"]), (3, 3))
+        page = read_bucket_range(self.bucket_dir, offset=3, length=6)
+        self.assertEqual((page["text"], page["next_offset"]), ("st\npar", 9))
+        self.assertIsNone(read_bucket_range(self.bucket_dir / "missing"))
+
+    def test_outdated_index(self):
+        cache_file = self.bucket_dir / "plain.cache"
+        cache_file.write_text("One\n", encoding="utf-8")
+        build_line_index(cache_file)
+        cache_file.write_text("One\nTwo\nThree", encoding="utf-8")
+        with BucketReader(self.bucket_dir) as reader:
+            self.assertEqual(reader.line_count, 3)
+            self.assertEqual(reader.read_lines(2, 1), "Three")
+
+    def test_concurrent_index(self):
+        cache_file = self.bucket_dir / "plain.cache"
+        cache_file.write_text(TEXT, encoding="utf-8")
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda _: build_line_index(cache_file), range(16)))
+        self.assertEqual(sorted(path.name for path in self.bucket_dir.iterdir()), ["plain.cache", "plain.cache.lines"])
+        with BucketReader(self.bucket_dir) as reader:
+            self.assertEqual(reader.line_count, 1000)
+
+    def test_read_path_chunked(self):
+        cache_file = self.bucket_dir / "plain.cache"
+        cache_file.write_text(TEXT, encoding="utf-8")
+        chunks = list(read_path_chunked(cache_file))
+        self.assertEqual("".join(chunks), TEXT)
+        self.assertTrue(all(len(chunk.encode()) < 8192 + 100 for chunk in chunks))
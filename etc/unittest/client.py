@@ -5,6 +5,7 @@ import unittest
 from g4f.errors import ModelNotFoundError
 from g4f.client import Client, AsyncClient, ChatCompletion, ChatCompletionChunk
 from g4f.client.service import get_model_and_provider
+from g4f.client.helper import ContentAccumulator, StopMatcher
 from g4f.Provider.Copilot import Copilot
 from g4f.models import gpt_4o
 from .mocks import AsyncGeneratorProviderMock, ModelProviderMock, YieldProviderMock
@@ -108,6 +109,17 @@ class TestPassModel(unittest.TestCase):
         self.assertIsInstance(response, ChatCompletion)
         self.assertEqual("How are you?", response.choices[0].message.content)
 
+    def test_stop_between_chunks(self):
+        client = Client(provider=YieldProviderMock)
+        messages = [{'role': 'user', 'content': chunk} for chunk in ["How ", "are ", "you", "?"]]
+        response = client.chat.completions.create(messages, "Hello", stop=["?", "e yo"])
+        self.assertEqual("How ar", response.choices[0].message.content)
+        self.assertEqual("stop", response.choices[0].finish_reason)
+        response = client.chat.completions.create(messages, "Hello", stream=True, stop=["re y"])
+        contents = [chunk.choices[0].delta.content for chunk in response]
+        # The stop word started in a chunk that was already sent
+        self.assertEqual(["How ", "are ", "", None], contents)
+
     def test_model_not_found(self):
         def run_exception():
             client = Client()
@@ -138,5 +150,25 @@ class TestPassModel(unittest.TestCase):
         self.assertTrue(hasattr(provider, "create_completion"))
         self.assertEqual(model, gpt_4o.name)
 
+class TestStopMatcher(unittest.TestCase):
+
+    def test_feed(self):
+        matcher = StopMatcher(["stop", "", "end"])
+        self.assertIsNone(matcher.feed("Hello st"))
+        self.assertIsNone(matcher.feed("o"))
+        self.assertEqual(matcher.feed("p here"), -3)
+        matcher = StopMatcher(["world", "o"])
+        self.assertEqual(matcher.feed("Hello world"), 4)
+        self.assertIsNone(StopMatcher([]).feed("text"))
+
+    def test_accumulator(self):
+        content = ContentAccumulator()
+        self.assertFalse(content)
+        for chunk in ["How ", "are ", "you", "?"]:
+            self.assertEqual(content.add(chunk), chunk)
+        self.assertEqual(content.get(), "How are you?")
+        content.truncate(7)
+        self.assertEqual((content.get(), content.size), ("How are", 7))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+from g4f.tools.crawler import Crawler, normalize_url
+from g4f.tools.files import download_urls, has_beautifulsoup4
+
+class TestCrawler(unittest.IsolatedAsyncioTestCase):
+
+    def test_normalize_url(self):
+        self.assertEqual(normalize_url("HTTPS://Example.com:443#top"), "https://example.com/")
+        self.assertEqual(normalize_url("http://example.com:8080/a?b=1"), "http://example.com:8080/a?b=1")
+        self.assertIsNone(normalize_url("mailto:user@example.com"))
+
+    async def test_dedupe_and_depth(self):
+        site = {
+            "https://a.com/": ["https://a.com/1", "https://a.com/2#x", "https://b.com/"],
+            "https://a.com/1": ["https://a.com/", "https://a.com/3"],
+            "https://a.com/2": [],
+            "https://b.com/": ["https://b.com/deep"],
+        }
+        fetched = []
+        async def fetch(url, depth):
+            fetched.append(normalize_url(url))
+            return url, site.get(normalize_url(url), [])
+        crawler = Crawler(fetch, workers=3, delay=0)
+        results = [result async for result in crawler.crawl(["https://a.com"], max_depth=1)]
+        self.assertEqual(len(results), 4)
+        self.assertEqual(sorted(fetched), ["https://a.com/", "https://a.com/1", "https://a.com/2", "https://b.com/"])
+
+    async def test_max_per_host(self):
+        running = 0
+        peak = 0
+        async def fetch(url, depth):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return url, []
+        crawler = Crawler(fetch, workers=8, max_per_host=2, delay=0)
+        results = [result async for result in crawler.crawl([f"https://a.com/{index}" for index in range(10)])]
+        self.assertEqual(len(results), 10)
+        self.assertEqual(peak, 2)
+
+    async def test_max_urls(self):
+        async def fetch(url, depth):
+            return url, [f"{url}/{index}" for index in range(10)]
+        crawler = Crawler(fetch, delay=0, max_urls=5)
+        results = [result async for result in crawler.crawl(["https://a.com"], max_depth=3)]
+        self.assertEqual(len(results), 5)
+
+    async def test_download_urls(self):
+        if not has_beautifulsoup4:
+            self.skipTest("beautifulsoup4 is not installed")
+        async def page(request):
+            index = int(request.match_info.get("index", 0))
+            links = "".join(f'<a href="/page/{index * 2 + child}">link</a>' for child in (1, 2))
+            return web.Response(text=f"<html><head></head><body><main>Page {index} {links}</main></body></html>", content_type="text/html")
+        app = web.Application()
+        app.router.add_get("/page/{index}", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            with tempfile.TemporaryDirectory() as tempdir:
+                filenames = [filename async for filename in download_urls(Path(tempdir), [f"http://127.0.0.1:{port}/page/0"], max_depth=2, delay=0)]
+                self.assertEqual(len(filenames), 7)
+                for filename in filenames:
+                    self.assertIn("Page", (Path(tempdir) / filename).read_text())
+        finally:
+            await runner.cleanup()
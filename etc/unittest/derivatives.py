@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from g4f.image import derivatives
+from g4f.image.derivatives import MediaDerivatives, has_requirements
+
+if has_requirements:
+    from PIL import Image
+
+class TestMediaDerivatives(unittest.TestCase):
+
+    def setUp(self):
+        if not has_requirements:
+            self.skipTest("pillow is not installed")
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.derivatives = MediaDerivatives(use_processes=False, media_dir=self.tempdir.name)
+        self.path = os.path.join(self.tempdir.name, "image.png")
+        Image.new("RGB", (800, 600)).save(self.path)
+
+    def tearDown(self):
+        if has_requirements:
+            self.derivatives.shutdown()
+            self.tempdir.cleanup()
+
+    def test_create(self):
+        metadata = self.derivatives.wait_sync(self.path)
+        self.assertEqual((metadata["width"], metadata["height"]), (800, 600))
+        with Image.open(os.path.join(self.derivatives.get_thumbnail_dir(), "image.png")) as image:
+            self.assertEqual(image.size, (400, 300))
+
+    def test_wait_timeout(self):
+        event = threading.Event()
+        create_derivatives = derivatives.create_derivatives
+        def slow_derivatives(path, thumbnail_path):
+            event.wait(5)
+            return create_derivatives(path, thumbnail_path)
+        with patch.object(derivatives, "create_derivatives", slow_derivatives):
+            self.assertIsNone(self.derivatives.wait_sync(self.path, 0.01))
+            event.set()
+            self.assertEqual(self.derivatives.wait_sync(self.path, 5)["width"], 800)
+
+    def test_dedupe(self):
+        futures = [self.derivatives.submit(self.path) for _ in range(3)]
+        self.assertEqual(len({id(future) for future in futures}), 1)
+        self.assertIsNotNone(futures[0].result())
+
+    def test_index(self):
+        asyncio.run(self.derivatives.wait(self.path))
+        # The result is in the index before the waiters get it
+        self.assertIsNotNone(self.derivatives.get(self.path))
+        derivatives = MediaDerivatives(use_processes=False, media_dir=self.tempdir.name)
+        self.assertEqual(derivatives.get(self.path)["width"], 800)
+        self.assertIsNone(derivatives.executor)
+
+    def test_compact_index(self):
+        self.derivatives.wait_sync(self.path, 5)
+        index_file = os.path.join(self.derivatives.get_thumbnail_dir(), derivatives.INDEX_FILE)
+        with open(index_file) as f:
+            line = f.read()
+        with open(index_file, "a") as f:
+            f.write(line * 3)
+            f.write(line.replace("image.png", "deleted.png"))
+        with patch.object(derivatives, "COMPACT_LINES", 2):
+            media_derivatives = MediaDerivatives(use_processes=False, media_dir=self.tempdir.name)
+            self.assertEqual(media_derivatives.get(self.path)["width"], 800)
+        with open(index_file) as f:
+            self.assertEqual(f.read(), line)
+        self.assertEqual(media_derivatives.index_lines, 1)
+
+    def test_not_an_image(self):
+        path = os.path.join(self.tempdir.name, "audio.mp3")
+        with open(path, "wb") as f:
+            f.write(b"audio")
+        self.assertIsNone(self.derivatives.submit(path))
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from g4f.tools.files import ExtractionPool, EXTRACTORS, EXTRACTION_LOG, CACHE_DIR, PLAIN_CACHE, FILE_LIST
+from g4f.tools.files import get_extractor, stream_read_files, stream_bucket, read_manifest, invalidate_cache
+
+class TestExtractionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.bucket_dir = Path(self.tempdir.name)
+        self.pool = ExtractionPool(max_workers=2, use_processes=False)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.tempdir.cleanup()
+
+    def test_get_extractor(self):
+        self.assertIsNone(get_extractor("txt"))
+        available = [name for name, has_extractor in EXTRACTORS["pdf"] if has_extractor]
+        self.assertEqual(get_extractor("pdf"), available[0] if available else None)
+
+    def test_document_order(self):
+        for index in range(5):
+            (self.bucket_dir / f"{index}.txt").write_text(f"text {index}")
+        output = "".join(self.pool.stream(self.bucket_dir, [f"{index}.txt" for index in range(5)]))
+        expected = "".join(f"<!-- File: {index}.txt -->\ntext {index}\n<-- End -->\n\n" for index in range(5))
+        self.assertEqual(output, expected)
+
+    def test_record_cost(self):
+        (self.bucket_dir / "file.txt").write_text("text")
+        list(self.pool.stream(self.bucket_dir, ["file.txt"]))
+        with (self.bucket_dir / EXTRACTION_LOG).open() as f:
+            cost = json.loads(f.readline())
+        self.assertEqual(cost["filename"], "file.txt")
+        self.assertEqual(cost["size"], 4)
+        self.assertIn("elapsed", cost)
+
+    def test_failed_file(self):
+        (self.bucket_dir / "broken.pdf").write_bytes(b"not a pdf")
+        (self.bucket_dir / "file.txt").write_text("text")
+        if get_extractor("pdf") is None:
+            self.skipTest("no pdf extractor is installed")
+        output = "".join(self.pool.stream(self.bucket_dir, ["broken.pdf", "file.txt"]))
+        self.assertTrue(output.endswith("<!-- File: file.txt -->\ntext\n<-- End -->\n\n"))
+
+    def test_stream_read_files(self):
+        (self.bucket_dir / "file.md").write_text("markdown")
+        self.assertIn("markdown", "".join(stream_read_files(self.bucket_dir, ["file.md", "missing.txt"])))
+
+class TestExtractionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.bucket_dir = Path(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def add_file(self, filename: str, text: str):
+        (self.bucket_dir / filename).write_text(text)
+        with (self.bucket_dir / FILE_LIST).open("a") as f:
+            f.write(f"{filename}\n")
+
+    def get_extracted(self) -> list[str]:
+        log_file = self.bucket_dir / EXTRACTION_LOG
+        if not log_file.exists():
+            return []
+        with log_file.open() as f:
+            return [json.loads(line)["filename"] for line in f]
+
+    def test_extract_new_files_only(self):
+        self.add_file("a.txt", "first")
+        self.assertIn("first", "".join(stream_bucket(self.bucket_dir)))
+        self.add_file("b.txt", "second")
+        output = "".join(stream_bucket(self.bucket_dir))
+        self.assertLess(output.index("first"), output.index("second"))
+        self.assertEqual(self.get_extracted(), ["a.txt", "b.txt"])
+        self.assertEqual((self.bucket_dir / PLAIN_CACHE).read_text(), output)
+        self.assertEqual(len(read_manifest(self.bucket_dir)), 2)
+
+    def test_unchanged_bucket(self):
+        self.add_file("a.txt", "first")
+        output = "".join(stream_bucket(self.bucket_dir))
+        self.assertEqual("".join(stream_bucket(self.bucket_dir)), output)
+        self.assertEqual(self.get_extracted(), ["a.txt"])
+
+    def test_changed_file(self):
+        self.add_file("a.txt", "first")
+        list(stream_bucket(self.bucket_dir))
+        (self.bucket_dir / "a.txt").write_text("changed")
+        output = "".join(stream_bucket(self.bucket_dir))
+        self.assertIn("changed", output)
+        self.assertNotIn("first", output)
+        self.assertEqual(self.get_extracted(), ["a.txt", "a.txt"])
+        # The outdated text is collected
+        self.assertEqual(len(list((self.bucket_dir / CACHE_DIR).iterdir())), 1)
+
+    def test_deleted_source(self):
+        self.add_file("a.txt", "first")
+        list(stream_bucket(self.bucket_dir))
+        (self.bucket_dir / "a.txt").unlink()
+        (self.bucket_dir / FILE_LIST).unlink()
+        self.add_file("b.txt", "second")
+        output = "".join(stream_bucket(self.bucket_dir))
+        self.assertIn("first", output)
+        self.assertIn("second", output)
+
+    def test_invalidate_cache(self):
+        self.add_file("a.txt", "first")
+        list(stream_bucket(self.bucket_dir))
+        invalidate_cache(self.bucket_dir)
+        self.assertEqual(list((self.bucket_dir / CACHE_DIR).iterdir()), [])
+        self.assertIn("first", "".join(stream_bucket(self.bucket_dir)))
+        self.assertEqual(self.get_extracted(), ["a.txt", "a.txt"])
+
+    def test_failed_file(self):
+        if get_extractor("pdf") is None:
+            self.skipTest("no pdf extractor is installed")
+        self.add_file("broken.pdf", "not a pdf")
+        self.add_file("a.txt", "first")
+        output = "".join(stream_bucket(self.bucket_dir))
+        self.assertIn("first", output)
+        entries = {entry["filename"]: entry for entry in read_manifest(self.bucket_dir)}
+        self.assertIn("error", entries["broken.pdf"])
+        self.assertNotIn("error", entries["a.txt"])
+        # The failed file is not extracted again until it changes
+        self.assertEqual("".join(stream_bucket(self.bucket_dir)), output)
+        self.assertEqual(self.get_extracted(), ["broken.pdf", "a.txt"])
+        (self.bucket_dir / "broken.pdf").write_text("still not a pdf")
+        list(stream_bucket(self.bucket_dir))
+        self.assertEqual(self.get_extracted(), ["broken.pdf", "a.txt", "broken.pdf"])
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import asyncio
+import tempfile
+import unittest
+
+try:
+    from g4f.api.media import MediaResponse, RangeNotSatisfiable, parse_range
+    has_requirements = True
+except:
+    has_requirements = False
+
+class TestMediaResponse(unittest.TestCase):
+
+    def setUp(self):
+        if not has_requirements:
+            self.skipTest("api is not installed")
+        self.data = bytes(range(256)) * 100
+        file = tempfile.NamedTemporaryFile(delete=False)
+        file.write(self.data)
+        file.close()
+        self.path = file.name
+
+    def tearDown(self):
+        if has_requirements:
+            os.remove(self.path)
+
+    def call(self, range: str = None, if_range: str = None, extensions: dict = None):
+        response = MediaResponse(self.path, media_type="video/mp4", range=range, if_range=if_range)
+        messages = []
+        async def send(message):
+            messages.append(message)
+        asyncio.run(response({"type": "http", "method": "GET", "extensions": extensions or {}}, None, send))
+        headers = {key.decode(): value.decode() for key, value in messages[0]["headers"]}
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        return messages[0]["status"], headers, body
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range("bytes=0-4,2-8,20-", 30), [(0, 9), (20, 30)])
+        self.assertEqual(parse_range("bytes=-5", 30), [(25, 30)])
+        self.assertIsNone(parse_range("items=0-4", 30))
+        self.assertIsNone(parse_range("bytes=5-2", 30))
+        with self.assertRaises(RangeNotSatisfiable):
+            parse_range("bytes=40-", 30)
+
+    def test_full(self):
+        status, headers, body = self.call()
+        self.assertEqual(status, 200)
+        self.assertEqual(body, self.data)
+        self.assertEqual(headers["accept-ranges"], "bytes")
+        self.assertEqual(headers["content-length"], str(len(self.data)))
+
+    def test_single_range(self):
+        status, headers, body = self.call("bytes=10-19")
+        self.assertEqual(status, 206)
+        self.assertEqual(body, self.data[10:20])
+        self.assertEqual(headers["content-range"], f"bytes 10-19/{len(self.data)}")
+
+    def test_multiple_ranges(self):
+        status, headers, body = self.call("bytes=0-1,100-101")
+        self.assertEqual(status, 206)
+        self.assertTrue(headers["content-type"].startswith("multipart/byteranges; boundary="))
+        self.assertEqual(len(body), int(headers["content-length"]))
+        self.assertIn(f"content-range: bytes 100-101/{len(self.data)}".encode(), body)
+
+    def test_not_satisfiable(self):
+        status, headers, body = self.call(f"bytes={len(self.data)}-")
+        self.assertEqual(status, 416)
+        self.assertEqual(headers["content-range"], f"bytes */{len(self.data)}")
+        self.assertEqual(body, b"")
+
+    def test_if_range(self):
+        status, _, body = self.call("bytes=0-1", '"other"')
+        self.assertEqual(status, 200)
+        self.assertEqual(body, self.data)
+
+    def test_pathsend(self):
+        status, _, body = self.call(extensions={"http.response.pathsend": {}})
+        self.assertEqual(status, 200)
+        self.assertEqual(body, b"")
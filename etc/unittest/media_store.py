@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import asyncio
+import tempfile
+import unittest
+
+from g4f.image.media_store import MediaStore
+
+class TestMediaStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.store = MediaStore(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tempdir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_deduplicate(self):
+        first = self.store.add(self.write("1_cat.png", b"image"), tags=["cat"])
+        second = self.store.add(self.write("2_other.png", b"image"), tags=["dog"])
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual(os.stat(first).st_nlink, 3)
+        self.assertEqual(self.store.get("2_other.png")["hash"], self.store.get("1_cat.png")["hash"])
+
+    def test_find(self):
+        self.store.add(self.write("1_cat.png", b"cat"), tags=["animal"])
+        self.store.add(self.write("2_dog.mp3", b"dog"), tags=["animal"])
+        self.assertEqual(self.store.find(["image", "animal"]), ["1_cat.png"])
+        self.assertEqual(self.store.find(["animal"]), ["1_cat.png", "2_dog.mp3"])
+        self.assertEqual(self.store.find(["dog"]), ["2_dog.mp3"])
+        os.unlink(os.path.join(self.tempdir.name, "2_dog.mp3"))
+        self.assertEqual(self.store.find(["animal"]), ["1_cat.png"])
+
+    def test_index(self):
+        self.write("0_existing.jpg", b"existing")
+        self.store.add(self.write("1_cat.png", b"cat"), tags=["animal"])
+        store = MediaStore(self.tempdir.name)
+        self.assertEqual(store.find(["animal"]), ["1_cat.png"])
+        self.assertEqual(store.find(["existing"]), ["0_existing.jpg"])
+
+    def test_import_duplicates(self):
+        first = self.write("0_first.jpg", b"existing")
+        second = self.write("1_second.jpg", b"existing")
+        self.assertEqual(sorted(self.store.find(["jpg"])), ["0_first.jpg", "1_second.jpg"])
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual(self.store.get("0_first.jpg")["hash"], self.store.get("1_second.jpg")["hash"])
+
+    def test_add_async(self):
+        path = self.write("1_speech.mp3", b"audio")
+        asyncio.run(self.store.add_async(path, tags=["hello"]))
+        self.assertEqual(self.store.find(["audio", "hello"]), ["1_speech.mp3"])
+        self.assertEqual(os.stat(path).st_nlink, 2)
+
+    def test_collect_garbage(self):
+        path = self.store.add(self.write("1_cat.png", b"cat"))
+        os.unlink(path)
+        self.assertEqual(self.store.collect_garbage(), 1)
+        self.assertEqual(self.store.collect_garbage(), 0)
+
+    def test_remove(self):
+        first = self.store.add(self.write("1_cat.png", b"cat"), tags=["animal"])
+        second = self.store.add(self.write("2_cat.png", b"cat"), tags=["animal"])
+        object_path = self.store.get_object_path(self.store.get(first.split(os.sep)[-1])["hash"])
+        self.store.remove(first)
+        self.assertTrue(os.path.isfile(object_path))
+        self.store.remove(second)
+        self.assertFalse(os.path.exists(object_path))
+        self.assertEqual(self.store.find(["animal"]), [])
+        self.assertEqual(MediaStore(self.tempdir.name).find(["animal"]), [])
+        self.assertEqual(self.store.collect_garbage(), 0)
@@ -1,3 +1,5 @@
+import asyncio
+
 from g4f.providers.base_provider import AbstractProvider, AsyncProvider, AsyncGeneratorProvider
 from g4f.providers.response import ImageResponse
 from g4f.errors import MissingAuthError
@@ -94,4 +96,14 @@ class YieldNoneProviderMock(AsyncGeneratorProvider):
     async def create_async_generator(
         cls, model, messages, stream, **kwargs
     ):
-        yield None
\ No newline at end of file
+        yield None
+
+class AsyncSlowProviderMock(AsyncGeneratorProvider):
+    working = True
+
+    @classmethod
+    async def create_async_generator(
+        cls, model, messages, stream, **kwargs
+    ):
+        await asyncio.sleep(1)
+        yield cls.__name__
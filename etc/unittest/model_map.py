@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+import unittest
+
+from g4f.providers.model_map import CompactModelMap, dump_model_map, write_model_map, load_model_map, get_model_map
+from g4f.providers.any_provider import AnyProvider
+from .registry import ROOT
+
+MODEL_MAP = {
+    "default": {"OpenaiChat": "", "Copilot": ""},
+    "gpt-4o": {"OpenaiChat": "gpt-4o", "PollinationsAI": "openai", "HuggingFace": ["gpt-4o", "gpt-4o-2024"]},
+    "flux": {"PollinationsAI": "flux"},
+}
+
+class TestModelMap(unittest.TestCase):
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file = os.path.join(tmpdir, "model_map.json")
+            write_model_map(
+                file, model_map=MODEL_MAP, models_count={"gpt-4o": 3},
+                parents={"HuggingFace": ["HuggingFaceMedia"]}, image_models=["flux"], audio_models=["openai"]
+            )
+            with open(file) as f:
+                data = json.load(f)
+            self.assertEqual(data["providers"], ["OpenaiChat", "Copilot", "PollinationsAI", "HuggingFace", "HuggingFaceMedia"])
+            self.assertEqual(data["strings"].count("gpt-4o"), 1)
+            model_map = load_model_map(file)
+        self.assertEqual({model: dict(providers) for model, providers in model_map.model_map.items()}, MODEL_MAP)
+        self.assertEqual(model_map.models, ["default", "gpt-4o", "flux"])
+        self.assertEqual(model_map.image_models, ("flux",))
+        self.assertEqual(model_map.video_models, ())
+        self.assertEqual(model_map.parents["HuggingFace"], ("HuggingFaceMedia",))
+        self.assertEqual(model_map.models_count["gpt-4o"], 3)
+        self.assertNotIn("gpt-5", model_map.model_map)
+
+    def test_read_only(self):
+        model_map = CompactModelMap(dump_model_map(MODEL_MAP, {}, {}))
+        with self.assertRaises(TypeError):
+            model_map.model_map["flux"]["OpenaiChat"] = "flux"
+        with self.assertRaises(TypeError):
+            model_map.model_map["flux"] = {}
+        with self.assertRaises(ValueError):
+            CompactModelMap({"version": 0})
+
+    def test_missing_file(self):
+        model_map = load_model_map(os.path.join(ROOT, "missing.json"))
+        self.assertEqual(len(model_map.model_map), 0)
+        self.assertEqual(model_map.models, [])
+
+    def test_any_provider(self):
+        model_map = get_model_map()
+        self.assertIs(AnyProvider.model_map, model_map.model_map)
+        self.assertIs(AnyProvider.image_models, model_map.image_models)
+        self.assertIn("default", AnyProvider.get_models())
+
+    def test_lazy_load(self):
+        code = "import g4f; from g4f.providers import model_map; print(model_map._model_map is None)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.stdout.strip(), "True")
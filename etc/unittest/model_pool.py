@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+
+from g4f.tools.model_pool import ModelPool, PoolTimeoutError
+
+class TestModelPool(unittest.TestCase):
+
+    def setUp(self):
+        self.created = 0
+        self.pool = ModelPool(self.create, max_size=2)
+
+    def create(self):
+        self.created += 1
+        return object()
+
+    def test_reuse(self):
+        with self.pool.acquire() as first:
+            pass
+        with self.pool.acquire() as second:
+            self.assertIs(first, second)
+        self.assertEqual(self.created, 1)
+
+    def test_max_size(self):
+        with self.pool.acquire(), self.pool.acquire():
+            with self.assertRaises(PoolTimeoutError):
+                self.pool.get(timeout=0.01)
+        self.assertEqual(self.created, 2)
+
+    def test_wait_for_instance(self):
+        instance = self.pool.get()
+        self.pool.get()
+        result = []
+        thread = threading.Thread(target=lambda: result.append(self.pool.get(timeout=5)))
+        thread.start()
+        self.pool.put(instance)
+        thread.join()
+        self.assertEqual(result, [instance])
+        self.assertEqual(self.created, 2)
+
+    def test_failed_factory(self):
+        pool = ModelPool(lambda: 1 / 0, max_size=1)
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                pool.get(timeout=0.01)
+        self.assertEqual(pool.size, 0)
+
+    def test_acquire_async(self):
+        async def run():
+            async with self.pool.acquire_async() as first:
+                pass
+            async with self.pool.acquire_async() as second:
+                return first is second
+        self.assertTrue(asyncio.run(run()))
+
+    def test_clear(self):
+        with self.pool.acquire() as first:
+            pass
+        self.pool.clear()
+        with self.pool.acquire() as second:
+            self.assertIsNot(first, second)
+
+    def test_acquire_async_cancelled(self):
+        pool = ModelPool(self.create, max_size=1)
+        async def run():
+            instance = pool.get()
+            task = asyncio.ensure_future(pool.acquire_async(timeout=5).__aenter__())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The waiting worker thread takes the instance and hands it back to the pool
+            pool.put(instance)
+            await asyncio.sleep(0.05)
+            async with pool.acquire_async(timeout=1) as second:
+                return instance is second
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual(self.created, 1)
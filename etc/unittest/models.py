@@ -1,10 +1,14 @@
 import unittest
 from typing import Type
 import asyncio
+from unittest.mock import patch
 
 from g4f.models import __models__
 from g4f.providers.base_provider import BaseProvider, ProviderModelMixin
 from g4f.errors import MissingRequirementsError, MissingAuthError
+from g4f.providers.any_provider import RoutingIndex
+from g4f import Provider
+from .mocks import YieldProviderMock
 
 class TestProviderHasModel(unittest.TestCase):
     cache: dict = {}
@@ -34,4 +38,34 @@ class TestProviderHasModel(unittest.TestCase):
     def test_all_providers_working(self):
         for model, providers in __models__.values():
             for provider in providers:
-                self.assertTrue(provider.working, f"{provider.__name__} in {model.name}")
\ No newline at end of file
+                self.assertTrue(provider.working, f"{provider.__name__} in {model.name}")
+
+class ModelListProviderMock(YieldProviderMock, ProviderModelMixin):
+    models = ["mock-model"]
+    model_aliases = {"mock-alias": "mock-model"}
+
+class TestRoutingIndex(unittest.TestCase):
+
+    def test_routing_index(self):
+        with patch.dict(Provider.__map__, {ModelListProviderMock.__name__: ModelListProviderMock}):
+            index = RoutingIndex.build(
+                {"model": {ModelListProviderMock.__name__: "alias", "Unknown": "model"}},
+                [],
+                vision=["model"],
+                audio=["model"],
+                image=["image-model"]
+            )
+        self.assertEqual(index.get("model"), ((ModelListProviderMock, "alias"),))
+        self.assertEqual(index.get("missing"), ())
+        self.assertIn("image-model", index.image)
+        self.assertEqual(index.get_modalities("model"), {"vision", "audio"})
+        self.assertEqual(index.get_modalities("image-model"), {"image"})
+        self.assertEqual(index.get_modalities("missing"), frozenset())
+        with self.assertRaises(TypeError):
+            index.routes["model"] = ()
+
+    def test_fallback(self):
+        index = RoutingIndex.build({}, [ModelListProviderMock])
+        self.assertEqual(index.get_fallback("mock-model"), (ModelListProviderMock,))
+        self.assertEqual(index.get_fallback("mock-alias"), (ModelListProviderMock,))
+        self.assertEqual(index.get_fallback("missing"), ())
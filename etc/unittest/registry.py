@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+import sys
+import subprocess
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from g4f import Provider
+from g4f.providers.registry import LazyProviderMap, create_manifest, load_manifest
+from .mocks import YieldProviderMock
+
+ROOT = Path(__file__).parent.parent.parent
+# Seconds for "import g4f", the default is far above the usual time to catch regressions only
+IMPORT_TIME_BUDGET = float(os.environ.get("G4F_IMPORT_TIME_BUDGET", 3))
+LAZY_MODULES = ["g4f.tools.files", "g4f.tools.retrieval", "g4f.Provider.local", "g4f.Provider.not_working", "pdfminer", "PyPDF2"]
+
+def get_import_times(code: str) -> dict:
+    """Run code with ``python -X importtime``, returns the cumulative microseconds by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_g4f(self):
+        times = get_import_times("import g4f")
+        self.assertIn("g4f", times)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, times)
+        self.assertLess(times["g4f"] / 1e6, IMPORT_TIME_BUDGET)
+
+class TestProviderRegistry(unittest.TestCase):
+
+    def test_manifest(self):
+        manifest = load_manifest()
+        self.assertEqual(list(manifest), sorted(manifest))
+        self.assertEqual(manifest, create_manifest())
+        self.assertEqual(Provider.__map__.get_info("OpenaiAccount")["parent"], "OpenaiChat")
+
+    def test_lazy_map(self):
+        providers = LazyProviderMap({
+            "YieldProviderMock": {"module": "etc.unittest.mocks", "working": True},
+            "Missing": {"module": "etc.unittest.missing", "working": True},
+        })
+        self.assertIn("Missing", providers)
+        self.assertEqual(providers.get_names(working=True), ["YieldProviderMock", "Missing"])
+        self.assertEqual(providers.providers, {})
+        self.assertIs(providers["YieldProviderMock"], YieldProviderMock)
+        self.assertIsNone(providers.get("Missing"))
+        self.assertNotIn("Missing", providers)
+        self.assertEqual(providers.copy(), {"YieldProviderMock": YieldProviderMock})
+
+    def test_provider_package(self):
+        self.assertIs(Provider.PollinationsAI, Provider.__map__["PollinationsAI"])
+        self.assertIs(Provider.ProviderUtils.convert, Provider.__map__)
+        self.assertIn("AnyProvider", Provider.__map__)
+        self.assertEqual(len(Provider.__providers__), len(Provider.__map__))
+        with patch.dict(Provider.__map__, {"YieldProviderMock": YieldProviderMock}):
+            self.assertIs(Provider.ProviderUtils.convert["YieldProviderMock"], YieldProviderMock)
+        self.assertNotIn("YieldProviderMock", Provider.__map__)
+        with self.assertRaises(AttributeError):
+            Provider.Missing
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from g4f.tools.files import FILE_LIST, INDEX_DIR, stream_bucket, read_bucket_context, invalidate_cache
+from g4f.tools import retrieval
+from g4f.tools.retrieval import Embedder, split_chunks, set_embedder
+
+TOPICS = {
+    "cats.txt": "The cat sleeps on the warm sofa and purrs.",
+    "rockets.txt": "The rocket engine burns liquid oxygen and kerosene.",
+    "bread.txt": "Knead the dough and let the bread rise overnight.",
+}
+
+class TestRetrieval(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.bucket_dir = Path(self.tempdir.name)
+        for filename, sentence in TOPICS.items():
+            paragraphs = [f"{sentence} Paragraph {index}." for index in range(300)]
+            (self.bucket_dir / filename).write_text("\n\n".join(paragraphs))
+        (self.bucket_dir / FILE_LIST).write_text("".join(f"{filename}\n" for filename in TOPICS))
+
+    def tearDown(self):
+        set_embedder(None)
+        self.tempdir.cleanup()
+
+    def test_split_chunks(self):
+        data = ("ä" * 100).encode()
+        chunks = split_chunks(data, 0, len(data), 15)
+        self.assertEqual(b"".join(data[start:end] for start, end in chunks), data)
+        for start, end in chunks:
+            data[start:end].decode()
+            self.assertLessEqual(end - start, 15)
+
+    def test_relevant_chunks(self):
+        list(stream_bucket(self.bucket_dir))
+        self.assertEqual(len(list((self.bucket_dir / INDEX_DIR).glob("*.json"))), 3)
+        context = read_bucket_context(self.bucket_dir, "How does a rocket engine work?", top_k=2)
+        self.assertIn("<!-- File: rockets.txt -->", context)
+        self.assertNotIn("sofa", context)
+        self.assertNotIn("dough", context)
+        self.assertLess(len(context), 4000)
+
+    def test_small_bucket(self):
+        (self.bucket_dir / FILE_LIST).write_text("cats.txt\n")
+        (self.bucket_dir / "cats.txt").write_text(TOPICS["cats.txt"])
+        list(stream_bucket(self.bucket_dir))
+        context = read_bucket_context(self.bucket_dir, "rocket")
+        self.assertIn("sofa", context)
+
+    def test_missing_index(self):
+        list(stream_bucket(self.bucket_dir))
+        for path in (self.bucket_dir / INDEX_DIR).iterdir():
+            path.unlink()
+        self.assertIn("dough", read_bucket_context(self.bucket_dir, "bread dough", top_k=1))
+
+    def test_invalidate_cache(self):
+        list(stream_bucket(self.bucket_dir))
+        invalidate_cache(self.bucket_dir)
+        self.assertEqual(list((self.bucket_dir / INDEX_DIR).iterdir()), [])
+
+    def test_embedder(self):
+        if not retrieval.has_numpy:
+            self.skipTest("numpy is not installed")
+        words = ["cat", "rocket", "bread"]
+        set_embedder(Embedder("test", lambda texts: [[float(word in text.lower()) for word in words] for text in texts]))
+        list(stream_bucket(self.bucket_dir))
+        self.assertEqual(len(list((self.bucket_dir / INDEX_DIR).glob("*.test.npy"))), 3)
+        context = read_bucket_context(self.bucket_dir, "bread", top_k=2)
+        self.assertIn("<!-- File: bread.txt -->", context)
@@ -4,7 +4,10 @@ import unittest
 
 from g4f.client import AsyncClient, ChatCompletion, ChatCompletionChunk
 from g4f.providers.retry_provider import IterListProvider
-from .mocks import YieldProviderMock, RaiseExceptionProviderMock, AsyncRaiseExceptionProviderMock, YieldNoneProviderMock
+from g4f.providers.scoring import ProviderScorer
+from g4f.providers.circuit_breaker import CircuitBreaker
+from g4f.errors import RateLimitError, ResponseStatusError
+from .mocks import YieldProviderMock, RaiseExceptionProviderMock, AsyncRaiseExceptionProviderMock, YieldNoneProviderMock, AsyncSlowProviderMock
 
 DEFAULT_MESSAGES = [{'role': 'user', 'content': 'Hello'}]
 
@@ -57,4 +60,119 @@ class TestIterListProvider(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(response_list), 2)
         for chunk in response_list:
             if chunk.choices[0].delta.content is not None:
-                self.assertEqual(chunk.choices[0].delta.content, "Hello")
\ No newline at end of file
+                self.assertEqual(chunk.choices[0].delta.content, "Hello")
+
+class TestHedgedIterListProvider(unittest.IsolatedAsyncioTestCase):
+
+    async def test_hedged_request(self):
+        provider = IterListProvider([AsyncSlowProviderMock, YieldProviderMock], False, hedge_delay=0.05)
+        client = AsyncClient(provider=provider)
+        response = await client.chat.completions.create(DEFAULT_MESSAGES, "")
+        self.assertEqual("Hello", response.choices[0].message.content)
+        self.assertEqual(response.provider, YieldProviderMock.__name__)
+
+    async def test_hedged_skip_provider(self):
+        provider = IterListProvider([AsyncRaiseExceptionProviderMock, YieldProviderMock], False, hedge_delay=10)
+        client = AsyncClient(provider=provider)
+        response = await client.chat.completions.create(DEFAULT_MESSAGES, "")
+        self.assertEqual("Hello", response.choices[0].message.content)
+
+    async def test_hedged_max_hedged(self):
+        provider = IterListProvider([AsyncSlowProviderMock, YieldProviderMock], False, hedge_delay=0.05, max_hedged=1)
+        client = AsyncClient(provider=provider)
+        response = await client.chat.completions.create(DEFAULT_MESSAGES, "")
+        self.assertEqual(AsyncSlowProviderMock.__name__, response.choices[0].message.content)
+
+class TestProviderScorer(unittest.IsolatedAsyncioTestCase):
+
+    def test_order_by_score(self):
+        scorer = ProviderScorer(exploration=0)
+        scorer.record_success(YieldProviderMock.__name__, "model", ttft=0.1)
+        scorer.record_success(RaiseExceptionProviderMock.__name__, "model", ttft=5)
+        providers = scorer.order([RaiseExceptionProviderMock, YieldProviderMock], "model")
+        self.assertEqual(providers, [YieldProviderMock, RaiseExceptionProviderMock])
+
+    def test_error_rate(self):
+        scorer = ProviderScorer(exploration=0)
+        scorer.record_success(RaiseExceptionProviderMock.__name__, ttft=0.1)
+        scorer.record_success(YieldProviderMock.__name__, ttft=1)
+        scorer.record_error(RaiseExceptionProviderMock.__name__)
+        providers = scorer.order([RaiseExceptionProviderMock, YieldProviderMock])
+        self.assertEqual(providers[0], YieldProviderMock)
+
+    async def test_record_stats(self):
+        scorer = ProviderScorer()
+        client = AsyncClient(provider=IterListProvider([AsyncRaiseExceptionProviderMock, YieldProviderMock], False, scorer))
+        await client.chat.completions.create(DEFAULT_MESSAGES, "")
+        stats = scorer.get_stats()
+        self.assertEqual(stats[AsyncRaiseExceptionProviderMock.__name__][""]["errors"], 1)
+        self.assertEqual(stats[YieldProviderMock.__name__][""]["errors"], 0)
+        self.assertEqual(stats[YieldProviderMock.__name__][""]["requests"], 1)
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_open_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure("Provider", "model", RateLimitError())
+        self.assertTrue(breaker.allow("Provider", "model"))
+        breaker.record_failure("Provider", "model", RateLimitError())
+        self.assertFalse(breaker.allow("Provider", "model"))
+        self.assertFalse(breaker.allow("Provider", "other"))
+        self.assertEqual(breaker.get_state("Provider", "model"), "open")
+
+    def test_ignored_exception(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure("Provider", "model", RuntimeError())
+        self.assertTrue(breaker.allow("Provider", "model"))
+
+    def test_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+        breaker.record_failure("Provider", None, RateLimitError())
+        self.assertEqual(breaker.get_state("Provider"), "half-open")
+        breaker.record_failure("Provider", None, RateLimitError())
+        self.assertEqual(breaker.circuits["Provider"].cooldown, 0)
+        breaker.record_success("Provider")
+        self.assertEqual(breaker.get_state("Provider"), "closed")
+
+    def test_single_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+        breaker.record_failure("Provider", "model", RateLimitError())
+        self.assertTrue(breaker.allow("Provider", "model"))
+        # Checking does not claim the trial
+        self.assertTrue(breaker.allow("Provider", "model"))
+        breaker.claim("Provider", "model")
+        self.assertFalse(breaker.allow("Provider", "model"))
+        self.assertFalse(breaker.allow("Provider", "other"))
+        breaker.record_failure("Provider", "model", RuntimeError())
+        self.assertTrue(breaker.allow("Provider", "model"))
+        breaker.claim("Provider", "model")
+        breaker.record_success("Provider", "model")
+        self.assertTrue(breaker.allow("Provider", "model"))
+
+    def test_model_error(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure("Provider", "model", ResponseStatusError("Response 404: Model not found"))
+        self.assertFalse(breaker.allow("Provider", "model"))
+        self.assertTrue(breaker.allow("Provider", "other"))
+        breaker.record_failure("Provider", "model", ResponseStatusError("Response 503: Service Unavailable"))
+        self.assertFalse(breaker.allow("Provider", "other"))
+
+    def test_unused_provider_not_claimed(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+        breaker.record_failure(YieldNoneProviderMock.__name__, "", RateLimitError())
+        provider = IterListProvider([YieldProviderMock, YieldNoneProviderMock], False, breaker=breaker)
+        self.assertEqual(provider.get_providers([], ""), [YieldProviderMock, YieldNoneProviderMock])
+        list(provider.create_completion("", DEFAULT_MESSAGES, stream=False))
+        self.assertTrue(breaker.allow(YieldNoneProviderMock.__name__, ""))
+
+    def test_probe_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0, probe_timeout=0)
+        breaker.record_failure("Provider", None, RateLimitError())
+        self.assertTrue(breaker.allow("Provider"))
+        self.assertTrue(breaker.allow("Provider"))
+
+    def test_open_provider_last(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure(YieldProviderMock.__name__, "", RateLimitError())
+        provider = IterListProvider([YieldProviderMock, YieldNoneProviderMock], False, breaker=breaker)
+        self.assertEqual(provider.get_providers([], ""), [YieldNoneProviderMock, YieldProviderMock])
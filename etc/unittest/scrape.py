@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from aiohttp import web, ClientSession
+
+from g4f.tools import web_search
+from g4f.tools.web_search import scrape_text, fetch_and_scrape
+from g4f.tools.search_cache import PageCache
+
+PAGE = """<html><head><link rel="canonical" href="https://example.com/page"><script>var ignored;</script></head>
+<body><nav><p>Menu</p></nav><main><h1>Title</h1><p>First   paragraph.</p><p>First paragraph.</p>
+<ul><li>One</li><li>Two</li></ul><a href="/" title="Cat"><img alt="cat" src="https://example.com/cat.png"></a></main>
+<p>Footer</p></body></html>"""
+
+class TestScrapeText(unittest.TestCase):
+
+    def test_main_content(self):
+        text = "".join(scrape_text(PAGE))
+        self.assertEqual(text, "Title\nFirst paragraph.\nOne\nTwo\n![Cat](https://example.com/cat.png)\n\nSource: [example.com](https://example.com/page)")
+
+    def test_max_words(self):
+        html = "<body>" + "".join(f"<p>word{index} word</p>" for index in range(1000)) + "</body>"
+        text = "".join(scrape_text(html, max_words=10, add_source=False))
+        self.assertEqual(text, "".join(f"word{index} word\n" for index in range(4)))
+
+    def test_content_after_max_words(self):
+        html = "<nav><ul>" + "".join(f"<li>Menu item {index}</li>" for index in range(50)) + "</ul></nav>"
+        html += "<main><p>The real article text.</p></main>"
+        self.assertEqual("".join(scrape_text(html, max_words=100, add_source=False)), "The real article text.\n")
+
+    def test_without_content(self):
+        self.assertEqual("".join(scrape_text("<p>Only <b>text</b></p><style>p {}</style>", add_source=False)), "Only text\n")
+
+class TestFetchAndScrape(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.page_cache = web_search.page_cache
+        web_search.page_cache = PageCache(Path(self.tempdir.name) / "cache.sqlite", fresh_ttl=0)
+        self.requests = []
+        async def page(request):
+            self.requests.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(text=PAGE, content_type="text/html", headers={"etag": '"v1"'})
+        app = web.Application()
+        app.router.add_get("/", page)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+        web_search.page_cache.connection.close()
+        web_search.page_cache = self.page_cache
+        self.tempdir.cleanup()
+
+    async def test_conditional_request(self):
+        async with ClientSession() as session:
+            first = await fetch_and_scrape(session, self.url, 100)
+            second = await fetch_and_scrape(session, self.url, 100)
+        self.assertIn("First paragraph.", first)
+        self.assertEqual(first, second)
+        self.assertEqual(self.requests, [None, '"v1"'])
+        self.assertEqual(web_search.page_cache.stats["not_modified"], 1)
+
+    async def test_fresh_page(self):
+        web_search.page_cache.fresh_ttl = 60
+        async with ClientSession() as session:
+            await fetch_and_scrape(session, self.url, 100)
+            await fetch_and_scrape(session, self.url, 100)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(web_search.page_cache.get_stats()["hits"], 1)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import unittest
+from aiohttp import web
+
+from g4f.tools.search_backends import (
+    DDGSBackend, SearXNGBackend, FakeBackend, backends, register_backend, search_backends
+)
+from g4f.tools.web_search import search
+from g4f.providers.asyncio import run_coroutine_sync, get_background_loop
+
+def result(number: int, host: str = "example.com") -> dict:
+    return {"title": f"Title {number}", "url": f"https://{host}/{number}", "snippet": f"Snippet {number}"}
+
+class FailingBackend(FakeBackend):
+    async def search(self, query: str, max_results: int = 5, **kwargs):
+        raise RuntimeError("Search failed")
+
+class SlowBackend(DDGSBackend):
+    name = "Slow"
+
+    def search_sync(self, query: str, max_results: int, region: str, backend: str):
+        time.sleep(0.2)
+        return [result(1)]
+
+class TestSearchBackends(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.names = []
+
+    def tearDown(self):
+        for name in self.names:
+            backends.pop(name, None)
+
+    def register(self, backend):
+        self.names.append(backend.name)
+        return register_backend(backend)
+
+    async def test_merge(self):
+        first = self.register(FakeBackend([result(1), result(2), result(3)], "FakeA"))
+        self.register(FakeBackend([result(2), result(4, "other.com"), result(5)], "FakeB"))
+        results = await search_backends("query", "FakeA, FakeB", max_results=4)
+        self.assertEqual([item["url"] for item in results], [
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://other.com/4",
+            "https://example.com/3",
+        ])
+        self.assertEqual(first.queries, ["query"])
+
+    async def test_failing_backend(self):
+        self.register(FakeBackend({"query": [result(1)]}, "FakeA"))
+        self.register(FailingBackend(name="Failing"))
+        self.assertEqual(await search_backends("query", ["FakeA", "Failing"]), [result(1)])
+        with self.assertRaises(RuntimeError):
+            await search_backends("query", "Failing")
+        with self.assertRaises(ValueError):
+            await search_backends("query", "Unknown")
+
+    async def test_search(self):
+        self.register(FakeBackend([result(1), result(2)], "FakeA"))
+        results = await search("query", add_text=False, provider="FakeA")
+        self.assertEqual([entry.url for entry in results], ["https://example.com/1", "https://example.com/2"])
+        self.assertEqual(results.results[0].snippet, "Snippet 1")
+
+    async def test_thread_pool(self):
+        self.register(SlowBackend(max_workers=2))
+        ticks = 0
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        task = asyncio.create_task(tick())
+        try:
+            results = await asyncio.gather(*[search_backends(f"query {i}", "Slow") for i in range(2)])
+        finally:
+            task.cancel()
+        self.assertEqual(results, [[result(1)], [result(1)]])
+        self.assertGreater(ticks, 5)
+
+    async def test_searxng(self):
+        async def handler(request):
+            self.assertEqual(request.query["format"], "json")
+            return web.json_response({"results": [
+                {"title": "Title", "url": "https://example.com/", "content": request.query["q"]},
+                {"title": "No url"},
+            ]})
+        app = web.Application()
+        app.router.add_get("/search", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        try:
+            backend = SearXNGBackend(f"http://127.0.0.1:{runner.addresses[0][1]}")
+            results = await backend.search("query")
+        finally:
+            await runner.cleanup()
+        self.assertEqual(results, [{"title": "Title", "url": "https://example.com/", "snippet": "query"}])
+
+class TestBackgroundLoop(unittest.IsolatedAsyncioTestCase):
+
+    async def test_run_coroutine_sync(self):
+        async def get_loop():
+            return asyncio.get_running_loop()
+        # Works in a thread that runs an event loop, without creating new loops
+        self.assertIs(run_coroutine_sync(get_loop()), get_background_loop())
+        self.assertIs(run_coroutine_sync(get_loop()), get_background_loop())
+        self.assertIsNot(get_background_loop(), asyncio.get_running_loop())
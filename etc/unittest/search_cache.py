@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from g4f.tools.search_cache import SearchCache, normalize_query
+
+RESULTS = {"results": [{"title": "Title", "url": "https://example.com", "snippet": "Snippet", "text": None}], "used_words": 3}
+
+class TestSearchCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / "cache.sqlite"
+        self.cache = SearchCache(self.path)
+        self.calls = 0
+
+    def tearDown(self):
+        if self.cache.connection is not None:
+            self.cache.connection.close()
+        self.tempdir.cleanup()
+
+    async def create(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return RESULTS
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  Hello\tWORLD "), "hello world")
+        self.assertEqual(SearchCache.get_key("Hello  World", max_results=5), SearchCache.get_key("hello world", max_results=5))
+        self.assertNotEqual(SearchCache.get_key("hello", max_results=5), SearchCache.get_key("hello", max_results=6))
+
+    async def test_memory_and_disk(self):
+        key = self.cache.get_key("query")
+        self.assertEqual(await self.cache.get_or_create(key, "query", self.create), RESULTS)
+        self.assertEqual(await self.cache.get_or_create(key, "query", self.create), RESULTS)
+        cache = SearchCache(self.path)
+        self.assertEqual(await cache.get_or_create(key, "query", self.create), RESULTS)
+        cache.connection.close()
+        self.assertEqual(self.calls, 1)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["memory_hits"], stats["misses"]), (1, 1))
+        self.assertEqual(cache.stats["disk_hits"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    async def test_inflight(self):
+        key = self.cache.get_key("query")
+        results = await asyncio.gather(*[self.cache.get_or_create(key, "query", self.create) for _ in range(5)])
+        self.assertEqual(results, [RESULTS] * 5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats["inflight_hits"], 4)
+
+    async def test_owner_cancelled(self):
+        async def create():
+            self.calls += 1
+            await asyncio.sleep(0.2)
+            return RESULTS
+        key = self.cache.get_key("query")
+        owner = asyncio.ensure_future(self.cache.get_or_create(key, "query", create))
+        while self.calls < 1:
+            await asyncio.sleep(0.001)
+        waiters = [asyncio.ensure_future(self.cache.get_or_create(key, "query", create)) for _ in range(2)]
+        while self.cache.stats["inflight_hits"] < 2:
+            await asyncio.sleep(0.001)
+        owner.cancel()
+        results = await asyncio.gather(*waiters)
+        self.assertTrue(owner.cancelled())
+        self.assertEqual(results, [RESULTS] * 2)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.cache.inflight, {})
+
+    async def test_ttl(self):
+        self.cache.ttl = 0
+        key = self.cache.get_key("query")
+        await self.cache.get_or_create(key, "query", self.create)
+        await self.cache.get_or_create(key, "query", self.create)
+        self.assertEqual(self.calls, 2)
+
+    async def test_empty_results(self):
+        async def create():
+            self.calls += 1
+            return {"results": [], "used_words": 0}
+        key = self.cache.get_key("query")
+        await self.cache.get_or_create(key, "query", create)
+        await self.cache.get_or_create(key, "query", create)
+        self.assertEqual(self.calls, 2)
+
+    def test_max_size(self):
+        self.cache.max_size = 500
+        for index in range(10):
+            self.cache.set(f"key{index}", "query", RESULTS)
+        stats = self.cache.get_stats()
+        self.assertLessEqual(stats["disk_size"], 500)
+        self.assertGreater(stats["evictions"], 0)
+        self.cache.memory.clear()
+        self.assertIsNotNone(self.cache.get("key9"))
+        self.assertIsNone(self.cache.get("key0"))
+
+    def test_total_size(self):
+        self.cache.max_size = 1000
+        for index in range(10):
+            self.cache.set(f"key{index % 3}", "query", RESULTS)
+        total = self.cache.connection.execute("SELECT SUM(size) FROM results").fetchone()[0]
+        self.assertEqual(self.cache.total_size, total)
+        self.assertEqual(self.cache.evictions, 0)
+        cache = SearchCache(self.path)
+        cache.connect()
+        self.assertEqual(cache.total_size, total)
+        cache.connection.close()
+
+    async def test_disk_in_thread(self):
+        threads = []
+        get = self.cache.get
+        def get_in_thread(key):
+            threads.append(threading.get_ident())
+            return get(key)
+        with patch.object(self.cache, "get", side_effect=get_in_thread):
+            key = self.cache.get_key("query")
+            await self.cache.get_or_create(key, "query", self.create)
+            self.cache.memory.clear()
+            self.assertEqual(await self.cache.get_or_create(key, "query", self.create), RESULTS)
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(self.calls, 1)
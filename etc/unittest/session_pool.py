@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from http.cookiejar import Cookie
+
+from g4f.requests import SharedSession, SessionPool
+from g4f.requests.session_pool import NoCookieJar, PooledSession
+from g4f.Provider.template import OpenaiTemplate
+
+class TestSessionPool(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.pool = SessionPool()
+
+    async def asyncTearDown(self):
+        await self.pool.close()
+
+    async def test_reuse_session(self):
+        async with SharedSession("https://example.com/v1", pool=self.pool) as session:
+            inner = session.pooled.inner
+        async with SharedSession("https://example.com/chat", pool=self.pool) as session:
+            self.assertIs(session.pooled.inner, inner)
+        self.assertEqual(len(self.pool.sessions), 1)
+
+    async def test_session_per_host(self):
+        async with SharedSession("https://example.com", pool=self.pool):
+            async with SharedSession("https://example.org", pool=self.pool):
+                self.assertEqual(len(self.pool.sessions), 2)
+
+    async def test_evict_idle(self):
+        self.pool.idle_timeout = -1
+        async with SharedSession("https://example.com", pool=self.pool):
+            pass
+        async with SharedSession("https://example.org", pool=self.pool):
+            self.assertEqual(len(self.pool.sessions), 1)
+
+    async def test_concurrent_acquire(self):
+        pooled = await asyncio.gather(*[self.pool.acquire("https://example.com") for _ in range(5)])
+        self.assertEqual(len({id(session) for session in pooled}), 1)
+        self.assertIsNotNone(pooled[0].inner)
+        self.assertEqual(pooled[0].in_use, 5)
+        for session in pooled:
+            self.pool.release(session)
+
+    async def test_failed_open(self):
+        async def fail(pooled):
+            await pooled.close()
+            raise OSError("failed")
+        with patch.object(PooledSession, "open", fail):
+            results = await asyncio.gather(*[self.pool.acquire("https://example.com") for _ in range(2)], return_exceptions=True)
+        self.assertEqual([type(result) for result in results], [OSError, OSError])
+        self.assertEqual(self.pool.sessions, {})
+
+    def test_no_cookies(self):
+        jar = NoCookieJar()
+        jar.set_cookie(Cookie(0, "name", "value", None, False, "example.com", True, False, "/", True, False, None, False, None, None, {}))
+        self.assertEqual(list(jar), [])
+        self.assertTrue(OpenaiTemplate.use_shared_session)
+
+class TestSessionPoolLoops(unittest.TestCase):
+
+    def test_close_on_loop_shutdown(self):
+        pool = SessionPool()
+        async def request():
+            async with SharedSession("https://example.com", pool=pool) as session:
+                return session.pooled
+        for _ in range(3):
+            pooled = asyncio.run(request())
+            # nest_asyncio patches asyncio.run to reuse one loop that stays open
+            if pooled.loop.is_closed():
+                self.assertEqual(pool.sessions, {})
+                self.assertEqual(pool.guards, {})
+                if hasattr(pooled.inner, "closed"):
+                    self.assertTrue(pooled.inner.closed)
+            else:
+                self.assertEqual(len(pool.sessions), 1)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from g4f.requests.sse import SSEDecoder, iter_events, aiter_json
+
+class AsyncChunks:
+    def __init__(self, chunks: list):
+        self.chunks = chunks
+
+    async def iter_content(self):
+        for chunk in self.chunks:
+            yield chunk
+
+class TestSSEDecoder(unittest.TestCase):
+
+    def test_fields(self):
+        events = list(iter_events([b": comment\nevent: update\nid: 1\nretry: 500\ndata: {\"a\": 1}\n\n"]))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].event, "update")
+        self.assertEqual(events[0].id, "1")
+        self.assertEqual(events[0].retry, 500)
+        self.assertEqual(events[0].json(), {"a": 1})
+
+    def test_multiline_data(self):
+        events = list(iter_events([b"data: first\ndata:second\n\n"]))
+        self.assertEqual(events[0].data, b"first\nsecond")
+        self.assertEqual(events[0].event, "message")
+
+    def test_split_line_endings(self):
+        stream = b"data: 1\r\n\r\ndata: 2\r\rdata: 3\n\n"
+        chunks = [stream[index:index + 1] for index in range(len(stream))]
+        self.assertEqual([event.data for event in iter_events(chunks)], [b"1", b"2", b"3"])
+
+    def test_close(self):
+        decoder = SSEDecoder()
+        self.assertEqual([event.data for event in decoder.feed(b"data: 1\n\ndata: 2")], [b"1"])
+        self.assertEqual([event.data for event in decoder.close()], [b"2"])
+
+    def test_json_lines(self):
+        decoder = SSEDecoder()
+        events = decoder.feed(b'data: {"a": 1}\n')
+        self.assertEqual([event.parsed for event in events], [{"a": 1}])
+        self.assertEqual([event.json() for event in decoder.feed(b'data: {"b": 2}\ndata: [DONE]\n')], [{"b": 2}])
+        self.assertEqual([event.data for event in decoder.close()], [b"[DONE]"])
+        # Multi-line data that is not complete JSON is still joined
+        self.assertEqual([event.data for event in iter_events([b'data: {"a":\ndata: 1}\n\n'])], [b'{"a":\n1}'])
+
+    def test_delimited_json(self):
+        decoder = SSEDecoder()
+        self.assertEqual(len(decoder.feed(b'data: {"a": 1}\n\n')), 1)
+        # After an empty line, events are only dispatched on empty lines
+        self.assertEqual(decoder.feed(b'data: {"b": 2}\ndata: {"c": 3}\n'), [])
+        events = decoder.feed(b"\n")
+        self.assertEqual([(event.data, event.parsed) for event in events], [(b'{"b": 2}\n{"c": 3}', None)])
+
+    def test_aiter_json(self):
+        response = AsyncChunks([b'data: {"a"', b': 1}\n\ndata: invalid\n\n', b'data: {"b": 2}\ndata: {"c": 3}\n\n', b"data: [DONE]\n\ndata: {}\n\n"])
+        async def run():
+            return [data async for data in aiter_json(response, ignore_errors=True)]
+        self.assertEqual(asyncio.run(run()), [{"a": 1}, {"b": 2}, {"c": 3}])
+
+    def test_aiter_json_error(self):
+        response = AsyncChunks([b"data: invalid\n\n"])
+        async def run():
+            return [data async for data in aiter_json(response)]
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from g4f.tools.tokenizer import (
+    Encoder, HeuristicEncoder, TokenCounter, count_tokens, count_message_tokens,
+    get_encoder, get_encoding_name, register_encoder, encoders, load_encoder, DEFAULT_ENCODING
+)
+from g4f.tools import tokenizer
+from g4f.client import Client
+from .mocks import YieldProviderMock
+
+TEXT = "The quick brown fox jumps over the lazy dog. Numbers like 123456 and Übergrößenträger too!\n\nNext paragraph."
+
+class CharEncoder(Encoder):
+    name = "chars"
+
+    def count(self, text: str) -> int:
+        return len(text)
+
+class TestTokenizer(unittest.TestCase):
+
+    def setUp(self):
+        load_encoder(DEFAULT_ENCODING)
+
+    def test_heuristic(self):
+        encoder = HeuristicEncoder()
+        self.assertEqual(encoder.count(""), 0)
+        self.assertEqual(encoder.count("Hello world"), 2)
+        self.assertEqual(encoder.count("123456"), 2)
+        self.assertGreater(encoder.count("internationalization"), 1)
+
+    def test_encoding_name(self):
+        self.assertEqual(get_encoding_name("gpt-4o-mini"), "o200k_base")
+        self.assertEqual(get_encoding_name("openai/gpt-4.1"), "o200k_base")
+        self.assertEqual(get_encoding_name("llama-3.3-70b"), "cl100k_base")
+        self.assertIs(get_encoder("gpt-4o"), get_encoder("gpt-4o-mini"))
+
+    def test_streaming(self):
+        encoder = get_encoder()
+        for size in (1, 3, 7, 50):
+            counter = TokenCounter()
+            for start in range(0, len(TEXT), size):
+                counter.add(TEXT[start:start + size])
+            self.assertEqual(counter.total, encoder.count(TEXT))
+        counter = TokenCounter()
+        counter.add("x" * 1000)
+        self.assertLess(len(counter.pending), 300)
+
+    def test_messages(self):
+        messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": [{"type": "text", "text": "Hello"}]}]
+        count = count_message_tokens(messages)
+        self.assertEqual(count, 3 + 2 * 3 + count_tokens("system") + count_tokens("Be brief.") + count_tokens("user") + count_tokens("Hello"))
+        self.assertEqual(count_message_tokens(messages), count)
+
+    def test_count_cache(self):
+        encoder = CharEncoder()
+        text = "x" * 100000
+        with patch.object(encoder, "count", wraps=encoder.count) as count, patch.object(tokenizer, "COUNT_CACHE_SIZE", 2):
+            self.assertEqual(tokenizer._count_cached(encoder, text), 100000)
+            self.assertEqual(tokenizer._count_cached(encoder, text), 100000)
+            self.assertEqual(count.call_count, 1)
+            for other in ("a", "b"):
+                tokenizer._count_cached(encoder, other)
+            self.assertLessEqual(len(tokenizer._counts), 2)
+            # Only a digest of the text is kept
+            self.assertTrue(all(len(digest) == 20 for _, digest in tokenizer._counts))
+            tokenizer._count_cached(encoder, text)
+            self.assertEqual(count.call_count, 4)
+
+    def test_register_encoder(self):
+        factory = encoders.get("cl100k_base")
+        register_encoder("cl100k_base", CharEncoder)
+        try:
+            load_encoder("cl100k_base")
+            self.assertEqual(count_tokens("Hello", "llama"), 5)
+        finally:
+            encoders.pop("cl100k_base")
+            tokenizer._loaded.pop("cl100k_base")
+        self.assertNotEqual(get_encoder("llama").name, "chars")
+        if factory is not None:
+            register_encoder("cl100k_base", factory)
+            load_encoder("cl100k_base")
+
+    def test_load_in_background(self):
+        loaded = threading.Event()
+        def factory():
+            loaded.wait(5)
+            return CharEncoder()
+        register_encoder("slow", factory)
+        try:
+            with patch.object(tokenizer, "MODEL_ENCODINGS", [("slow-model", "slow")]):
+                self.assertEqual(get_encoder("slow-model").name, "heuristic")
+                self.assertEqual(get_encoder("slow-model").name, "heuristic")
+                self.assertEqual(tokenizer._loading, {"slow"})
+                loaded.set()
+                for _ in range(100):
+                    if "slow" in tokenizer._loaded:
+                        break
+                    threading.Event().wait(0.01)
+                self.assertEqual(get_encoder("slow-model").name, "chars")
+        finally:
+            loaded.set()
+            encoders.pop("slow")
+            tokenizer._loaded.pop("slow", None)
+
+class TestUsage(unittest.TestCase):
+
+    def setUp(self):
+        load_encoder(DEFAULT_ENCODING)
+
+    def test_usage(self):
+        client = Client(provider=YieldProviderMock)
+        messages = [{'role': 'user', 'content': chunk} for chunk in ["How ", "are ", "you", "?"]]
+        response = client.chat.completions.create(messages, "Hello")
+        self.assertEqual(response.usage.completion_tokens, count_tokens("How are you?"))
+        self.assertEqual(response.usage.prompt_tokens, count_message_tokens(messages))
+        self.assertEqual(response.usage.total_tokens, response.usage.prompt_tokens + response.usage.completion_tokens)
+
+    def test_max_tokens(self):
+        client = Client(provider=YieldProviderMock)
+        messages = [{'role': 'user', 'content': "One two three four five six"}]
+        response = client.chat.completions.create(messages, "Hello", max_tokens=3)
+        self.assertEqual(response.choices[0].finish_reason, "length")
+        self.assertEqual(response.choices[0].message.content, "One two three four five six")
+        messages = [{'role': 'user', 'content': chunk} for chunk in ["One ", "two ", "three ", "four"]]
+        response = client.chat.completions.create(messages, "Hello", max_tokens=3)
+        self.assertEqual(response.choices[0].message.content, "One two three ")
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+import os
+import json
+import hashlib
+import tempfile
+import unittest
+import threading
+from pathlib import Path
+
+from g4f.tools.uploads import (
+    UploadJob, UploadQueue, save_upload, iter_multipart_uploads, append_file_list, has_markitdown, has_multipart_decoder
+)
+from g4f.tools.files import get_filenames, FILE_LIST
+
+class TestUploads(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.bucket_dir = self.tempdir.name
+        self.queue = UploadQueue(max_workers=2)
+
+    def tearDown(self):
+        self.queue.shutdown()
+        self.tempdir.cleanup()
+
+    def create_job(self, filename: str, data: bytes) -> UploadJob:
+        path, digest, size = save_upload(io.BytesIO(data), self.bucket_dir, os.path.splitext(filename)[1], chunk_size=4)
+        return UploadJob(self.bucket_dir, filename, path, digest, size)
+
+    def test_save_upload(self):
+        data = b"Hello World\n" * 100
+        path, digest, size = save_upload(io.BytesIO(data), self.bucket_dir, ".txt", chunk_size=7)
+        self.assertEqual(os.path.dirname(path), self.bucket_dir)
+        self.assertEqual(digest, hashlib.sha256(data).hexdigest())
+        self.assertEqual(size, len(data))
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_multipart_uploads(self):
+        if not has_multipart_decoder:
+            self.skipTest("werkzeug is not installed")
+        data = b"Hello World\r\n" * 100
+        body = (
+            b'--boundary\r\nContent-Disposition: form-data; name="other"\r\n\r\nvalue\r\n'
+            b'--boundary\r\nContent-Disposition: form-data; name="files"; filename="notes.txt"\r\n'
+            b'Content-Type: text/plain\r\n\r\n' + data + b'\r\n'
+            b'--boundary\r\nContent-Disposition: form-data; name="files"; filename="empty.md"\r\n\r\n\r\n'
+            b'--boundary--\r\n'
+        )
+        uploads = list(iter_multipart_uploads(io.BytesIO(body), "boundary", self.bucket_dir, chunk_size=7))
+        self.assertEqual([(filename, mimetype, size) for filename, mimetype, _, _, size in uploads], [("notes.txt", "text/plain", len(data)), ("empty.md", "", 0)])
+        filename, mimetype, path, digest, size = uploads[0]
+        self.assertEqual(digest, hashlib.sha256(data).hexdigest())
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+        with self.assertRaises(ValueError):
+            list(iter_multipart_uploads(io.BytesIO(body[:200]), "boundary", self.bucket_dir))
+        self.assertEqual(len(os.listdir(self.bucket_dir)), 2)
+
+    def test_append_file_list(self):
+        threads = [
+            threading.Thread(target=append_file_list, args=(self.bucket_dir, [f"file{i}.txt", f"file{i}.md"]))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        filenames = get_filenames(Path(self.bucket_dir))
+        self.assertEqual(len(filenames), 40)
+        for i in range(20):
+            self.assertEqual(filenames.index(f"file{i}.md"), filenames.index(f"file{i}.txt") + 1)
+
+    def test_process_jobs(self):
+        if has_markitdown:
+            self.skipTest("markitdown converts the test files")
+        text_job = self.queue.submit(self.create_job("notes.txt", b"Some notes"))
+        unsupported_job = self.queue.submit(self.create_job("data.bin", b"\x00\x01"))
+        events = [
+            json.loads(event[len("data: "):])
+            for event in self.queue.iter_events([text_job.id, unsupported_job.id], timeout=10)
+        ]
+        self.assertEqual(events[-1], {"action": "done", "finished": True})
+        states = {event["job"]["filename"]: event["job"] for event in events[:-1]}
+        self.assertEqual(states["notes.txt"]["status"], "done")
+        self.assertEqual(states["notes.txt"]["files"], ["notes.txt"])
+        self.assertEqual(states["data.bin"]["status"], "error")
+        with open(os.path.join(self.bucket_dir, "notes.txt"), "rb") as f:
+            self.assertEqual(f.read(), b"Some notes")
+        with open(os.path.join(self.bucket_dir, FILE_LIST)) as f:
+            self.assertEqual(f.read(), "notes.txt\n")
+        self.assertEqual(os.listdir(self.bucket_dir).count("data.bin"), 0)
+        self.assertFalse([name for name in os.listdir(self.bucket_dir) if name.startswith(".upload-")])
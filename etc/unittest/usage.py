@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import datetime
+import unittest
+import tempfile
+
+from g4f.cookies import get_cookies_dir, set_cookies_dir
+from g4f.tools.usage import UsageRecorder, get_usage_dir
+
+class TestUsageRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.cookies_dir = get_cookies_dir()
+        self.tempdir = tempfile.TemporaryDirectory()
+        set_cookies_dir(self.tempdir.name)
+        self.recorder = UsageRecorder(flush_interval=60)
+        self.date = str(datetime.date.today())
+
+    def tearDown(self):
+        set_cookies_dir(self.cookies_dir)
+        self.tempdir.cleanup()
+
+    def test_record_and_flush(self):
+        self.recorder.record({"user": "a", "model": "m", "provider": "p", "total_tokens": 3})
+        self.assertFalse((get_usage_dir() / f"{self.date}.jsonl").exists())
+        self.recorder.flush()
+        lines = (get_usage_dir() / f"{self.date}.jsonl").read_text().splitlines()
+        self.assertEqual([json.loads(line)["user"] for line in lines], ["a"])
+
+    def test_read(self):
+        self.assertIsNone(self.recorder.read(self.date))
+        self.recorder.record({"model": "m"})
+        self.assertEqual(self.recorder.read(self.date), '{"model": "m"}\n')
+        self.assertIsNone(self.recorder.read("../secret"))
+
+    def test_aggregates(self):
+        self.recorder.record({"user": "a", "model": "m", "provider": "p", "prompt_tokens": 1, "total_tokens": 3})
+        self.recorder.flush()
+        self.recorder.record({"user": "b", "model": "m", "provider": "p", "prompt_tokens": 2, "total_tokens": 5})
+        models = self.recorder.get_aggregates(self.date, "model")
+        self.assertEqual(models["m"], {"requests": 2, "prompt_tokens": 3, "total_tokens": 8})
+        self.recorder.record({"user": "a", "model": "m", "provider": "p", "total_tokens": 1})
+        users = self.recorder.get_aggregates(self.date, "user")
+        self.assertEqual(users["a"], {"requests": 2, "prompt_tokens": 1, "total_tokens": 4})
+
+    def test_aggregates_of_other_dates(self):
+        yesterday = str(datetime.date.today() - datetime.timedelta(days=1))
+        get_usage_dir().mkdir(parents=True)
+        (get_usage_dir() / f"{yesterday}.jsonl").write_text('{"model": "m", "total_tokens": 2}\n')
+        self.assertEqual(self.recorder.get_aggregates(yesterday)["m"], {"requests": 1, "total_tokens": 2})
+        self.assertEqual(self.recorder.get_aggregates("2000-01-01"), {})
+        self.assertIsNone(self.recorder.aggregates_date)
+        self.recorder.get_aggregates()
+        self.assertEqual(self.recorder.aggregates_date, self.date)
+
+    def test_rotation(self):
+        self.recorder.max_file_size = 0
+        self.recorder.record({"model": "a"})
+        self.recorder.flush()
+        self.recorder.record({"model": "b"})
+        self.recorder.flush()
+        self.assertTrue((get_usage_dir() / f"{self.date}.1.jsonl").exists())
+        self.assertEqual([usage["model"] for usage in self.recorder.iter_records(self.date)], ["a", "b"])
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import g4f.version
+from g4f import debug
+from g4f.version import VersionCheck, parse_interval
+from g4f.errors import VersionNotFoundError
+from g4f.client.service import get_model_and_provider
+from .mocks import ProviderMock
+
+class TestVersionCheck(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tempdir.name) / "latest_version.json"
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_cached(self):
+        version_check = VersionCheck(interval=3600, file=self.file)
+        with patch.object(g4f.version.utils, "get_latest_version", return_value="1.0.0") as get_latest_version:
+            self.assertEqual(version_check.check(), "1.0.0")
+            self.assertEqual(version_check.check(), "1.0.0")
+            self.assertEqual(get_latest_version.call_count, 1)
+            self.assertEqual(json.loads(self.file.read_text())["latest_version"], "1.0.0")
+            version_check.interval = 0
+            version_check.check()
+            self.assertEqual(get_latest_version.call_count, 2)
+
+    def test_offline(self):
+        version_check = VersionCheck(interval=3600, file=self.file)
+        with patch.object(g4f.version.utils, "get_latest_version", side_effect=VersionNotFoundError("offline")) as get_latest_version:
+            self.assertIsNone(version_check.check())
+            self.assertIsNone(version_check.check())
+            self.assertEqual(get_latest_version.call_count, 1)
+        self.assertIn("offline", json.loads(self.file.read_text())["error"])
+
+    def test_background(self):
+        version_check = VersionCheck(file=self.file)
+        event = threading.Event()
+        def get_latest_version(timeout):
+            event.wait(5)
+            return "1.0.0"
+        with patch.object(g4f.version.utils, "get_latest_version", side_effect=get_latest_version):
+            thread = version_check.start()
+            self.assertIsNotNone(thread)
+            self.assertIsNone(version_check.start())
+            self.assertFalse(self.file.exists())
+            event.set()
+            thread.join(5)
+        self.assertEqual(json.loads(self.file.read_text())["latest_version"], "1.0.0")
+
+    def test_first_request(self):
+        with patch.object(g4f.version.version_check, "start") as start, patch.object(debug, "version_check", True):
+            get_model_and_provider("", ProviderMock, False)
+            get_model_and_provider("", ProviderMock, False)
+        start.assert_called_once_with()
+
+    def test_get_latest_version(self):
+        version_check = VersionCheck(interval=3600, file=self.file)
+        with patch.object(version_check, "start") as start:
+            self.assertIsNone(version_check.get_latest_version())
+            start.assert_called_once_with()
+            version_check.save({"checked_at": time.time(), "latest_version": "1.0.0"})
+            self.assertEqual(version_check.get_latest_version(), "1.0.0")
+            start.assert_called_once_with()
+
+    def test_parse_interval(self):
+        self.assertEqual(parse_interval("3600"), 3600)
+        self.assertEqual(parse_interval("1.5"), 1.5)
+        self.assertEqual(parse_interval("1h"), 3600)
+        self.assertEqual(parse_interval(" 2D "), 2 * 24 * 60 * 60)
+        self.assertEqual(parse_interval(None, 10), 10)
+        with patch.object(debug, "error"):
+            self.assertEqual(parse_interval("soon", 10), 10)
+            self.assertEqual(parse_interval("-1", 10), 10)
+            self.assertEqual(parse_interval("nan", 10), 10)
@@ -11,6 +11,7 @@ from .helper import format_prompt
 from ..tools.media import merge_media
 from ..image import to_data_uri
 from ..providers.response import FinishReason
+from ..requests.sse import aiter_json
 
 
 class Startnest(AsyncGeneratorProvider, ProviderModelMixin):
@@ -140,31 +141,20 @@ class Startnest(AsyncGeneratorProvider, ProviderModelMixin):
                 
                 if stream:
                     # Handle streaming response (SSE format)
-                    async for line in response.content:
-                        if line:
-                            line = line.decode('utf-8').strip()
-                            if line.startswith("data: "):
-                                data_str = line[6:]
-                                if data_str == "[DONE]":
-                                    break
-                                try:
-                                    json_data = json.loads(data_str)
-                                    if "choices" in json_data and len(json_data["choices"]) > 0:
-                                        choice = json_data["choices"][0]
-                                        
-                                        # Handle content
-                                        delta = choice.get("delta", {})
-                                        content = delta.get("content", "")
-                                        if content:
-                                            yield content
-                                        
-                                        # Handle finish_reason
-                                        if "finish_reason" in choice and choice["finish_reason"] is not None:
-                                            yield FinishReason(choice["finish_reason"])
-                                            break
-                                            
-                                except json.JSONDecodeError:
-                                    continue
+                    async for json_data in aiter_json(response.content, ignore_errors=True):
+                        if "choices" in json_data and len(json_data["choices"]) > 0:
+                            choice = json_data["choices"][0]
+
+                            # Handle content
+                            delta = choice.get("delta", {})
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+
+                            # Handle finish_reason
+                            if "finish_reason" in choice and choice["finish_reason"] is not None:
+                                yield FinishReason(choice["finish_reason"])
+                                break
                 else:
                     # Handle non-streaming response (regular JSON)
                     response_text = await response.text()
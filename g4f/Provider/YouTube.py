@@ -12,6 +12,7 @@ from ..typing import AsyncResult, Messages
 from .base_provider import AsyncGeneratorProvider, ProviderModelMixin
 from ..providers.response import AudioResponse, VideoResponse, YouTubeResponse
 from ..image.copy_images import get_media_dir
+from ..image.media_store import media_store
 from .helper import format_media_prompt
 
 class YouTube(AsyncGeneratorProvider, ProviderModelMixin):
@@ -56,6 +57,7 @@ class YouTube(AsyncGeneratorProvider, ProviderModelMixin):
             if new_results:
                 video_url = new_results[0]['url']
                 path = await provider.download(video_url, model=model, output_dir=get_media_dir())
+                await media_store.add_async(path, tags=["youtube", prompt])
                 if path.endswith('.mp3'):
                     yield AudioResponse(f"/media/{os.path.basename(path)}")
                 else:
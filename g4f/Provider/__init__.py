@@ -1,79 +1,43 @@
 from __future__ import annotations
 
+import sys
+from types import ModuleType
+
 from ..providers.types          import BaseProvider, ProviderType
 from ..providers.retry_provider import RetryProvider, IterListProvider
 from ..providers.base_provider  import AsyncProvider, AsyncGeneratorProvider
 from ..providers.create_images  import CreateImagesProvider
+from ..providers.registry       import LazyProviderMap, load_manifest
 from .. import debug
 
-from .needs_auth       import *
-from .needs_auth.hf    import HuggingFace, HuggingChat, HuggingFaceAPI, HuggingFaceInference, HuggingFaceMedia
-try:
-    from .needs_auth.mini_max import HailuoAI, MiniMax
-except ImportError as e:
-    debug.error("MiniMax providers not loaded:", e)
+# Providers are imported on first access, see providers.json and providers/registry.py
+__map__: LazyProviderMap = LazyProviderMap(load_manifest())
+__all__: list[str] = [name for name in __map__]
 
-from .template         import OpenaiTemplate, BackendApi
-from .har              import HarProvider
-try:
-    from .not_working import *
-except ImportError as e:
-    debug.error("Not working providers not loaded:", e)
-try:
-    from .local import *
-except ImportError as e:
-    debug.error("Local providers not loaded:", e)
-try:
-    from .hf_space import *
-except ImportError as e:
-    debug.error("HuggingFace Space providers not loaded:", e)
-try:
-    from .audio import *
-except ImportError as e:
-    debug.error("Audio providers not loaded:", e)
+def __getattr__(name: str):
+    if name in ("__providers__", "__modules__"):
+        providers = __map__.values()
+        globals()["__providers__"] = providers
+        globals()["__modules__"] = providers
+        return providers
+    if name in __map__:
+        provider = __map__[name]
+        globals()[name] = provider
+        return provider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .deprecated.ARTA      import ARTA
-from .Blackbox             import Blackbox
-from .Chatai               import Chatai
-from .Cloudflare           import Cloudflare
-from .Copilot              import Copilot
-from .DeepInfraChat        import DeepInfraChat
-from .DuckDuckGo           import DuckDuckGo
-from .Free2GPT             import Free2GPT
-from .ImageLabs            import ImageLabs
-from .LambdaChat           import LambdaChat
-from .LegacyLMArena        import LegacyLMArena
-from .OIVSCodeSer2         import OIVSCodeSer2
-from .OIVSCodeSer0501      import OIVSCodeSer0501
-from .OperaAria            import OperaAria
-from .PenguinAI            import PenguinAI
-from .PerplexityLabs       import PerplexityLabs
-from .PollinationsAI       import PollinationsAI
-from .PollinationsImage    import PollinationsImage
-from .Startnest            import Startnest
-from .TeachAnything        import TeachAnything
-from .Together             import Together
-from .WeWordle             import WeWordle
-from .YouTube              import YouTube
-from .Yqcloud              import Yqcloud
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-import sys
+class ProviderPackage(ModuleType):
+    # Importing a provider module binds it to the package attribute of the same name
+    def __getattribute__(self, name: str):
+        value = super().__getattribute__(name)
+        if isinstance(value, ModuleType) and name in __map__:
+            return __map__[name]
+        return value
 
-__modules__: list = [
-    getattr(sys.modules[__name__], provider) for provider in dir()
-    if not provider.startswith("__")
-]
-__providers__: list[ProviderType] = [
-    provider for provider in __modules__
-    if isinstance(provider, type)
-    and issubclass(provider, BaseProvider)
-]
-__all__: list[str] = [
-    provider.__name__ for provider in __providers__
-]
-__map__: dict[str, ProviderType] = {
-    provider.__name__: provider for provider in __providers__
-}
+sys.modules[__name__].__class__ = ProviderPackage
 
 class ProviderUtils:
     convert: dict[str, ProviderType] = __map__
@@ -14,6 +14,7 @@ except ImportError:
 from ...typing import AsyncResult, Messages
 from ...providers.response import AudioResponse
 from ...image.copy_images import get_filename, get_media_dir, ensure_media_dir
+from ...image.media_store import media_store
 from ..base_provider import AsyncGeneratorProvider, ProviderModelMixin
 from ..helper import get_last_message
 
@@ -72,4 +73,5 @@ class EdgeTTS(AsyncGeneratorProvider, ProviderModelMixin):
         communicate = edge_tts.Communicate(prompt, voice=voice, proxy=proxy, **extra_parameters)
 
         await communicate.save(target_path)
+        await media_store.add_async(target_path, tags=[cls.model_id, voice, prompt])
         yield AudioResponse(f"/media/{filename}", voice=voice, text=prompt)
\ No newline at end of file
@@ -5,13 +5,12 @@ import asyncio
 from typing import Any
 
 try:
-    from ...integration.markitdown import MarkItDown as MaItDo, StreamInfo
+    from ...integration.markitdown import markitdown_pool, StreamInfo
     has_markitdown = True
 except ImportError:
     has_markitdown = False
 
 from ...typing import AsyncResult, Messages, MediaListType
-from ...tools.files import get_tempfile
 from ..base_provider import AsyncGeneratorProvider, ProviderModelMixin
 
 class MarkItDown(AsyncGeneratorProvider, ProviderModelMixin):
@@ -30,25 +29,15 @@ class MarkItDown(AsyncGeneratorProvider, ProviderModelMixin):
             raise ValueError("MarkItDown requires media to be provided.")
         if not has_markitdown:
             raise ImportError("MarkItDown is not installed. Please install it with `pip install markitdown`.")
-        md = MaItDo()
-        for file, filename in media:
-            text = None
-            try:
-                result = md.convert(
-                    file,
-                    stream_info=StreamInfo(filename=filename) if filename else None,
-                    llm_client=llm_client,
-                    llm_model=model
-                )
-                if asyncio.iscoroutine(result.text_content):
-                    text = await result.text_content
-                else:
-                    text = result.text_content
-            except TypeError:
-                copyfile = get_tempfile(file, filename)
+        # Convert all files first, the pooled instance is not held while yielding
+        texts = []
+        async with markitdown_pool.acquire_async() as md:
+            for file, filename in media:
+                text = None
                 try:
                     result = md.convert(
-                        copyfile, 
+                        file,
+                        stream_info=StreamInfo(filename=filename) if filename else None,
                         llm_client=llm_client,
                         llm_model=model
                     )
@@ -56,8 +45,23 @@ class MarkItDown(AsyncGeneratorProvider, ProviderModelMixin):
                         text = await result.text_content
                     else:
                         text = result.text_content
-                finally:
-                    os.remove(copyfile)
-            text = text.split("### Audio Transcript:\n")[-1]
+                except TypeError:
+                    from ...tools.files import get_tempfile
+                    copyfile = get_tempfile(file, filename)
+                    try:
+                        result = md.convert(
+                            copyfile, 
+                            llm_client=llm_client,
+                            llm_model=model
+                        )
+                        if asyncio.iscoroutine(result.text_content):
+                            text = await result.text_content
+                        else:
+                            text = result.text_content
+                    finally:
+                        os.remove(copyfile)
+                text = text.split("### Audio Transcript:\n")[-1]
+                texts.append(text)
+        for text in texts:
             if text:
-                yield text
\ No newline at end of file
+                yield text
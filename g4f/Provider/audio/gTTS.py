@@ -11,6 +11,7 @@ except ImportError:
 from ...typing import AsyncResult, Messages
 from ...providers.response import AudioResponse
 from ...image.copy_images import get_filename, get_media_dir, ensure_media_dir
+from ...image.media_store import media_store
 from ..base_provider import AsyncGeneratorProvider, ProviderModelMixin
 from ..helper import get_last_message
 
@@ -77,5 +78,6 @@ class gTTS(AsyncGeneratorProvider, ProviderModelMixin):
                 **models.get(model, {})
             }
         ).save(target_path)
+        await media_store.add_async(target_path, tags=[cls.model_id, prompt])
 
         yield AudioResponse(f"/media/{filename}", audio=audio, text=prompt)
\ No newline at end of file
@@ -25,6 +25,7 @@ from ...requests.raise_for_status import raise_for_status
 from ...requests.aiohttp import get_connector
 from ...requests import get_nodriver
 from ...image.copy_images import get_filename, get_media_dir, ensure_media_dir
+from ...image.media_store import media_store
 from ...errors import MissingAuthError, ModelNotFoundError
 from ...image import to_bytes
 from ...cookies import get_cookies_dir
@@ -197,6 +198,7 @@ class Gemini(AsyncGeneratorProvider, ProviderModelMixin):
             with open(path, "wb") as f:
                 async for chunk in cls.synthesize({"text": prompt}, proxy):
                     f.write(chunk)
+            await media_store.add_async(path, tags=["gemini", prompt])
             yield AudioResponse(f"/media/{filename}", text=prompt)
             return
         cls._cookies = cookies or cls._cookies or get_cookies(GOOGLE_COOKIE_DOMAIN, False, True)
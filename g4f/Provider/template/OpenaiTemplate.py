@@ -5,7 +5,7 @@ import requests
 from ..helper import filter_none, format_media_prompt
 from ..base_provider import AsyncGeneratorProvider, ProviderModelMixin, RaiseErrorMixin
 from ...typing import Union, AsyncResult, Messages, MediaListType
-from ...requests import StreamSession, StreamResponse, raise_for_status, see_stream
+from ...requests import StreamSession, SharedSession, StreamResponse, raise_for_status, see_stream
 from ...image import use_aspect_ratio
 from ...image.copy_images import save_response_media
 from ...providers.response import FinishReason, ToolCalls, Usage, ImageResponse, ProviderInfo, AudioResponse, Reasoning
@@ -23,6 +23,8 @@ class OpenaiTemplate(AsyncGeneratorProvider, ProviderModelMixin, RaiseErrorMixin
     fallback_models = []
     sort_models = True
     ssl = None
+    # Reuse a keep-alive session per host, it stores no cookies and sends the headers per request
+    use_shared_session = True
 
     @classmethod
     def get_models(cls, api_key: str = None, api_base: str = None) -> list[str]:
@@ -78,12 +80,14 @@ class OpenaiTemplate(AsyncGeneratorProvider, ProviderModelMixin, RaiseErrorMixin
             api_key = cls.api_key
         if cls.needs_auth and api_key is None:
             raise MissingAuthError('Add a "api_key"')
-        async with StreamSession(
+        session_args = dict(
             proxy=proxy,
             headers=cls.get_headers(stream, api_key, headers),
             timeout=timeout,
             impersonate=impersonate,
-        ) as session:
+        )
+        base_url = cls.api_base if api_base is None else api_base
+        async with (SharedSession(api_endpoint or cls.api_endpoint or base_url, **session_args) if cls.use_shared_session else StreamSession(**session_args)) as session:
             model = cls.get_model(model, api_key=api_key, api_base=api_base)
             if api_base is None:
                 api_base = cls.api_base
@@ -5,12 +5,10 @@ import json
 import uvicorn
 import secrets
 import os
-import re
 import shutil
 import time
 from email.utils import formatdate
 import os.path
-import hashlib
 import asyncio
 import base64
 from contextlib import asynccontextmanager
@@ -39,12 +37,6 @@ try:
     has_a2wsgi = True
 except ImportError:
     has_a2wsgi = False
-try:
-    from PIL import Image 
-    has_pillow = True
-except ImportError:
-    has_pillow = False
-from types import SimpleNamespace
 from typing import Union, Optional, List
 
 try:
@@ -63,15 +55,20 @@ import g4f.debug
 from g4f.client import AsyncClient, ChatCompletion, ImagesResponse, ClientResponse
 from g4f.providers.response import BaseConversation, JsonConversation
 from g4f.client.helper import filter_none
-from g4f.image import EXTENSIONS_MAP, is_data_an_media, process_image
+from g4f.image import EXTENSIONS_MAP, is_data_an_media
 from g4f.image.copy_images import get_media_dir, copy_media, get_source_url
+from g4f.image.media_store import media_store
+from g4f.image.derivatives import media_derivatives
 from g4f.errors import ProviderNotFoundError, ModelNotFoundError, MissingAuthError, NoValidHarFileError, MissingRequirementsError
 from g4f.cookies import read_cookie_files, get_cookies_dir
 from g4f.providers.types import ProviderType
 from g4f.providers.response import AudioResponse
 from g4f.providers.any_provider import AnyProvider
+from g4f.providers.circuit_breaker import default_breaker
+from g4f.tools.tokenizer import preload_encoder
 from g4f import Provider
 from g4f.gui import get_gui_app
+from .media import MediaResponse, get_etag
 from .stubs import (
     ChatCompletionsConfig, ImageGenerationConfig,
     ProviderResponseModel, ModelResponseModel,
@@ -98,6 +95,8 @@ async def lifespan(app: FastAPI):
     # Read cookie files if not ignored
     if not AppConfig.ignore_cookie_files:
         read_cookie_files()
+    # Usage is estimated until the vocabulary is loaded
+    preload_encoder()
     yield
     if has_nodriver:
         for browser in util.get_registered_instances():
@@ -140,6 +139,9 @@ def create_app():
             if provider in Provider.__map__:
                 Provider.__map__[provider].working = False
 
+    if AppConfig.persist_health:
+        default_breaker.persist = True
+
     return app
 
 def create_app_debug():
@@ -184,6 +186,7 @@ class AppConfig:
     gui: bool = False
     demo: bool = False
     timeout: int = DEFAULT_TIMEOUT
+    persist_health: bool = False
 
     @classmethod
     def set_config(cls, **data):
@@ -712,7 +715,7 @@ class Api:
                     response = response.replace("/media", get_media_dir())
                     def delete_file():
                         try:
-                            os.remove(response)
+                            media_store.remove(response)
                         except Exception as e:
                             logger.exception(e)
                     return FileResponse(response, background=BackgroundTask(delete_file))
@@ -761,52 +764,13 @@ class Api:
             HTTP_404_NOT_FOUND: {}
         })
         async def get_media(filename, request: Request, thumbnail: bool = False):
-            def get_timestamp(str):
-                m=re.match("^[0-9]+", str)
-                if m:
-                    return int(m.group(0))
-                else:
-                    return 0
             target = os.path.join(get_media_dir(), os.path.basename(filename))
-            if thumbnail and has_pillow:
-                thumbnail_dir = os.path.join(get_media_dir(), "thumbnails")
-                thumbnail = os.path.join(thumbnail_dir, filename)
             if not os.path.isfile(target):
                 other_name = os.path.join(get_media_dir(), os.path.basename(quote_plus(filename)))
                 if os.path.isfile(other_name):
                     target = other_name
             ext = os.path.splitext(filename)[1][1:]
             mime_type = EXTENSIONS_MAP.get(ext)
-            stat_result = SimpleNamespace()
-            stat_result.st_size = 0
-            stat_result.st_mtime = get_timestamp(filename)
-            if thumbnail and has_pillow and os.path.isfile(thumbnail):
-                stat_result.st_size = os.stat(thumbnail).st_size
-            elif not thumbnail and os.path.isfile(target):
-                stat_result.st_size = os.stat(target).st_size
-            headers = {
-                "cache-control": "public, max-age=31536000",
-                "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
-                "etag": f'"{hashlib.md5(filename.encode()).hexdigest()}"',
-                **({
-                    "content-length": str(stat_result.st_size),
-                } if stat_result.st_size else {}),
-                **({} if thumbnail or mime_type is None else {
-                    "content-type": mime_type,
-                })
-            }
-            response = FileResponse(
-                target,
-                headers=headers,
-                filename=filename,
-            )
-            try:
-                if_none_match = request.headers["if-none-match"]
-                etag = response.headers["etag"]
-                if etag in [tag.strip(" W/") for tag in if_none_match.split(",")]:
-                    return NotModifiedResponse(response.headers)
-            except KeyError:
-                pass
             if not os.path.isfile(target) and mime_type is not None:
                 source_url = get_source_url(str(request.query_params))
                 ssl = None
@@ -825,29 +789,28 @@ class Api:
                         debug.error(f"Download failed:  {source_url}")
                         debug.error(e)
                         return RedirectResponse(url=source_url)
-            if thumbnail and has_pillow:
-                try:
-                    if not os.path.isfile(thumbnail):
-                        image = Image.open(target)
-                        os.makedirs(thumbnail_dir, exist_ok=True)
-                        process_image(image, save=thumbnail)
-                        debug.log(f"Thumbnail created: {thumbnail}")
-                except Exception as e:
-                    logger.exception(e)
-            if thumbnail and os.path.isfile(thumbnail):
-                result = thumbnail
-            else:
-                result = target
+            result = target
+            if thumbnail and os.path.isfile(target) and await media_derivatives.wait(target) is not None:
+                result = os.path.join(media_derivatives.get_thumbnail_dir(), os.path.basename(target))
             if not os.path.isfile(result):
                 return ErrorResponse.from_message("File not found", HTTP_404_NOT_FOUND)
-            async def stream():
-                with open(result, "rb") as file:
-                    while True:
-                        chunk = file.read(65536)
-                        if not chunk:
-                            break
-                        yield chunk
-            return StreamingResponse(stream(), headers=headers)
+            stat_result = os.stat(result)
+            headers = {
+                "cache-control": "public, max-age=31536000",
+                "etag": get_etag(stat_result),
+                "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            }
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and headers["etag"] in [tag.strip(" W/") for tag in if_none_match.split(",")]:
+                return NotModifiedResponse(headers)
+            return MediaResponse(
+                result,
+                stat_result,
+                headers=headers,
+                media_type=None if thumbnail else mime_type,
+                range=request.headers.get("range"),
+                if_range=request.headers.get("if-range"),
+            )
 
         @self.app.get("/thumbnail/{filename}", responses={
             HTTP_200_OK: {"content": {"image/*": {}, "audio/*": {}}, "video/*": {}},
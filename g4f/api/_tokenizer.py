@@ -1,9 +1,9 @@
-# import tiktoken
-# from typing import Union
+from __future__ import annotations
 
-# def tokenize(text: str, model: str = 'gpt-3.5-turbo') -> Union[int, str]:
-#     encoding   = tiktoken.encoding_for_model(model)
-#     encoded    = encoding.encode(text)
-#     num_tokens = len(encoded)
-    
-#     return num_tokens, encoded
\ No newline at end of file
+from typing import Optional
+
+from ..tools.tokenizer import count_tokens, count_message_tokens, get_encoder
+
+def tokenize(text: str, model: Optional[str] = "gpt-3.5-turbo") -> int:
+    """Return the number of tokens of a text for a model."""
+    return count_tokens(text, model)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import re
+import secrets
+from email.utils import formatdate
+from typing import List, Optional, Tuple
+
+import anyio
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+CHUNK_SIZE = 256 * 1024
+MAX_RANGES = 16
+RANGE_REGEX = re.compile(r"^\s*bytes\s*=(.+)$", re.IGNORECASE)
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+def get_etag(stat_result: os.stat_result) -> str:
+    """Return an ETag based on the size and modification time of a file."""
+    return f'"{stat_result.st_size:x}-{int(stat_result.st_mtime * 1000000):x}"'
+
+def parse_range(value: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse a Range header into sorted and merged (start, end) byte positions, end exclusive.
+
+    Returns None if the header is invalid and the whole file should be sent.
+    Raises RangeNotSatisfiable if no range overlaps the file.
+    """
+    match = RANGE_REGEX.match(value)
+    if match is None:
+        return None
+    ranges = []
+    for part in match.group(1).split(","):
+        start, sep, end = part.strip().partition("-")
+        if not sep or not (start or end):
+            return None
+        try:
+            if not start:
+                # Suffix range: the last bytes of the file
+                length = int(end)
+                if length <= 0:
+                    continue
+                start, end = max(0, size - length), size
+            else:
+                start = int(start)
+                end = int(end) + 1 if end else size
+                if start < 0 or (end <= start and start < size):
+                    return None
+                end = min(end, size)
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, end))
+    if not ranges:
+        raise RangeNotSatisfiable(f"bytes */{size}")
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    if len(merged) > MAX_RANGES:
+        return None
+    return merged
+
+class MediaResponse(Response):
+    """
+    File response with support for single and multiple byte ranges.
+
+    The file is sent with the "http.response.zerocopysend" or "http.response.pathsend"
+    server extension when available, otherwise it is read in a worker thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        stat_result: os.stat_result = None,
+        headers: dict = None,
+        media_type: str = None,
+        range: str = None,
+        if_range: str = None
+    ) -> None:
+        self.path = path
+        self.stat_result = os.stat(path) if stat_result is None else stat_result
+        self.background = None
+        size = self.stat_result.st_size
+        etag = get_etag(self.stat_result)
+        last_modified = formatdate(self.stat_result.st_mtime, usegmt=True)
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": etag,
+            "last-modified": last_modified,
+            **({} if headers is None else headers),
+        }
+        # Parts to send: (prefix, start, end)
+        self.parts: List[Tuple[bytes, int, int]] = [(b"", 0, size)]
+        self.epilogue = b""
+        self.status_code = 200
+        ranges = None
+        if range is not None and (not if_range or if_range.strip() in (etag, last_modified)):
+            try:
+                ranges = parse_range(range, size)
+            except RangeNotSatisfiable as e:
+                self.status_code = 416
+                self.parts = []
+                media_type = None
+                headers.pop("content-type", None)
+                headers["content-range"] = str(e)
+                headers["content-length"] = "0"
+        if ranges is None:
+            if self.status_code == 200:
+                headers["content-length"] = str(size)
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.status_code = 206
+            self.parts = [(b"", start, end)]
+            headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+            headers["content-length"] = str(end - start)
+        else:
+            self.status_code = 206
+            boundary = secrets.token_hex(16)
+            content_type = headers.pop("content-type", media_type) or "application/octet-stream"
+            media_type = f"multipart/byteranges; boundary={boundary}"
+            self.parts = [(
+                f"\r\n--{boundary}\r\ncontent-type: {content_type}\r\ncontent-range: bytes {start}-{end - 1}/{size}\r\n\r\n".encode(),
+                start,
+                end
+            ) for start, end in ranges]
+            self.epilogue = f"\r\n--{boundary}--\r\n".encode()
+            headers["content-length"] = str(sum(len(prefix) + end - start for prefix, start, end in self.parts) + len(self.epilogue))
+        self.media_type = media_type
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope.get("method") == "HEAD" or not self.parts:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        extensions = scope.get("extensions") or {}
+        if self.status_code == 200 and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+        if "http.response.zerocopysend" in extensions:
+            file = await anyio.to_thread.run_sync(open, self.path, "rb")
+            try:
+                for prefix, start, end in self.parts:
+                    if prefix:
+                        await send({"type": "http.response.body", "body": prefix, "more_body": True})
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": file,
+                        "offset": start,
+                        "count": end - start,
+                        "more_body": True,
+                    })
+            finally:
+                await anyio.to_thread.run_sync(file.close)
+        else:
+            async with await anyio.open_file(self.path, "rb") as file:
+                for prefix, start, end in self.parts:
+                    if prefix:
+                        await send({"type": "http.response.body", "body": prefix, "more_body": True})
+                    await file.seek(start)
+                    remaining = end - start
+                    while remaining > 0:
+                        chunk = await file.read(min(CHUNK_SIZE, remaining))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": self.epilogue, "more_body": False})
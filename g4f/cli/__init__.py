@@ -15,22 +15,23 @@ def get_api_parser():
     api_parser.add_argument("--debug", "-d", action="store_true", help="Enable verbose logging.")
     api_parser.add_argument("--gui", "-g", default=None, action="store_true", help="Start also the gui.")
     api_parser.add_argument("--model", default=None, help="Default model for chat completion. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--provider", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working],
+    api_parser.add_argument("--provider", choices=Provider.__map__.get_names(working=True),
                             default=None, help="Default provider for chat completion. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--media-provider", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working and bool(getattr(provider, "image_models", False))],
+    api_parser.add_argument("--media-provider", choices=Provider.__map__.get_names(working=True, image=True),
                             default=None, help="Default provider for image generation. (incompatible with --reload and --workers)"),
     api_parser.add_argument("--proxy", default=None, help="Default used proxy. (incompatible with --reload and --workers)")
     api_parser.add_argument("--workers", type=int, default=None, help="Number of workers.")
     api_parser.add_argument("--disable-colors", action="store_true", help="Don't use colors.")
     api_parser.add_argument("--ignore-cookie-files", action="store_true", help="Don't read .har and cookie files. (incompatible with --reload and --workers)")
     api_parser.add_argument("--g4f-api-key", type=str, default=None, help="Sets an authentication key for your API. (incompatible with --reload and --workers)")
-    api_parser.add_argument("--ignored-providers", nargs="+", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working],
+    api_parser.add_argument("--ignored-providers", nargs="+", choices=Provider.__map__.get_names(working=True),
                             default=[], help="List of providers to ignore when processing request. (incompatible with --reload and --workers)")
     api_parser.add_argument("--cookie-browsers", nargs="+", choices=[browser.__name__ for browser in g4f.cookies.browsers],
                             default=[], help="List of browsers to access or retrieve cookies from. (incompatible with --reload and --workers)")
     api_parser.add_argument("--reload", action="store_true", help="Enable reloading.")
     api_parser.add_argument("--demo", action="store_true", help="Enable demo mode.")
     api_parser.add_argument("--timeout", type=int, default=600, help="Default timeout for requests in seconds. (incompatible with --reload and --workers)")
+    api_parser.add_argument("--persist-health", action="store_true", help="Save the circuit breaker state of the providers in the cookies dir.")
     api_parser.add_argument("--ssl-keyfile", type=str, default=None, help="Path to SSL key file for HTTPS.")
     api_parser.add_argument("--ssl-certfile", type=str, default=None, help="Path to SSL certificate file for HTTPS.")
     api_parser.add_argument("--log-config", type=str, default=None, help="Custom log config.")
@@ -51,6 +52,7 @@ def run_api_args(args):
         gui=args.gui,
         demo=args.demo,
         timeout=args.timeout,
+        persist_health=args.persist_health,
     )
     if args.cookie_browsers:
         g4f.cookies.browsers = [g4f.cookies[browser] for browser in args.cookie_browsers]
@@ -16,7 +16,7 @@ from g4f.Provider import ProviderUtils
 from g4f.image import extract_data_uri, is_accepted_format
 from g4f.image.copy_images import get_media_dir
 from g4f.client.helper import filter_markdown
-from g4f.integration.markitdown import MarkItDown
+from g4f.integration.markitdown import markitdown_pool
 from g4f.config import CONFIG_DIR, COOKIES_DIR
 from g4f import debug
 
@@ -187,7 +187,7 @@ def get_parser():
     parser.add_argument(
         '-p', '--provider',
         default=None,
-        help=f"Provider to use. Available: {', '.join([key for key, provider in ProviderUtils.convert.items() if provider.working])}."
+        help=f"Provider to use. Available: {', '.join(ProviderUtils.convert.get_names(working=True))}."
     )
     parser.add_argument(
         '-m', '--model',
@@ -283,8 +283,8 @@ def run_client_args(args):
                 media.append(input_value)
             else:
                 try:
-                    md = MarkItDown()
-                    text_content = md.convert_url(input_value).text_content
+                    with markitdown_pool.acquire() as md:
+                        text_content = md.convert_url(input_value).text_content
                     input_text += f"\n```\n{text_content}\n\nSource: {input_value}\n```\n"
                 except Exception as e:
                     print(f"Error processing URL {input_value}: {type(e).__name__}: {e}", file=sys.stderr)
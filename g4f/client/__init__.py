@@ -19,11 +19,12 @@ from ..providers.asyncio import to_sync_generator
 from ..providers.any_provider import AnyProvider
 from ..Provider import OpenaiAccount, PollinationsImage
 from ..tools.run_tools import async_iter_run_tools, iter_run_tools
+from ..tools.tokenizer import TokenCounter, count_message_tokens
 from .stubs import ChatCompletion, ChatCompletionChunk, Image, ImagesResponse, UsageModel, ToolCallModel, ClientResponse
 from .models import ClientModels
 from .types import IterResponse, Client as BaseClient
 from .service import convert_to_provider
-from .helper import find_stop, filter_json, filter_none, safe_aclose
+from .helper import ContentAccumulator, StopMatcher, filter_json, filter_none, safe_aclose
 from .. import debug
 
 ChatCompletionResponseType = Iterator[Union[ChatCompletion, ChatCompletionChunk, BaseConversation]]
@@ -38,13 +39,6 @@ except NameError:
         except StopAsyncIteration:
             raise StopIteration
 
-def add_chunk(content, chunk):
-    if content == "" and isinstance(chunk, (MediaResponse, AudioResponse)):
-        content = chunk
-    elif not isinstance(chunk, (Reasoning, ToolCalls)):
-        content = str(content) + str(chunk)
-    return content
-
 def resolve_media(kwargs: dict, image = None, image_name: str = None) -> None:
     if image is not None:
         kwargs["media"] = [(image, getattr(image, "name", image_name))]
@@ -58,15 +52,30 @@ def resolve_media(kwargs: dict, image = None, image_name: str = None) -> None:
         if not isinstance(media, (list, tuple)):
             kwargs["media"][idx] = (media, getattr(media, "name", None))
 
+def create_usage(usage: Optional[Usage], messages: Optional[Messages], model: Optional[str], token_counter: TokenCounter) -> UsageModel:
+    """Use the usage of the provider, missing token counts are counted with the tokenizer."""
+    usage = {} if usage is None else usage.get_dict()
+    if "prompt_tokens" not in usage:
+        usage["prompt_tokens"] = count_message_tokens(messages, model) if messages else 0
+    if "completion_tokens" not in usage:
+        usage["completion_tokens"] = token_counter.total
+    if "total_tokens" not in usage:
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+    return UsageModel.model_construct(**usage)
+
 # Synchronous iter_response function
 def iter_response(
     response: Union[Iterator[Union[str, ResponseType]]],
     stream: bool,
     response_format: Optional[dict] = None,
     max_tokens: Optional[int] = None,
-    stop: Optional[list[str]] = None
+    stop: Optional[list[str]] = None,
+    messages: Optional[Messages] = None,
+    model: Optional[str] = None
 ) -> ChatCompletionResponseType:
-    content = ""
+    content = ContentAccumulator()
+    stop_matcher = None if stop is None else StopMatcher(stop)
+    token_counter = TokenCounter(model)
     reasoning_content = []
     finish_reason = None
     tool_calls = None
@@ -74,7 +83,6 @@ def iter_response(
     provider: ProviderInfo = None
     conversation: JsonConversation = None
     completion_id = ''.join(random.choices(string.ascii_letters + string.digits, k=28))
-    idx = 0
 
     if hasattr(response, '__aiter__'):
         response = to_sync_generator(response)
@@ -105,15 +113,19 @@ def iter_response(
         elif not chunk:
             continue
 
-        content = add_chunk(content, chunk)
-        idx += 1
+        text = content.add(chunk)
+        if text is not None:
+            token_counter.add(text)
+        elif isinstance(chunk, Reasoning) and chunk.token:
+            token_counter.add(chunk.token)
 
-        if max_tokens is not None and idx >= max_tokens:
+        if max_tokens is not None and token_counter.count >= max_tokens:
             finish_reason = "length"
 
-        first, content, chunk = find_stop(stop, content, chunk if stream else None)
-
-        if first != -1:
+        first = None if text is None or stop_matcher is None else stop_matcher.feed(text)
+        if first is not None:
+            content.truncate(content.size - len(text) + first)
+            chunk = text[:max(0, first)]
             finish_reason = "stop"
 
         if stream:
@@ -126,10 +138,7 @@ def iter_response(
         if finish_reason is not None:
             break
 
-    if usage is None:
-        usage = UsageModel.model_construct(completion_tokens=idx, total_tokens=idx)
-    else:
-        usage = UsageModel.model_construct(**usage.get_dict())
+    usage = create_usage(usage, messages, model, token_counter)
 
     finish_reason = "stop" if finish_reason is None else finish_reason
 
@@ -138,6 +147,7 @@ def iter_response(
             None, finish_reason, completion_id, int(time.time()), usage=usage
         )
     else:
+        content = content.get()
         if response_format is not None and "type" in response_format:
             if response_format["type"] == "json_object":
                 content = filter_json(content)
@@ -169,13 +179,16 @@ async def async_iter_response(
     stream: bool,
     response_format: Optional[dict] = None,
     max_tokens: Optional[int] = None,
-    stop: Optional[list[str]] = None
+    stop: Optional[list[str]] = None,
+    messages: Optional[Messages] = None,
+    model: Optional[str] = None
 ) -> AsyncChatCompletionResponseType:
-    content = ""
+    content = ContentAccumulator()
+    stop_matcher = None if stop is None else StopMatcher(stop)
+    token_counter = TokenCounter(model)
     reasoning_content = []
     finish_reason = None
     completion_id = ''.join(random.choices(string.ascii_letters + string.digits, k=28))
-    idx = 0
     tool_calls = None
     usage = None
     provider: ProviderInfo = None
@@ -208,15 +221,19 @@ async def async_iter_response(
             elif not chunk:
                 continue
 
-            content = add_chunk(content, chunk)
-            idx += 1
+            text = content.add(chunk)
+            if text is not None:
+                token_counter.add(text)
+            elif isinstance(chunk, Reasoning) and chunk.token:
+                token_counter.add(chunk.token)
 
-            if max_tokens is not None and idx >= max_tokens:
+            if max_tokens is not None and token_counter.count >= max_tokens:
                 finish_reason = "length"
 
-            first, content, chunk = find_stop(stop, content, chunk if stream else None)
-
-            if first != -1:
+            first = None if text is None or stop_matcher is None else stop_matcher.feed(text)
+            if first is not None:
+                content.truncate(content.size - len(text) + first)
+                chunk = text[:max(0, first)]
                 finish_reason = "stop"
 
             if stream:
@@ -231,16 +248,14 @@ async def async_iter_response(
 
         finish_reason = "stop" if finish_reason is None else finish_reason
 
-        if usage is None:
-            usage = UsageModel.model_construct(completion_tokens=idx, total_tokens=idx)
-        else:
-            usage = UsageModel.model_construct(**usage.get_dict())
+        usage = create_usage(usage, messages, model, token_counter)
 
         if stream:
             chat_completion = ChatCompletionChunk.model_construct(
                 None, finish_reason, completion_id, int(time.time()), usage=usage, conversation=conversation
             )
         else:
+            content = content.get()
             if response_format is not None and "type" in response_format:
                 if response_format["type"] == "json_object":
                     content = filter_json(content)
@@ -260,11 +275,13 @@ async def async_iter_response(
         await safe_aclose(response)
 
 async def async_response(
-    response: AsyncIterator[Union[str, ResponseType]]
+    response: AsyncIterator[Union[str, ResponseType]],
+    messages: Optional[Messages] = None,
+    model: Optional[str] = None
 ) -> ClientResponse:
-    content = ""
+    content = ContentAccumulator()
+    token_counter = TokenCounter(model)
     response_id = ''.join(random.choices(string.ascii_letters + string.digits, k=28))
-    idx = 0
     usage = None
     provider: ProviderInfo = None
     conversation: JsonConversation = None
@@ -288,18 +305,14 @@ async def async_response(
         elif isinstance(chunk, Exception):
             continue
 
-        content = add_chunk(content, chunk)
-        if not content:
-            continue
-        idx += 1
+        text = content.add(chunk)
+        if text:
+            token_counter.add(text)
 
-    if usage is None:
-        usage = UsageModel.model_construct(completion_tokens=idx, total_tokens=idx)
-    else:
-        usage = UsageModel.model_construct(**usage.get_dict())
+    usage = create_usage(usage, messages, model, token_counter)
 
     response = ClientResponse.model_construct(
-        content, response_id, int(time.time()), usage=usage, conversation=conversation
+        content.get(), response_id, int(time.time()), usage=usage, conversation=conversation
     )
     if provider is not None:
         response.provider = provider.name
@@ -390,7 +403,7 @@ class Completions:
             **kwargs
         )
 
-        response = iter_response(response, stream, response_format, max_tokens, stop)
+        response = iter_response(response, stream, response_format, max_tokens, stop, messages, model)
         response = iter_append_model_and_provider(response, model, provider)
         if stream:
             return response
@@ -711,7 +724,7 @@ class AsyncCompletions:
             **kwargs
         )
 
-        response = async_iter_response(response, stream, response_format, max_tokens, stop)
+        response = async_iter_response(response, stream, response_format, max_tokens, stop, messages, model)
         response = async_iter_append_model_and_provider(response, model, provider)
 
         if stream:
@@ -800,4 +813,4 @@ class AsyncResponses():
             **kwargs
         )
 
-        return await async_response(response)
\ No newline at end of file
+        return await async_response(response, input, model)
\ No newline at end of file
@@ -5,6 +5,8 @@ import logging
 
 from typing import AsyncIterator, Iterator, AsyncGenerator, Optional
 
+from ..providers.response import MediaResponse, AudioResponse, Reasoning, ToolCalls
+
 def filter_markdown(text: str, allowed_types=None, default=None) -> str:
     """
     Parses code block from a string.
@@ -51,6 +53,75 @@ def find_stop(stop: Optional[list[str]], content: str, chunk: str = None):
                 first = 0
     return first, content, chunk
 
+class ContentAccumulator:
+    """
+    Collects the content of a streamed response in a list of parts,
+    so adding a chunk does not copy the content received so far.
+    A single media or audio response is kept as the content object.
+    """
+
+    def __init__(self) -> None:
+        self.parts: list = []
+        self.size = 0
+
+    def add(self, chunk) -> Optional[str]:
+        """Add a chunk to the content. Returns its text, or None if it is not part of the content."""
+        if isinstance(chunk, (Reasoning, ToolCalls)):
+            return None
+        text = str(chunk)
+        if self.parts or isinstance(chunk, (MediaResponse, AudioResponse)):
+            self.parts.append(chunk)
+        else:
+            self.parts.append(text)
+        self.size += len(text)
+        return text
+
+    def truncate(self, size: int) -> None:
+        """Cut the content after ``size`` characters."""
+        self.parts = [self.get_text()[:size]]
+        self.size = len(self.parts[0])
+
+    def get_text(self) -> str:
+        return "".join(str(part) for part in self.parts)
+
+    def get(self):
+        """Return the content, a media object or a string."""
+        if len(self.parts) == 1 and isinstance(self.parts[0], (MediaResponse, AudioResponse)):
+            return self.parts[0]
+        return self.get_text()
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+class StopMatcher:
+    """
+    Finds stop words in a stream of chunks.
+
+    Only the new chunk and the last ``max(len(word)) - 1`` characters before it are
+    searched, so every chunk is scanned once and stop words split over chunks are found.
+    """
+
+    def __init__(self, stop: list[str]) -> None:
+        self.words = [word for word in dict.fromkeys(stop) if word]
+        self.window = max((len(word) for word in self.words), default=1) - 1
+        self.tail = ""
+
+    def feed(self, text: str) -> Optional[int]:
+        """
+        Search the next chunk. Returns the position of the first stop word relative
+        to the start of ``text``, negative if it starts in a previous chunk, or None.
+        """
+        buffer = self.tail + text
+        first = -1
+        for word in self.words:
+            index = buffer.find(word)
+            if index != -1 and (first == -1 or index < first):
+                first = index
+        if first != -1:
+            return first - len(self.tail)
+        self.tail = buffer[-self.window:] if self.window else ""
+        return None
+
 def filter_none(**kwargs) -> dict:
     return {
         key: value
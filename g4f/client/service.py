@@ -50,7 +50,7 @@ def get_model_and_provider(model    : Union[Model, str],
     """
     if debug.version_check:
         debug.version_check = False
-        version.utils.check_version()
+        version.version_check.start()
 
     if isinstance(provider, str):
         provider = convert_to_provider(provider)
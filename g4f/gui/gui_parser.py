@@ -9,7 +9,7 @@ def gui_parser():
     parser.add_argument("--port", "-p", type=int, default=8080, help="port")
     parser.add_argument("--debug", "-d", "-debug", action="store_true", help="debug mode")
     parser.add_argument("--ignore-cookie-files", action="store_true", help="Don't read .har and cookie files.")
-    parser.add_argument("--ignored-providers", nargs="+", choices=[provider.__name__ for provider in Provider.__providers__ if provider.working],
+    parser.add_argument("--ignored-providers", nargs="+", choices=Provider.__map__.get_names(working=True),
                             default=[], help="List of providers to ignore when processing request. (incompatible with --reload and --workers)")
     parser.add_argument("--cookie-browsers", nargs="+", choices=[browser.__name__ for browser in browsers],
                             default=[], help="List of browsers to access or retrieve cookies from.")
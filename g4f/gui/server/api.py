@@ -4,17 +4,12 @@ import logging
 import os
 import asyncio
 from typing import Iterator
-from flask import send_from_directory, request
+from flask import send_from_directory
 from inspect import signature
 
-try:
-    from PIL import Image 
-    has_pillow = True
-except ImportError:
-    has_pillow = False
-
 from ...errors import VersionNotFoundError, MissingAuthError
 from ...image.copy_images import copy_media, ensure_media_dir, get_media_dir
+from ...image.derivatives import media_derivatives, WAIT_TIMEOUT
 from ...image import get_width_height
 from ...tools.run_tools import iter_run_tools
 from ... import Provider
@@ -108,18 +103,12 @@ class Api:
     @staticmethod
     def get_version() -> dict:
         current_version = None
-        latest_version = None
         try:
             current_version = version.utils.current_version
-            try:
-                if request.args.get("cache"):
-                    latest_version = version.utils.latest_version_cached
-            except RuntimeError:
-                pass
-            if latest_version is None:
-                latest_version = version.utils.latest_version
         except VersionNotFoundError:
             pass
+        # Read from the saved version check, PyPI or GitHub are asked in the background
+        latest_version = version.version_check.get_latest_version()
         return {
             "version": current_version,
             "latest_version": latest_version,
@@ -220,13 +209,9 @@ class Api:
                         options = {}
                         target_paths, urls = get_target_paths_and_urls(media)
                         if target_paths:
-                            if has_pillow:
-                                try:
-                                    with Image.open(target_paths[0]) as img:
-                                        width, height = img.size
-                                        options = {"width": width, "height": height}
-                                except Exception as e:
-                                    logger.exception(e)
+                            metadata = media_derivatives.wait_sync(target_paths[0], WAIT_TIMEOUT)
+                            if metadata is not None:
+                                options = {"width": metadata["width"], "height": metadata["height"]}
                             options["target_paths"] = target_paths
                         media = ImageResponse(urls, chunk.alt, options) if isinstance(chunk, ImageResponse) else VideoResponse(media, chunk.alt)
                     yield self._format_json("content", str(media), urls=media.urls, alt=media.alt)
@@ -18,16 +18,6 @@ from pathlib import Path
 from urllib.parse import quote_plus
 from hashlib import sha256
 
-try:
-    from PIL import Image 
-    has_pillow = True
-except ImportError:
-    has_pillow = False
-try:
-    from ...integration.markitdown import MarkItDown, StreamInfo
-    has_markitdown = True
-except ImportError as e:
-    has_markitdown = False
 try:
     from .crypto import rsa, serialization, create_or_read_keys, decrypt_data, encrypt_data, get_session_key
     has_crypto = True
@@ -38,18 +28,27 @@ from ...client.service import convert_to_provider
 from ...providers.asyncio import to_sync_generator
 from ...providers.response import FinishReason, AudioResponse, MediaResponse, Reasoning, HiddenResponse
 from ...client.helper import filter_markdown
-from ...tools.files import supports_filename, get_streaming, get_bucket_dir, get_tempfile
+from ...tools.files import get_streaming, get_bucket_dir, get_tempfile
+from ...tools.uploads import upload_queue, save_upload, iter_multipart_uploads, has_multipart_decoder, UploadJob
+from ...tools.bucket_reader import read_bucket_range
 from ...tools.run_tools import iter_run_tools
+from ...tools.usage import usage_recorder, GROUPS as USAGE_GROUPS
+from ...tools.search_cache import search_cache, page_cache
 from ...errors import ProviderNotFoundError
-from ...image import is_allowed_extension, process_image, MEDIA_TYPE_MAP
+from ...image import is_allowed_extension, MEDIA_TYPE_MAP
 from ...cookies import get_cookies_dir
 from ...image.copy_images import secure_filename, get_source_url, get_media_dir, copy_media
+from ...image.media_store import media_store
 from ...client.service import get_model_and_provider
 from ... import models
 from .api import Api
 
 logger = logging.getLogger(__name__)
 
+BUCKET_PAGE_SIZE = 64 * 1024
+MAX_BUCKET_PAGE_SIZE = 1024 * 1024
+MAX_BUCKET_PAGE_LINES = 10000
+
 def safe_iter_generator(generator: Generator) -> Generator:
     start = next(generator)
     def iter_generator():
@@ -57,6 +56,18 @@ def safe_iter_generator(generator: Generator) -> Generator:
         yield from generator
     return iter_generator()
 
+def iter_uploads(bucket_dir: str) -> Generator:
+    """Save the uploaded files of the request to the bucket dir. Yields the filename, mime type, path, digest and size."""
+    boundary = request.mimetype_params.get("boundary")
+    if has_multipart_decoder and request.mimetype == "multipart/form-data" and boundary:
+        # request.files would buffer the whole body before it is copied into the bucket
+        yield from iter_multipart_uploads(request.stream, boundary, bucket_dir)
+        return
+    for file in request.files.getlist('files'):
+        path, digest, size = save_upload(file.stream, bucket_dir, os.path.splitext(file.filename or "")[1].lower())
+        file.close()
+        yield file.filename or "", file.mimetype, path, digest, size
+
 class Backend_Api(Api):    
     """
     Handles various endpoints in a Flask application for backend operations.
@@ -205,18 +216,27 @@ class Backend_Api(Api):
 
         @app.route('/backend-api/v2/usage', methods=['POST'])
         def add_usage():
-            cache_dir = Path(get_cookies_dir()) / ".usage"
-            cache_file = cache_dir / f"{datetime.date.today()}.jsonl"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            with cache_file.open("a" if cache_file.exists() else "w") as f:
-                f.write(f"{json.dumps(request.json)}\n")
+            usage_recorder.record(request.json)
             return {}
     
         @app.route('/backend-api/v2/usage/<date>', methods=['GET'])
         def get_usage(date: str):
-            cache_dir = Path(get_cookies_dir()) / ".usage"
-            cache_file = cache_dir / f"{date}.jsonl"
-            return cache_file.read_text() if cache_file.exists() else (jsonify({"error": {"message": "No usage data found for this date"}}), 404)
+            data = usage_recorder.read(date)
+            return data if data is not None else (jsonify({"error": {"message": "No usage data found for this date"}}), 404)
+
+        @app.route('/backend-api/v2/usage/<date>/<group>', methods=['GET'])
+        def get_usage_summary(date: str, group: str):
+            if group not in USAGE_GROUPS:
+                return jsonify({"error": {"message": f"Invalid group: {group}"}}), 400
+            return jsonify(usage_recorder.get_aggregates(date, group))
+
+        @app.route('/backend-api/v2/search/cache', methods=['GET'])
+        def get_search_cache_stats():
+            return jsonify(search_cache.get_stats())
+
+        @app.route('/backend-api/v2/search/pages', methods=['GET'])
+        def get_page_cache_stats():
+            return jsonify(page_cache.get_stats())
 
         @app.route('/backend-api/v2/log', methods=['POST'])
         def add_log():
@@ -366,7 +386,7 @@ class Backend_Api(Api):
                             return send_from_directory(os.path.abspath(media_dir), filename)
                         finally:
                             if not cache_id:
-                                os.remove(os.path.join(media_dir, filename))
+                                media_store.remove(os.path.join(media_dir, filename))
                     elif response.startswith("https://") or response.startswith("http://"):
                         return redirect(response)
                 if do_filter:
@@ -389,12 +409,30 @@ class Backend_Api(Api):
             if request.method == 'DELETE':
                 try:
                     shutil.rmtree(bucket_dir)
+                    # Media of the bucket can be links to objects of the media store
+                    media_store.collect_garbage()
                     return jsonify({"message": "Bucket deleted successfully"}), 200
                 except OSError as e:
                     return jsonify({"error": {"message": f"Error deleting bucket: {str(e)}"}}), 500
                 except Exception as e:
                     return jsonify({"error": {"message": str(e)}}), 500
 
+            if "offset" in request.args or "line" in request.args:
+                try:
+                    page = read_bucket_range(
+                        bucket_dir,
+                        offset=request.args.get("offset", type=int),
+                        length=min(request.args.get("length", BUCKET_PAGE_SIZE, type=int), MAX_BUCKET_PAGE_SIZE),
+                        line=request.args.get("line", type=int),
+                        lines=min(request.args.get("lines", 100, type=int), MAX_BUCKET_PAGE_LINES),
+                    )
+                except OSError as e:
+                    logger.exception(e)
+                    return jsonify({"error": {"message": f"{type(e).__name__}: {e}"}}), 500
+                if page is None:
+                    return jsonify({"error": {"message": "Bucket text not found"}}), 404
+                return jsonify(page)
+
             delete_files = request.args.get('delete_files', True)
             refine_chunks_with_spacy = request.args.get('refine_chunks_with_spacy', False)
             event_stream = 'text/event-stream' in request.headers.get('Accept', '')
@@ -405,72 +443,39 @@ class Backend_Api(Api):
         def upload_files(bucket_id: str):
             bucket_id = secure_filename(bucket_id)
             bucket_dir = get_bucket_dir(bucket_id)
-            media_dir = os.path.join(bucket_dir, "media")
             os.makedirs(bucket_dir, exist_ok=True)
-            filenames = []
-            media = []
-            for file in request.files.getlist('files'):
-                filename = secure_filename(file.filename)
-                mimetype = file.mimetype.split(";")[0]
+            language = request.headers.get("x-recognition-language")
+            jobs = []
+            for filename, content_type, path, digest, size in iter_uploads(bucket_dir):
+                filename = secure_filename(filename)
+                mimetype = content_type.split(";")[0]
                 if (not filename or filename == "blob") and mimetype in MEDIA_TYPE_MAP:
                     filename = f"file.{MEDIA_TYPE_MAP[mimetype]}"
-                suffix = os.path.splitext(filename)[1].lower()
-                copyfile = get_tempfile(file, suffix)
-                result = None
-                if has_markitdown and not filename.endswith((".md", ".json", ".zip")):
-                    try:
-                        language = request.headers.get("x-recognition-language")
-                        md = MarkItDown()
-                        result = md.convert(copyfile, stream_info=StreamInfo(
-                            extension=suffix,
-                            mimetype=file.mimetype,
-                        ), recognition_language=language).text_content
-                    except Exception as e:
-                        logger.exception(e)
-                is_media = is_allowed_extension(filename)
-                is_supported = result or supports_filename(filename)
-                if not is_media and not is_supported:
-                    os.remove(copyfile)
-                    continue
-                if not is_media and result:
-                    with open(os.path.join(bucket_dir, f"{filename}.md"), 'w') as f:
-                        f.write(f"{result}\n")
-                    filenames.append(f"{filename}.md")
-                if is_media:
-                    os.makedirs(media_dir, exist_ok=True)
-                    newfile = os.path.join(media_dir, filename)
-                    image_size = {}
-                    if has_pillow:
-                        try:
-                            image = Image.open(copyfile)
-                            width, height = image.size
-                            image_size = {"width": width, "height": height}
-                            thumbnail_dir = os.path.join(bucket_dir, "thumbnail")
-                            os.makedirs(thumbnail_dir, exist_ok=True)
-                            process_image(image, save=os.path.join(thumbnail_dir, filename))
-                        except Exception as e:
-                            logger.exception(e)
-                    if result:
-                        media.append({"name": filename, "text": result, **image_size})
-                    else:
-                        media.append({"name": filename, **image_size})
-                elif is_supported and not result:
-                    newfile = os.path.join(bucket_dir, filename)
-                    filenames.append(filename)
-                else:
-                    os.remove(copyfile)
-                    if not result:
-                        raise ValueError(f"Unsupported file type: {filename}")
-                    continue
-                try:
-                    os.rename(copyfile, newfile)
-                except OSError:
-                    shutil.copyfile(copyfile, newfile)
-                    os.remove(copyfile)
-            with open(os.path.join(bucket_dir, "files.txt"), 'w') as f:
-                for filename in filenames:
-                    f.write(f"{filename}\n")
-            return {"bucket_id": bucket_id, "files": filenames, "media": media}
+                jobs.append(upload_queue.submit(UploadJob(bucket_dir, filename, path, digest, size, content_type, language)))
+            # Clients that follow the jobs with the progress endpoint get the response at once
+            if request.args.get("async", "").lower() in ("1", "true"):
+                return {"bucket_id": bucket_id, "jobs": [job.get_dict() for job in jobs]}
+            upload_queue.wait(jobs)
+            errors = [job.error for job in jobs if job.status == "error"]
+            if errors and not any(job.status == "done" for job in jobs):
+                return jsonify({"error": {"message": errors[0]}}), 400
+            return {
+                "bucket_id": bucket_id,
+                "files": [filename for job in jobs for filename in job.files],
+                "media": [item for job in jobs for item in job.media],
+                "jobs": [job.get_dict() for job in jobs],
+            }
+
+        @app.route('/backend-api/v2/files/<bucket_id>/jobs', methods=['GET'])
+        def upload_progress(bucket_id: str):
+            bucket_dir = get_bucket_dir(secure_filename(bucket_id))
+            jobs = [upload_queue.get(job_id) for job_id in request.args.getlist("id")]
+            jobs = [job for job in jobs if job is not None and job.bucket_dir == bucket_dir]
+            if not jobs:
+                return jsonify({"error": {"message": "Upload jobs not found"}}), 404
+            if 'text/event-stream' in request.headers.get('Accept', ''):
+                return Response(upload_queue.iter_events([job.id for job in jobs]), mimetype="text/event-stream")
+            return {"jobs": [job.get_dict() for job in jobs]}
 
         @app.route('/files/<bucket_id>/<file_type>/<filename>', methods=['GET'])
         def get_media(bucket_id, file_type: str, filename, dirname: str = None):
@@ -491,30 +496,14 @@ class Backend_Api(Api):
                     return redirect(source_url)
                 raise
 
-        self.match_files = {}
-
         @app.route('/search/<search>', methods=['GET'])
         def find_media(search: str):
             safe_search = [secure_filename(chunk.lower()) for chunk in search.split("+")]
             media_dir = get_media_dir()
             if not os.access(media_dir, os.R_OK):
                 return jsonify({"error": {"message": "Not found"}}), 404
-            if search not in self.match_files:
-                self.match_files[search] = {}
-                found_mime_type = False
-                for root, _, files in os.walk(media_dir):
-                    for file in files:
-                        mime_type = is_allowed_extension(file)
-                        if mime_type is not None:
-                            mime_type = secure_filename(mime_type)
-                            if safe_search[0] in mime_type:
-                                found_mime_type = True
-                                self.match_files[search][file] = self.match_files[search].get(file, 0) + 1
-                        for tag in safe_search[1:] if found_mime_type else safe_search:
-                            if tag in file.lower():
-                                self.match_files[search][file] = self.match_files[search].get(file, 0) + 1
-                    break
-            match_files = [file for file, count in self.match_files[search].items() if count >= request.args.get("min", len(safe_search))]
+            min_count = request.args.get("min")
+            match_files = media_store.find(safe_search, None if min_count is None else int(min_count))
             if int(request.args.get("skip") or 0) >= len(match_files):
                 return jsonify({"error": {"message": "Not found"}}), 404
             if (request.args.get("random", False)):
@@ -19,10 +19,12 @@ def render(filename = "home"):
     if os.path.exists(DIST_DIR) and not request.args.get("debug"):
         path = os.path.abspath(os.path.join(os.path.dirname(DIST_DIR), filename))
         return send_from_directory(os.path.dirname(path), os.path.basename(path))
-    try:
-        latest_version = version.utils.latest_version
-    except VersionNotFoundError:
-        latest_version = version.utils.current_version
+    latest_version = version.version_check.get_latest_version()
+    if latest_version is None:
+        try:
+            latest_version = version.utils.current_version
+        except VersionNotFoundError:
+            pass
     today = datetime.today().strftime('%Y-%m-%d')
     cache_dir = os.path.join(get_cookies_dir(), ".gui_cache")
     cache_file = os.path.join(cache_dir, f"{secure_filename(filename)}.{today}.{secure_filename(f'{version.utils.current_version}-{latest_version}')}.html")
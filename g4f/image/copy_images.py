@@ -14,10 +14,12 @@ from urllib.parse import urlparse
 from ..typing import Optional, Cookies, Union
 from ..requests.aiohttp import get_connector
 from ..image import MEDIA_TYPE_MAP, EXTENSIONS_MAP
-from ..tools.files import secure_filename
+from ..files import secure_filename
 from ..providers.response import ImageResponse, AudioResponse, VideoResponse, quote_url
 from ..Provider.template import BackendApi
 from . import is_accepted_format, extract_data_uri
+from .derivatives import media_derivatives
+from .media_store import media_store
 from .. import debug
 
 # Directory for storing generated media files
@@ -47,6 +49,12 @@ def ensure_media_dir():
     if not os.access(images_dir, os.R_OK):
         os.makedirs(media_dir, exist_ok=True)
 
+def open_media_file(path: str):
+    """Open a media file for writing, without changing the stored bytes of a hard link"""
+    if os.path.lexists(path):
+        os.unlink(path)
+    return open(path, "wb")
+
 def get_source_url(image: str, default: str = None) -> str:
     """Extract original URL from image parameter if present"""
     if "url=" in image:
@@ -82,8 +90,10 @@ async def save_response_media(response, prompt: str, tags: list[str] = [], trans
         filename = update_filename(response, filename)
     target_path = os.path.join(get_media_dir(), filename)
     ensure_media_dir()
-    with open(target_path, 'wb') as f:
+    hasher = hashlib.sha256()
+    with open_media_file(target_path) as f:
         if isinstance(response, bytes):
+            hasher.update(response)
             f.write(response)
         else:
             if hasattr(response, "iter_content"):
@@ -91,8 +101,11 @@ async def save_response_media(response, prompt: str, tags: list[str] = [], trans
             else:
                 iter_response = response.content.iter_any()
             async for chunk in iter_response:
+                hasher.update(chunk)
                 f.write(chunk)
-    
+    media_store.add(target_path, hasher.hexdigest(), content_type, [*tags, prompt])
+    media_derivatives.submit(target_path)
+
     # Base URL without request parameters
     media_url = f"/media/{filename}"
 
@@ -166,10 +179,13 @@ async def copy_media(
                     filename = get_filename(tags, alt, media_extension, image)
                 target_path = os.path.join(media_dir, filename)
             try:
+                digest = None
                 # Handle different image types
                 if image.startswith("data:"):
-                    with open(target_path, "wb") as f:
-                        f.write(extract_data_uri(image))
+                    data = extract_data_uri(image)
+                    digest = hashlib.sha256(data).hexdigest()
+                    with open_media_file(target_path) as f:
+                        f.write(data)
                 elif not os.path.exists(target_path) or os.lstat(target_path).st_size <= 0:
                     # Apply BackendApi settings if needed
                     if BackendApi.working and image.startswith(BackendApi.url):
@@ -191,9 +207,12 @@ async def copy_media(
                             if target is None and not media_extension:
                                 media_extension = f".{MEDIA_TYPE_MAP[media_type]}"
                                 target_path = f"{target_path}{media_extension}"
-                        with open(target_path, "wb") as f:
+                        hasher = hashlib.sha256()
+                        with open_media_file(target_path) as f:
                             async for chunk in response.content.iter_any():
+                                hasher.update(chunk)
                                 f.write(chunk)
+                        digest = hasher.hexdigest()
                 # Verify file format
                 if target is None and not media_extension:
                     with open(target_path, "rb") as f:
@@ -209,6 +228,9 @@ async def copy_media(
                 if thumbnail:
                     uri = "/thumbnail/" + os.path.basename(target_path)
                 else:
+                    if digest is not None:
+                        media_store.add(target_path, digest, tags=[*(tags or []), alt])
+                    media_derivatives.submit(target_path)
                     uri = f"/media/{os.path.basename(target_path)}" + ('?' + (add_url if isinstance(add_url, str) else '' + 'url=' + quote(image)) if add_url and not image.startswith('data:') else '')
                 if return_target:
                     return uri, target_path
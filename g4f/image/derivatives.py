@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import os
+import json
+import atexit
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+from typing import Dict, Optional
+
+try:
+    from PIL import Image
+    has_requirements = True
+except ImportError:
+    has_requirements = False
+
+from . import process_image
+from .. import debug
+
+IMAGE_EXTENSIONS = ("jpg", "jpeg", "png", "gif", "webp")
+INDEX_FILE = "index.jsonl"
+# Seconds a streamed response waits for the metadata of a new file, it is sent without them after that
+WAIT_TIMEOUT = 0.5
+# The index is rewritten when it has more stale lines than this and than entries
+COMPACT_LINES = 1000
+
+def create_derivatives(path: str, thumbnail_path: str) -> dict:
+    """Probe the dimensions of an image and create its thumbnail. Runs in a worker process."""
+    with Image.open(path) as image:
+        width, height = image.size
+        os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+        process_image(image, save=thumbnail_path)
+    return {"width": width, "height": height}
+
+class MediaDerivatives:
+    """
+    Creates thumbnails and probes dimensions of media files in a worker pool.
+
+    Files are submitted right after they are written. Concurrent requests for the
+    same file share one future, and the results are kept in a sidecar index at
+    ``thumbnails/index.jsonl`` of the media dir, so request handlers only read
+    precomputed metadata or wait for the pending future. The index is appended to,
+    and rewritten without replaced entries and deleted files when it grows stale.
+    """
+
+    def __init__(self, max_workers: int = 2, use_processes: bool = True, media_dir: str = None) -> None:
+        """
+        Args:
+            max_workers (int): Number of worker processes or threads.
+            use_processes (bool): Use a process pool, otherwise a thread pool.
+            media_dir (str): The media dir, defaults to get_media_dir().
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.media_dir = media_dir
+        self.executor: Optional[Executor] = None
+        self.pending: Dict[str, Future] = {}
+        self.index: Optional[Dict[str, dict]] = None
+        self.index_lines = 0
+        self.lock = threading.Lock()
+
+    def get_media_dir(self) -> str:
+        if self.media_dir is None:
+            from .copy_images import get_media_dir
+            return get_media_dir()
+        return self.media_dir
+
+    def get_thumbnail_dir(self) -> str:
+        return os.path.join(self.get_media_dir(), "thumbnails")
+
+    def get_executor(self) -> Executor:
+        if self.executor is None:
+            if self.use_processes:
+                try:
+                    self.executor = ProcessPoolExecutor(self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    debug.error("Media derivatives: Process pool not available:", e)
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="g4f-media")
+            atexit.register(self.shutdown)
+        return self.executor
+
+    def load_index(self) -> Dict[str, dict]:
+        if self.index is None:
+            self.index = {}
+            index_file = os.path.join(self.get_thumbnail_dir(), INDEX_FILE)
+            if os.path.isfile(index_file):
+                with open(index_file, "r") as f:
+                    for line in f:
+                        self.index_lines += 1
+                        try:
+                            item = json.loads(line)
+                            self.index[item.pop("filename")] = item
+                        except (json.JSONDecodeError, KeyError, AttributeError):
+                            continue
+                self._compact_if_stale()
+        return self.index
+
+    def _compact_if_stale(self) -> None:
+        stale_lines = self.index_lines - len(self.index)
+        if stale_lines <= COMPACT_LINES or stale_lines <= len(self.index):
+            return
+        media_dir = self.get_media_dir()
+        self.index = {
+            filename: metadata for filename, metadata in self.index.items()
+            if os.path.isfile(os.path.join(media_dir, filename))
+        }
+        index_file = os.path.join(self.get_thumbnail_dir(), INDEX_FILE)
+        tmp_file = f"{index_file}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                for filename, metadata in self.index.items():
+                    f.write(f"{json.dumps({'filename': filename, **metadata})}\n")
+            os.replace(tmp_file, index_file)
+            self.index_lines = len(self.index)
+        except OSError as e:
+            debug.error("Media derivatives: Failed to compact index:", e)
+
+    def get(self, path: str) -> Optional[dict]:
+        """Return the metadata of a file if its derivatives are up to date."""
+        filename = os.path.basename(path)
+        with self.lock:
+            metadata = self.load_index().get(filename)
+        if metadata is None:
+            return None
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        if metadata.get("size") != stat_result.st_size or metadata.get("mtime") != stat_result.st_mtime:
+            return None
+        if not os.path.isfile(os.path.join(self.get_thumbnail_dir(), filename)):
+            return None
+        return metadata
+
+    def submit(self, path: str) -> Optional[Future]:
+        """Schedule the derivatives of a file. Returns None for files without derivatives."""
+        if not has_requirements or os.path.splitext(path)[1][1:].lower() not in IMAGE_EXTENSIONS:
+            return None
+        metadata = self.get(path)
+        if metadata is not None:
+            future = Future()
+            future.set_result(metadata)
+            return future
+        filename = os.path.basename(path)
+        with self.lock:
+            future = self.pending.get(filename)
+            if future is not None:
+                return future
+            thumbnail_path = os.path.join(self.get_thumbnail_dir(), filename)
+            task = self.get_executor().submit(create_derivatives, path, thumbnail_path)
+            # Waiters get the result after it is in the index
+            future = Future()
+            self.pending[filename] = future
+        # Outside of the lock, because the callback runs at once on a finished future
+        task.add_done_callback(lambda task: self._on_done(path, task, future))
+        return future
+
+    def _on_done(self, path: str, task: Future, future: Future) -> None:
+        filename = os.path.basename(path)
+        try:
+            self._update_index(path, task)
+        finally:
+            with self.lock:
+                self.pending.pop(filename, None)
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+    def _update_index(self, path: str, task: Future) -> None:
+        filename = os.path.basename(path)
+        with self.lock:
+            if task.cancelled() or task.exception() is not None:
+                if not task.cancelled():
+                    debug.error(f"Media derivatives: Failed for {filename}:", task.exception())
+                return
+            metadata = task.result()
+            try:
+                stat_result = os.stat(path)
+                metadata.update(size=stat_result.st_size, mtime=stat_result.st_mtime)
+                self.load_index()[filename] = metadata
+                with open(os.path.join(self.get_thumbnail_dir(), INDEX_FILE), "a") as f:
+                    f.write(f"{json.dumps({'filename': filename, **metadata})}\n")
+                self.index_lines += 1
+                self._compact_if_stale()
+            except OSError as e:
+                debug.error("Media derivatives: Failed to update index:", e)
+        debug.log(f"Thumbnail created: {filename}")
+
+    async def wait(self, path: str) -> Optional[dict]:
+        """Return the metadata of a file, waiting for its derivatives if needed."""
+        future = self.submit(path)
+        if future is None:
+            return None
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception:
+            return None
+
+    def wait_sync(self, path: str, timeout: float = None) -> Optional[dict]:
+        """Blocking version of ``wait`` for synchronous handlers. Returns None after ``timeout`` seconds."""
+        future = self.submit(path)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            debug.log(f"Media derivatives: No metadata for {os.path.basename(path)} after {timeout}s")
+            return None
+        except Exception:
+            return None
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+media_derivatives = MediaDerivatives()
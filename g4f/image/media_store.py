@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import os
+import json
+import asyncio
+import hashlib
+import secrets
+import threading
+from functools import partial
+from typing import Dict, List, Optional
+
+from . import EXTENSIONS_MAP
+from ..files import secure_filename
+from .. import debug
+
+OBJECTS_DIR = ".objects"
+INDEX_FILE = "index.jsonl"
+CHUNK_SIZE = 1024 * 1024
+
+def hash_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+class MediaStore:
+    """
+    Content-addressed store for the media dir.
+
+    The bytes of a file are kept once in ``.objects/<hash[:2]>/<hash>`` and the
+    readable file names in the media dir are hard links to them, so duplicates
+    use no extra space. The file system link count is the reference count of an
+    object. An append-only index of names, hashes, mime types and tags answers
+    ``find`` without listing the media dir.
+    """
+
+    def __init__(self, media_dir: str = None) -> None:
+        """
+        Args:
+            media_dir (str): The media dir, defaults to get_media_dir().
+        """
+        self.media_dir = media_dir
+        self.index: Optional[Dict[str, dict]] = None
+        self.lock = threading.Lock()
+
+    def get_media_dir(self) -> str:
+        if self.media_dir is None:
+            from .copy_images import get_media_dir
+            return get_media_dir()
+        return self.media_dir
+
+    def get_objects_dir(self) -> str:
+        return os.path.join(self.get_media_dir(), OBJECTS_DIR)
+
+    def get_object_path(self, digest: str) -> str:
+        return os.path.join(self.get_objects_dir(), digest[:2], digest)
+
+    def load_index(self) -> Dict[str, dict]:
+        if self.index is None:
+            self.index = {}
+            index_file = os.path.join(self.get_objects_dir(), INDEX_FILE)
+            if os.path.isfile(index_file):
+                with open(index_file, "r") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            if record.get("deleted"):
+                                self.index.pop(record["name"], None)
+                            else:
+                                self.index[record["name"]] = record
+                        except (json.JSONDecodeError, KeyError, TypeError):
+                            continue
+            else:
+                self._import_media_dir()
+        return self.index
+
+    def _import_media_dir(self) -> None:
+        # Register the files of an existing media dir once, duplicates are linked to one object
+        media_dir = self.get_media_dir()
+        if not os.path.isdir(media_dir):
+            return
+        records = []
+        for entry in os.scandir(media_dir):
+            if entry.is_file() and not entry.name.startswith(".") and not entry.name.endswith(".tmp"):
+                try:
+                    digest = hash_file(entry.path)
+                except OSError as e:
+                    debug.error(f"Media store: Failed to read {entry.name}:", e)
+                    continue
+                self._link(entry.path, digest)
+                records.append(self._create_record(entry.name, digest))
+        self._write_records(records)
+
+    def _link(self, path: str, digest: str) -> None:
+        object_path = self.get_object_path(digest)
+        try:
+            if os.path.isfile(object_path):
+                if not os.path.samefile(object_path, path):
+                    temp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+                    os.link(object_path, temp_path)
+                    os.replace(temp_path, path)
+            else:
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                os.link(path, object_path)
+        except OSError as e:
+            # Hard links are not supported, keep the copy
+            debug.error("Media store: Failed to link file:", e)
+
+    def _create_record(self, name: str, digest: str = None, mime_type: str = None, tags: List[str] = None) -> dict:
+        record = {
+            "name": name,
+            "hash": digest,
+            "mime_type": mime_type or EXTENSIONS_MAP.get(os.path.splitext(name)[1][1:].lower()),
+            "tags": [str(tag).lower() for tag in tags if tag] if tags else [],
+        }
+        self.index[name] = record
+        return record
+
+    def _write_records(self, records: List[dict]) -> None:
+        try:
+            os.makedirs(self.get_objects_dir(), exist_ok=True)
+            with open(os.path.join(self.get_objects_dir(), INDEX_FILE), "a") as f:
+                for record in records:
+                    f.write(f"{json.dumps(record)}\n")
+        except OSError as e:
+            debug.error("Media store: Failed to write index:", e)
+
+    def add(self, path: str, digest: str = None, mime_type: str = None, tags: List[str] = None) -> str:
+        """
+        Add a file of the media dir to the store.
+        If the same bytes are already stored, the file is replaced by a link to them.
+
+        Args:
+            path (str): The file in the media dir.
+            digest (str): The sha256 hex digest of the file, if computed while writing it.
+            mime_type (str): The mime type, defaults to the type of the extension.
+            tags (list): Tags for ``find``.
+
+        Returns:
+            str: The path of the file.
+        """
+        if digest is None:
+            digest = hash_file(path)
+        with self.lock:
+            self.load_index()
+            self._link(path, digest)
+            self._write_records([self._create_record(os.path.basename(path), digest, mime_type, tags)])
+        return path
+
+    async def add_async(self, path: str, mime_type: str = None, tags: List[str] = None) -> str:
+        """Like ``add``, but hashes the file in a worker thread. For files written by providers."""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self.add, path, mime_type=mime_type, tags=tags))
+
+    def get(self, name: str) -> Optional[dict]:
+        with self.lock:
+            return self.load_index().get(name)
+
+    def find(self, terms: List[str], min_count: int = None) -> List[str]:
+        """
+        Return the names of existing files that match at least ``min_count`` terms, by default all.
+        The first term can also match the mime type. The other terms match the name or the tags.
+        """
+        min_count = len(terms) if min_count is None else min_count
+        with self.lock:
+            records = list(self.load_index().values())
+        matches = []
+        for record in records:
+            count = 0
+            remaining = terms
+            if terms and record.get("mime_type") and terms[0] in secure_filename(record["mime_type"]):
+                count += 1
+                remaining = terms[1:]
+            name = record["name"].lower()
+            tags = record.get("tags") or []
+            count += sum(1 for term in remaining if term in name or any(term in tag for tag in tags))
+            if count >= min_count:
+                matches.append(record["name"])
+        # Only the matches are checked on disk, deleted files are removed from the index by ``remove``
+        media_dir = self.get_media_dir()
+        return [name for name in matches if os.path.isfile(os.path.join(media_dir, name))]
+
+    def remove(self, path: str) -> None:
+        """Delete a file of the media dir, and its object if no other file links to it."""
+        name = os.path.basename(path)
+        with self.lock:
+            record = self.load_index().pop(name, None)
+            os.remove(path)
+            self._write_records([{"name": name, "deleted": True}])
+            if record is None or not record.get("hash"):
+                return
+            object_path = self.get_object_path(record["hash"])
+            try:
+                if os.stat(object_path).st_nlink <= 1:
+                    os.unlink(object_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                debug.error("Media store: Failed to delete object:", e)
+
+    def collect_garbage(self) -> int:
+        """Delete objects without links in the media dir. Returns the number of deleted objects."""
+        deleted = 0
+        objects_dir = self.get_objects_dir()
+        if not os.path.isdir(objects_dir):
+            return deleted
+        with self.lock:
+            for entry in os.scandir(objects_dir):
+                if not entry.is_dir():
+                    continue
+                for file in os.scandir(entry.path):
+                    if file.is_file() and file.stat().st_nlink <= 1:
+                        try:
+                            os.unlink(file.path)
+                            deleted += 1
+                        except OSError as e:
+                            debug.error("Media store: Failed to delete object:", e)
+        return deleted
+
+media_store = MediaStore()
@@ -14,6 +14,7 @@ from markitdown._exceptions import (
 
 from ._audio_converter import AudioConverter
 from ._image_converter import ImageConverter
+from ...tools.model_pool import ModelPool
 
 class MarkItDown(BaseMarkItDown):
     """(In preview) An extremely simple text-based document reader, suitable for LLM use.
@@ -166,3 +167,6 @@ class MarkItDown(BaseMarkItDown):
             file_stream=stream, base_guess=base_guess or StreamInfo()
         )
         return self._convert(file_stream=stream, stream_info_guesses=guesses, **kwargs)
+
+# Shared converters, a new MarkItDown instance registers and sorts all converters again
+markitdown_pool = ModelPool(MarkItDown, max_size=4)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import os
 import re
-import json
+from types import MappingProxyType
 from ..typing import AsyncResult, Messages, MediaListType, Union
 from ..errors import ModelNotFoundError
 from ..image import is_data_an_audio
@@ -18,7 +17,7 @@ from .base_provider import AsyncGeneratorProvider, ProviderModelMixin
 from .. import Provider
 from .. import models
 from .. import debug
-from .any_model_map import audio_models, image_models, vision_models, video_models, model_map, models_count, parents
+from .model_map import ModelMapAttribute, write_model_map, MODEL_MAP_FILE
 
 PROVIERS_LIST_1 = [
     CopilotAccount, OpenaiChat, Cloudflare, PerplexityLabs, Gemini, Grok, DeepSeekAPI, Blackbox, OpenAIFM,
@@ -62,24 +61,111 @@ LABELS = {
     "other": "Other Models",
 }
 
+EMPTY_MODALITIES = frozenset()
+
+class RoutingIndex:
+    """
+    Immutable lookup of model names and aliases to ordered provider tuples.
+
+    The index is built once and replaced as a whole when the model map changes,
+    so lookups need no locking and allocate nothing per request.
+    The modality sets hold the models with vision, audio, image or video support.
+    """
+    __slots__ = ("routes", "fallback", "vision", "audio", "image", "video", "modalities")
+
+    def __init__(
+        self,
+        routes: dict[str, tuple],
+        fallback: dict[str, tuple],
+        vision: frozenset = frozenset(),
+        audio: frozenset = frozenset(),
+        image: frozenset = frozenset(),
+        video: frozenset = frozenset()
+    ) -> None:
+        self.routes = MappingProxyType(routes)
+        self.fallback = MappingProxyType(fallback)
+        self.vision = vision
+        self.audio = audio
+        self.image = image
+        self.video = video
+        modalities = {}
+        for modality in ("vision", "audio", "image", "video"):
+            for model in getattr(self, modality):
+                modalities.setdefault(model, set()).add(modality)
+        self.modalities = MappingProxyType({model: frozenset(flags) for model, flags in modalities.items()})
+
+    @classmethod
+    def build(cls, model_map: dict[str, dict[str, str]], fallback_providers: list, **modalities) -> "RoutingIndex":
+        """
+        Build the index from the model map and the already loaded model lists of the fallback providers.
+        Model lists are not fetched, so building the index never does network I/O.
+        """
+        routes = {}
+        for model, providers in model_map.items():
+            routes[model] = tuple(
+                (Provider.__map__[provider], alias) for provider, alias in providers.items()
+                if provider in Provider.__map__ and Provider.__map__[provider].working
+            )
+        fallback = {}
+        for provider in fallback_providers:
+            if not provider.working:
+                continue
+            models = getattr(provider, "models", None) or [getattr(provider, "default_model", None)]
+            for model in [*models, *getattr(provider, "model_aliases", {}).keys()]:
+                if isinstance(model, str) and provider not in fallback.setdefault(model, ()):
+                    fallback[model] += (provider,)
+        return cls(routes, fallback, **{key: frozenset(value) for key, value in modalities.items()})
+
+    def get(self, model: str) -> tuple:
+        """Return the (provider, alias) pairs for a model from the model map."""
+        return self.routes.get(model, ())
+
+    def get_fallback(self, model: str) -> tuple:
+        """Return the providers that list the model in their own model list."""
+        return self.fallback.get(model, ())
+
+    def get_modalities(self, model: str) -> frozenset:
+        """Return the modality flags of a model, like "vision" or "audio"."""
+        return self.modalities.get(model, EMPTY_MODALITIES)
+
 class AnyModelProviderMixin(ProviderModelMixin):
     """Mixin to provide model-related methods for providers."""
 
     default_model = "default"
-    audio_models = audio_models
-    image_models = image_models
-    vision_models = vision_models
-    video_models = video_models
-    models_count = models_count
-    models = list(model_map.keys())
-    model_map: dict[str, dict[str, str]] = model_map
+    # Read from the model map artifact on first access, until update_model_map replaces them
+    audio_models = ModelMapAttribute()
+    image_models = ModelMapAttribute()
+    vision_models = ModelMapAttribute()
+    video_models = ModelMapAttribute()
+    models_count = ModelMapAttribute()
+    models = ModelMapAttribute()
+    model_map: dict[str, dict[str, str]] = ModelMapAttribute()
+    parents: dict[str, list[str]] = ModelMapAttribute()
+    routing_index: RoutingIndex = None
+
+    @classmethod
+    def get_routing_index(cls) -> RoutingIndex:
+        if cls.routing_index is None:
+            cls.update_routing_index()
+        return cls.routing_index
+
+    @classmethod
+    def update_routing_index(cls) -> None:
+        cls.routing_index = RoutingIndex.build(
+            cls.model_map,
+            PROVIERS_LIST_1,
+            vision=cls.vision_models,
+            audio=cls.audio_models,
+            image=cls.image_models,
+            video=cls.video_models,
+        )
 
     @classmethod
     def extend_ignored(cls, ignored: list[str]) -> list[str]:
         """Extend the ignored list with parent providers."""
         for ignored_provider in ignored:
-            if ignored_provider in parents and parents[ignored_provider] not in ignored:
-                ignored.extend(parents[ignored_provider])
+            if ignored_provider in cls.parents and cls.parents[ignored_provider] not in ignored:
+                ignored.extend(cls.parents[ignored_provider])
         return ignored
 
     @classmethod
@@ -100,11 +186,16 @@ class AnyModelProviderMixin(ProviderModelMixin):
     @classmethod
     def update_model_map(cls):
         cls.create_model_map()
-        file = os.path.join(os.path.dirname(__file__), "any_model_map.py")
-        with open(file, "w", encoding="utf-8") as f:
-            for key in ["audio_models", "image_models", "vision_models", "video_models", "model_map", "models_count", "parents"]:
-                value = getattr(cls, key)
-                f.write(f"{key} = {json.dumps(value, indent=2) if isinstance(value, dict) else repr(value)}\n")
+        write_model_map(
+            MODEL_MAP_FILE,
+            model_map=cls.model_map,
+            models_count=cls.models_count,
+            parents=cls.parents,
+            audio_models=cls.audio_models,
+            image_models=cls.image_models,
+            vision_models=cls.vision_models,
+            video_models=cls.video_models,
+        )
 
     @classmethod
     def create_model_map(cls):
@@ -112,6 +203,7 @@ class AnyModelProviderMixin(ProviderModelMixin):
         cls.image_models = []
         cls.vision_models = []
         cls.video_models = []
+        cls.models_count = {}
 
         # Get models from the models registry
         cls.model_map = {
@@ -255,9 +347,13 @@ class AnyModelProviderMixin(ProviderModelMixin):
                 elif provider.__name__ not in cls.parents[provider.get_parent()]:
                     cls.parents[provider.get_parent()].append(provider.__name__)
 
+        cls.models = list(cls.model_map.keys())
+        cls.update_routing_index()
+
     @classmethod
     def get_grouped_models(cls, ignored: list[str] = []) -> dict[str, list[str]]:
         unsorted_models = cls.get_models(ignored=ignored)
+        index = cls.get_routing_index()
         groups = {key: [] for key in LABELS.keys()}
 
         # Always add default first
@@ -316,7 +412,7 @@ class AnyModelProviderMixin(ProviderModelMixin):
                 groups["perplexity"].append(model)
                 added = True
             # Check for image models - UPDATED to include flux check
-            elif model in cls.image_models:
+            elif model in index.image:
                 groups["image"].append(model)
                 added = True
             # Check for OpenAI models
@@ -324,7 +420,7 @@ class AnyModelProviderMixin(ProviderModelMixin):
                 groups["openai"].append(model)
                 added = True
             # Check for video models
-            elif model in cls.video_models:
+            elif model in index.video:
                 groups["video"].append(model)
                 added = True
             if not added:
@@ -392,17 +488,11 @@ class AnyProvider(AsyncGeneratorProvider, AnyModelProviderMixin):
                     providers.append(provider)
                     model = submodel
         else:
-            if model in cls.model_map:
-                for provider, alias in cls.model_map[model].items():
-                    provider = Provider.__map__[provider]
-                    provider.model_aliases[model] = alias
-                    providers.append(provider)
+            for provider, alias in cls.get_routing_index().get(model):
+                provider.model_aliases[model] = alias
+                providers.append(provider)
         if not providers:
-            for provider in PROVIERS_LIST_1:
-                if model in provider.get_models():
-                    providers.append(provider)
-                elif model in provider.model_aliases:
-                    providers.append(provider)
+            providers = cls.get_routing_index().get_fallback(model)
         providers = [provider for provider in providers if provider.working and provider.get_parent() not in ignored]
         providers = list({provider.__name__: provider for provider in providers}.values())
 
@@ -423,4 +513,3 @@ class AnyProvider(AsyncGeneratorProvider, AnyModelProviderMixin):
 
 setattr(Provider, "AnyProvider", AnyProvider)
 Provider.__map__["AnyProvider"] = AnyProvider
-Provider.__providers__.append(AnyProvider)
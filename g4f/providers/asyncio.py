@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from asyncio import AbstractEventLoop, runners
-from typing import Optional, Callable, AsyncIterator, Iterator
+from typing import Optional, Callable, Coroutine, AsyncIterator, Iterator
 
 from ..errors import NestAsyncioError
 
@@ -67,6 +68,32 @@ def to_sync_generator(generator: AsyncIterator, stream: bool = True, timeout: in
                 asyncio.set_event_loop(None)
                 loop.close()
 
+_background_loop: Optional[AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+def get_background_loop() -> AbstractEventLoop:
+    """Return a shared event loop that runs forever in a daemon thread."""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="g4f-background-loop", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+def run_coroutine_sync(coro: Coroutine, timeout: Optional[float] = None) -> any:
+    """
+    Run a coroutine from synchronous code on the shared background loop.
+    Unlike ``asyncio.run`` no event loop is created per call, so pooled sessions stay
+    warm, and it also works in a thread that already runs an event loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
 # Helper function to convert a synchronous iterator to an async iterator
 async def to_async_iterator(iterator) -> AsyncIterator:
     if hasattr(iterator, '__aiter__'):
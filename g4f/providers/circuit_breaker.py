@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+import json
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Type
+
+from ..errors import ResponseStatusError, RateLimitError, CloudflareError
+from ..cookies import get_cookies_dir
+from .. import debug
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+class Circuit:
+    """
+    Health state of a provider or of a provider and model.
+
+    Attributes:
+        state (str): One of "closed", "open" or "half-open".
+        failures (int): Number of consecutive failures.
+        opened_at (float): Timestamp when the circuit was opened.
+        cooldown (float): Seconds the circuit stays open.
+        probe_started (float): Timestamp of the trial request of a half-open circuit, not saved.
+    """
+
+    def __init__(self, state: str = CLOSED, failures: int = 0, opened_at: float = 0, cooldown: float = 0) -> None:
+        self.state = state
+        self.failures = failures
+        self.opened_at = opened_at
+        self.cooldown = cooldown
+        self.probe_started = 0
+
+    def get_state(self, now: float = None) -> str:
+        if self.state == OPEN and (now or time.time()) >= self.opened_at + self.cooldown:
+            self.state = HALF_OPEN
+        return self.state
+
+    def get_dict(self) -> Dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_at": self.opened_at,
+            "cooldown": self.cooldown,
+        }
+
+class CircuitBreaker:
+    """
+    Per-provider and per-model circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and the
+    provider is skipped for the cool-down time. Then one trial request is let
+    through (half-open): a success closes the circuit, a failure opens it again
+    with a doubled cool-down. The trial is claimed when the request is sent, other
+    requests are skipped while it runs, or until ``probe_timeout`` if it never
+    reports back. Errors of a model only count against the circuit of the model,
+    rate limits, Cloudflare and server errors also against the provider.
+    The static ``provider.working`` flag is not changed.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 30,
+        max_cooldown: float = 3600,
+        exceptions: Tuple[Type[Exception], ...] = (ResponseStatusError, RateLimitError, CloudflareError),
+        provider_exceptions: Tuple[Type[Exception], ...] = (RateLimitError, CloudflareError),
+        persist: bool = False,
+        probe_timeout: float = 120
+    ) -> None:
+        """
+        Args:
+            failure_threshold (int): Consecutive failures before the circuit opens.
+            cooldown (float): Initial cool-down in seconds.
+            max_cooldown (float): Upper limit for the exponential cool-down.
+            exceptions (tuple): Exception types that count as failures.
+            provider_exceptions (tuple): Exception types that count against the provider for every model.
+            persist (bool): Save the state to the cookies dir.
+            probe_timeout (float): Seconds until another trial request is let through.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.exceptions = exceptions
+        self.provider_exceptions = provider_exceptions
+        self.persist = persist
+        self.probe_timeout = probe_timeout
+        self.circuits: Dict[str, Circuit] = {}
+        self.lock = threading.Lock()
+        self.loaded = False
+
+    @staticmethod
+    def get_key(provider: str, model: str = None) -> str:
+        return f"{provider}:{model}" if model else provider
+
+    @staticmethod
+    def get_file() -> Path:
+        return Path(get_cookies_dir()) / ".health" / "circuit_breaker.json"
+
+    def load(self) -> None:
+        self.loaded = True
+        file = self.get_file()
+        if not self.persist or not file.exists():
+            return
+        try:
+            with file.open("r") as f:
+                data = json.load(f)
+            self.circuits.update({key: Circuit(**value) for key, value in data.items()})
+        except (OSError, ValueError, TypeError) as e:
+            debug.error(f"Failed to load circuit breaker state:", e)
+
+    def save(self) -> None:
+        if not self.persist:
+            return
+        file = self.get_file()
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = file.with_suffix(".tmp")
+            with tmp.open("w") as f:
+                json.dump({
+                    key: circuit.get_dict() for key, circuit in self.circuits.items()
+                    if circuit.state != CLOSED or circuit.failures
+                }, f)
+            os.replace(tmp, file)
+        except OSError as e:
+            debug.error(f"Failed to save circuit breaker state:", e)
+
+    def get_circuit(self, key: str) -> Optional[Circuit]:
+        if not self.loaded:
+            self.load()
+        return self.circuits.get(key)
+
+    def get_state(self, provider: str, model: str = None) -> str:
+        """Return the state of the circuit of a provider or of a provider and model."""
+        circuit = self.get_circuit(self.get_key(provider, model))
+        return CLOSED if circuit is None else circuit.get_state()
+
+    def get_circuits(self, provider: str, model: str = None) -> List[Circuit]:
+        circuits = [self.get_circuit(key) for key in {provider, self.get_key(provider, model)}]
+        return [circuit for circuit in circuits if circuit is not None]
+
+    def allow(self, provider: str, model: str = None) -> bool:
+        """
+        Return False if the provider or the model of the provider is open,
+        or if it is half-open and a trial request is running. Changes nothing.
+        """
+        with self.lock:
+            now = time.time()
+            for circuit in self.get_circuits(provider, model):
+                state = circuit.get_state(now)
+                if state == OPEN or (state == HALF_OPEN and circuit.probe_started + self.probe_timeout > now):
+                    return False
+            return True
+
+    def claim(self, provider: str, model: str = None) -> None:
+        """Mark the half-open circuits as probed, when a request is sent to the provider."""
+        with self.lock:
+            now = time.time()
+            for circuit in self.get_circuits(provider, model):
+                if circuit.get_state(now) == HALF_OPEN:
+                    circuit.probe_started = now
+
+    def release(self, provider: str, model: str = None) -> None:
+        """Clear the trial of a request that ended without a result, the next request is a trial again."""
+        with self.lock:
+            for circuit in self.get_circuits(provider, model):
+                circuit.probe_started = 0
+
+    def is_provider_error(self, exception: Exception) -> bool:
+        if isinstance(exception, self.provider_exceptions):
+            return True
+        return isinstance(exception, ResponseStatusError) and re.match(r"Response 5\d\d", str(exception)) is not None
+
+    def record_success(self, provider: str, model: str = None) -> None:
+        with self.lock:
+            changed = False
+            for key in {provider, self.get_key(provider, model)}:
+                circuit = self.get_circuit(key)
+                if circuit is None:
+                    continue
+                changed = changed or circuit.state != CLOSED
+                self.circuits[key] = Circuit()
+            if changed:
+                debug.log(f"Circuit breaker: {provider} is closed")
+                self.save()
+
+    def record_failure(self, provider: str, model: str = None, exception: Exception = None) -> None:
+        if not isinstance(exception, self.exceptions):
+            # The trial request did not count
+            self.release(provider, model)
+            return
+        with self.lock:
+            keys = {self.get_key(provider, model)}
+            if not model or self.is_provider_error(exception):
+                keys.add(provider)
+            else:
+                # The provider works, only the model failed
+                provider_circuit = self.get_circuit(provider)
+                if provider_circuit is not None:
+                    provider_circuit.probe_started = 0
+            now = time.time()
+            changed = False
+            for key in keys:
+                circuit = self.get_circuit(key)
+                if circuit is None:
+                    circuit = self.circuits[key] = Circuit()
+                circuit.failures += 1
+                circuit.probe_started = 0
+                state = circuit.get_state(now)
+                if state == HALF_OPEN or (state == CLOSED and circuit.failures >= self.failure_threshold):
+                    circuit.cooldown = self.cooldown if state == CLOSED else min(circuit.cooldown * 2, self.max_cooldown)
+                    circuit.opened_at = now
+                    circuit.state = OPEN
+                    changed = True
+                    debug.log(f"Circuit breaker: {key} is open for {circuit.cooldown}s")
+            if changed:
+                self.save()
+
+    def get_health(self) -> Dict[str, Dict]:
+        """Return the state of all circuits that are not closed or have failures."""
+        now = time.time()
+        return {
+            key: {**circuit.get_dict(), "state": circuit.get_state(now)}
+            for key, circuit in self.circuits.items()
+            if circuit.get_state(now) != CLOSED or circuit.failures
+        }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.circuits = {}
+            self.save()
+
+default_breaker = CircuitBreaker()
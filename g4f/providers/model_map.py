@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import os
+import sys
+import json
+import threading
+from array import array
+from types import MappingProxyType
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Union
+
+from .. import debug
+
+MODEL_MAP_FILE = os.path.join(os.path.dirname(__file__), "any_model_map.json")
+MODEL_MAP_VERSION = 1
+MODEL_LISTS = ("audio_models", "image_models", "vision_models", "video_models")
+
+Alias = Union[str, List[str]]
+
+class StringTable:
+    """Assigns small integer ids to strings, every string is stored once."""
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        if value not in self.ids:
+            self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return self.ids[value]
+
+def dump_model_map(
+    model_map: Dict[str, Dict[str, Alias]],
+    models_count: Dict[str, int],
+    parents: Dict[str, List[str]],
+    **model_lists: List[str]
+) -> dict:
+    """
+    Encode the model map of AnyProvider into the compact artifact format.
+
+    Model names and aliases are stored once in ``strings`` and providers in ``providers``.
+    Each model is a row of its string id followed by pairs of provider id and alias id.
+    Aliases that are lists of models are stored in ``alias_lists`` and referenced by ``-1 - index``.
+    """
+    strings = StringTable()
+    providers = StringTable()
+    alias_lists = []
+    def add_alias(alias: Alias) -> int:
+        if isinstance(alias, list):
+            alias_lists.append([strings.add(value) for value in alias])
+            return -len(alias_lists)
+        return strings.add(alias)
+    rows = []
+    for model, model_providers in model_map.items():
+        row = [strings.add(model)]
+        for provider, alias in model_providers.items():
+            row += [providers.add(provider), add_alias(alias)]
+        rows.append(row)
+    data = {
+        "version": MODEL_MAP_VERSION,
+        "model_map": rows,
+        "models_count": [[strings.add(model), count] for model, count in models_count.items()],
+        "parents": [[providers.add(parent), [providers.add(child) for child in children]] for parent, children in parents.items()],
+        **{key: [strings.add(model) for model in model_lists.get(key) or []] for key in MODEL_LISTS},
+        "alias_lists": alias_lists,
+    }
+    data["providers"] = providers.strings
+    data["strings"] = strings.strings
+    return data
+
+def write_model_map(file: str = MODEL_MAP_FILE, **kwargs) -> None:
+    """Write the artifact atomically, with one model per line to keep diffs readable."""
+    data = dump_model_map(**kwargs)
+    tmp_file = f"{file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for index, (key, value) in enumerate(data.items()):
+            f.write(f"{json.dumps(key)}: ")
+            if key == "model_map":
+                f.write("[\n" + ",\n".join(json.dumps(row, separators=(",", ":")) for row in value) + "\n]")
+            else:
+                f.write(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+            f.write(",\n" if index < len(data) - 1 else "\n")
+        f.write("}\n")
+    os.replace(tmp_file, file)
+
+class ModelMapView(Mapping):
+    """
+    Read-only view of the model map: model name to a mapping of provider to alias.
+
+    The routes are kept in flat integer arrays and the mapping of a model is only
+    built when it is looked up.
+    """
+
+    def __init__(self, data: "CompactModelMap", rows: List[List[int]]) -> None:
+        self.data = data
+        self.index: Dict[str, int] = {}
+        self.starts = array("I", [0])
+        self.routes = array("i")
+        for row in rows:
+            self.index[data.strings[row[0]]] = len(self.index)
+            self.routes.extend(row[1:])
+            self.starts.append(len(self.routes))
+
+    def __getitem__(self, model: str) -> MappingProxyType:
+        position = self.index[model]
+        routes = self.routes[self.starts[position]:self.starts[position + 1]]
+        return MappingProxyType({
+            self.data.providers[routes[i]]: self.data.get_alias(routes[i + 1])
+            for i in range(0, len(routes), 2)
+        })
+
+    def __contains__(self, model) -> bool:
+        return model in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+class CompactModelMap:
+    """The decoded model map artifact, strings are interned and shared by all views."""
+
+    def __init__(self, data: dict) -> None:
+        if data.get("version") != MODEL_MAP_VERSION:
+            raise ValueError(f"Unsupported model map version: {data.get('version')}")
+        self.strings = [sys.intern(value) for value in data["strings"]]
+        self.providers = [sys.intern(value) for value in data["providers"]]
+        self.alias_lists = [tuple(self.strings[i] for i in values) for values in data["alias_lists"]]
+        self.model_map = ModelMapView(self, data["model_map"])
+        self.models = list(self.model_map)
+        self.models_count = MappingProxyType({self.strings[i]: count for i, count in data["models_count"]})
+        self.parents = MappingProxyType({
+            self.providers[parent]: tuple(self.providers[i] for i in children)
+            for parent, children in data["parents"]
+        })
+        for key in MODEL_LISTS:
+            setattr(self, key, tuple(self.strings[i] for i in data[key]))
+
+    def get_alias(self, value: int) -> Alias:
+        return self.strings[value] if value >= 0 else list(self.alias_lists[-1 - value])
+
+    @classmethod
+    def empty(cls) -> CompactModelMap:
+        return cls(dump_model_map({}, {}, {}))
+
+_lock = threading.Lock()
+_model_map: Optional[CompactModelMap] = None
+
+def load_model_map(file: str = MODEL_MAP_FILE) -> CompactModelMap:
+    try:
+        with open(file, "r", encoding="utf-8") as f:
+            return CompactModelMap(json.load(f))
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        debug.error("Model map not loaded:", e)
+        return CompactModelMap.empty()
+
+def get_model_map() -> CompactModelMap:
+    """Load the model map artifact once, on the first model lookup."""
+    global _model_map
+    if _model_map is None:
+        with _lock:
+            if _model_map is None:
+                _model_map = load_model_map()
+    return _model_map
+
+class ModelMapAttribute:
+    """
+    Class attribute that reads a field of the model map artifact on first access.
+    Assigning the attribute on the class replaces it with the new value.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        return getattr(get_model_map(), self.name)
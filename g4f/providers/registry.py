@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+import json
+import importlib
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .types import BaseProvider, ProviderType
+from .. import debug
+
+MANIFEST_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "Provider", "providers.json")
+# Modules exported by g4f.Provider in import order, None exports all public names of the module
+PROVIDER_MODULES: List[Tuple[str, Optional[List[str]]]] = [
+    ("g4f.providers.types", ["BaseProvider"]),
+    ("g4f.providers.retry_provider", ["RetryProvider", "IterListProvider"]),
+    ("g4f.providers.base_provider", ["AsyncProvider", "AsyncGeneratorProvider"]),
+    ("g4f.providers.create_images", ["CreateImagesProvider"]),
+    ("g4f.Provider.needs_auth", None),
+    ("g4f.Provider.needs_auth.hf", ["HuggingFace", "HuggingChat", "HuggingFaceAPI", "HuggingFaceInference", "HuggingFaceMedia"]),
+    ("g4f.Provider.needs_auth.mini_max", ["HailuoAI", "MiniMax"]),
+    ("g4f.Provider.template", ["OpenaiTemplate", "BackendApi"]),
+    ("g4f.Provider.har", ["HarProvider"]),
+    ("g4f.Provider.not_working", None),
+    ("g4f.Provider.local", None),
+    ("g4f.Provider.hf_space", None),
+    ("g4f.Provider.audio", None),
+    ("g4f.Provider.deprecated.ARTA", ["ARTA"]),
+] + [(f"g4f.Provider.{name}", [name]) for name in [
+    "Blackbox", "Chatai", "Cloudflare", "Copilot", "DeepInfraChat", "DuckDuckGo", "Free2GPT",
+    "ImageLabs", "LambdaChat", "LegacyLMArena", "OIVSCodeSer2", "OIVSCodeSer0501", "OperaAria",
+    "PenguinAI", "PerplexityLabs", "PollinationsAI", "PollinationsImage", "Startnest",
+    "TeachAnything", "Together", "WeWordle", "YouTube", "Yqcloud",
+]]
+
+def get_entry(provider: ProviderType) -> dict:
+    entry = {
+        "module": provider.__module__,
+        "parent": getattr(provider, "parent", None),
+        "label": getattr(provider, "label", None),
+        "working": provider.working,
+        "needs_auth": provider.needs_auth,
+        "supports_stream": provider.supports_stream,
+        "active_by_default": provider.active_by_default,
+        "image": bool(getattr(provider, "image_models", None)),
+    }
+    return {key: value for key, value in entry.items() if value is not None}
+
+def create_manifest() -> Dict[str, dict]:
+    """Import all provider modules and describe the exported providers."""
+    providers = {}
+    for module_name, names in PROVIDER_MODULES:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            debug.error(f"Providers of {module_name} not loaded:", e)
+            continue
+        if names is None:
+            names = getattr(module, "__all__", [name for name in dir(module) if not name.startswith("_")])
+        for name in names:
+            provider = getattr(module, name, None)
+            if isinstance(provider, type) and issubclass(provider, BaseProvider) and provider.__name__ == name:
+                providers[name] = provider
+    return {name: get_entry(providers[name]) for name in sorted(providers)}
+
+def update_manifest(file: str = MANIFEST_FILE) -> Dict[str, dict]:
+    """Write the manifest of g4f.Provider, run it after adding or changing a provider."""
+    manifest = create_manifest()
+    with open(file, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(",\n".join(f"{json.dumps(name)}: {json.dumps(entry)}" for name, entry in manifest.items()))
+        f.write("\n}\n")
+    return manifest
+
+def load_manifest(file: str = MANIFEST_FILE) -> Dict[str, dict]:
+    try:
+        with open(file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        debug.error("Provider manifest not loaded:", e)
+        return create_manifest()
+
+class LazyProviderMap(MutableMapping):
+    """
+    Providers by name, imported on first access.
+
+    The names and flags come from a static manifest, so listing or filtering
+    providers does not import them. Assigned providers are kept as they are.
+    """
+
+    def __init__(self, manifest: Dict[str, dict]) -> None:
+        self.manifest = manifest
+        self.names: Dict[str, None] = dict.fromkeys(manifest)
+        self.providers: Dict[str, ProviderType] = {}
+
+    def load(self, name: str) -> ProviderType:
+        entry = self.manifest[name]
+        try:
+            provider = getattr(importlib.import_module(entry["module"]), name)
+        except (ImportError, AttributeError) as e:
+            debug.error(f"Provider {name} not loaded:", e)
+            self.names.pop(name, None)
+            raise KeyError(name) from e
+        self.providers[name] = provider
+        return provider
+
+    def load_all(self) -> None:
+        for name in list(self.names):
+            if name not in self.providers:
+                try:
+                    self.load(name)
+                except KeyError:
+                    pass
+
+    def get_info(self, name: str) -> dict:
+        """Return the manifest entry of a provider, or the flags of a loaded provider."""
+        if name in self.providers:
+            return get_entry(self.providers[name])
+        return self.manifest[name]
+
+    def get_names(self, **flags) -> List[str]:
+        """Return the names of the providers with the given flags, for example ``working=True``."""
+        return [
+            name for name in self.names
+            if all(self.get_info(name).get(key, False) == value for key, value in flags.items())
+        ]
+
+    def __getitem__(self, name: str) -> ProviderType:
+        if name in self.providers:
+            return self.providers[name]
+        if name not in self.names:
+            raise KeyError(name)
+        return self.load(name)
+
+    def __setitem__(self, name: str, provider: ProviderType) -> None:
+        self.names[name] = None
+        self.providers[name] = provider
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self.names:
+            raise KeyError(name)
+        del self.names[name]
+        self.providers.pop(name, None)
+
+    def __contains__(self, name) -> bool:
+        return name in self.names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.names))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def items(self) -> List[Tuple[str, ProviderType]]:
+        self.load_all()
+        return [(name, self.providers[name]) for name in self.names]
+
+    def values(self) -> List[ProviderType]:
+        return [provider for _, provider in self.items()]
+
+    def copy(self) -> Dict[str, ProviderType]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.names)})"
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import time
 import random
+import asyncio
 
 from ..typing import Type, List, CreateResult, Messages, AsyncResult
 from .types import BaseProvider, BaseRetryProvider, ProviderType
 from .response import ProviderInfo, JsonConversation, is_content
+from .scoring import ProviderScorer, default_scorer
+from .circuit_breaker import CircuitBreaker, default_breaker
 from .. import debug
 from ..tools.run_tools import AuthManager
 from ..errors import RetryProviderError, RetryNoProviderError, MissingAuthError, NoValidHarFileError
@@ -13,18 +17,28 @@ class IterListProvider(BaseRetryProvider):
     def __init__(
         self,
         providers: List[Type[BaseProvider]] = [],
-        shuffle: bool = True
+        shuffle: bool = True,
+        scorer: ProviderScorer = None,
+        hedge_delay: float = None,
+        max_hedged: int = 2,
+        breaker: CircuitBreaker = None
     ) -> None:
         """
         Initialize the BaseRetryProvider.
         Args:
             providers (List[Type[BaseProvider]]): List of providers to use.
-            shuffle (bool): Whether to shuffle the providers list.
-            single_provider_retry (bool): Whether to retry a single provider if it fails.
-            max_retries (int): Maximum number of retries for a single provider.
+            shuffle (bool): Whether to order the providers list by their score.
+            scorer (ProviderScorer): Scorer for the providers, defaults to the shared scorer.
+            hedge_delay (float): Enables hedged requests: seconds to wait for content before starting the next provider.
+            max_hedged (int): Maximum number of providers running at the same time in hedged mode.
+            breaker (CircuitBreaker): Circuit breaker for the providers, defaults to the shared breaker.
         """
         self.providers = providers
         self.shuffle = shuffle
+        self.scorer = default_scorer if scorer is None else scorer
+        self.hedge_delay = hedge_delay
+        self.max_hedged = max_hedged
+        self.breaker = default_breaker if breaker is None else breaker
         self.working = True
         self.last_provider: Type[BaseProvider] = None
 
@@ -48,7 +62,7 @@ class IterListProvider(BaseRetryProvider):
         """
         exceptions = {}
         started: bool = False
-        for provider in self.get_providers(ignored):
+        for provider in self.get_providers(ignored, model):
             self.last_provider = provider
             alias = model
             if not model:
@@ -66,6 +80,7 @@ class IterListProvider(BaseRetryProvider):
                 api_key = AuthManager.load_api_key(provider)
             if api_key:
                 extra_body["api_key"] = api_key
+            tracker = ResponseTracker(self.scorer, self.breaker, provider, model)
             try:
                 response = provider.create_function(alias, messages, **extra_body)
                 for chunk in response:
@@ -73,14 +88,21 @@ class IterListProvider(BaseRetryProvider):
                         yield chunk
                         if is_content(chunk):
                             started = True
+                            tracker.add_chunk(chunk)
                 if started:
+                    tracker.success()
                     return
+                tracker.error()
             except Exception as e:
+                tracker.error(e)
                 exceptions[provider.__name__] = e
                 debug.error(f"{provider.__name__}:", e)
                 if started:
                     raise e
                 yield e
+            finally:
+                # The consumer stopped the generator
+                tracker.cancel()
 
         raise_exceptions(exceptions)
 
@@ -91,32 +113,30 @@ class IterListProvider(BaseRetryProvider):
         ignored: list[str] = [],
         api_key: str = None,
         conversation: JsonConversation = None,
+        hedge_delay: float = None,
+        max_hedged: int = None,
         **kwargs
     ) -> AsyncResult:
+        hedge_delay = self.hedge_delay if hedge_delay is None else hedge_delay
+        if hedge_delay is not None:
+            async for chunk in self.create_hedged_generator(
+                model, messages, ignored, api_key, conversation,
+                hedge_delay=hedge_delay,
+                max_hedged=self.max_hedged if max_hedged is None else max_hedged,
+                **kwargs
+            ):
+                yield chunk
+            return
+
         exceptions = {}
         started: bool = False
 
-        for provider in self.get_providers(ignored):
+        for provider in self.get_providers(ignored, model):
             self.last_provider = provider
-            alias = model
-            if not model:
-                alias = getattr(provider, "default_model", None)
-            if hasattr(provider, "model_aliases"):
-                alias = provider.model_aliases.get(model, model)
-            if isinstance(alias, list):
-                alias = random.choice(alias)
+            alias, extra_body = self.get_request_args(provider, model, api_key, conversation, kwargs)
             debug.log(f"Using {provider.__name__} provider with model {alias}")
             yield ProviderInfo(**provider.get_dict(), model=alias)
-            extra_body = kwargs.copy()
-            current_provider_api_key = None
-            if isinstance(api_key, dict):
-                current_provider_api_key = api_key.get(provider.get_parent())
-            if not api_key:
-                current_provider_api_key = AuthManager.load_api_key(provider)
-            if current_provider_api_key:
-                extra_body["api_key"] = current_provider_api_key
-            if conversation is not None and hasattr(conversation, provider.__name__):
-                extra_body["conversation"] = JsonConversation(**getattr(conversation, provider.__name__))
+            tracker = ResponseTracker(self.scorer, self.breaker, provider, model)
             try:
                 response = provider.async_create_function(model, messages, **extra_body)
                 if hasattr(response, "__aiter__"):
@@ -130,30 +150,233 @@ class IterListProvider(BaseRetryProvider):
                             yield chunk
                             if is_content(chunk):
                                 started = True
+                                tracker.add_chunk(chunk)
                 elif response:
                     response = await response
                     if response:
                         yield response
                         started = True
+                        tracker.add_chunk(response)
                 if started:
+                    tracker.success()
                     return
+                tracker.error()
             except Exception as e:
+                tracker.error(e)
                 exceptions[provider.__name__] = e
                 debug.error(f"{provider.__name__}:", e)
                 if started:
                     raise e
                 yield e
+            finally:
+                # The consumer stopped the generator
+                tracker.cancel()
+
+        raise_exceptions(exceptions)
+
+    async def create_hedged_generator(
+        self,
+        model: str,
+        messages: Messages,
+        ignored: list[str] = [],
+        api_key: str = None,
+        conversation: JsonConversation = None,
+        hedge_delay: float = 1.0,
+        max_hedged: int = 2,
+        **kwargs
+    ) -> AsyncResult:
+        """
+        Start the next provider in parallel if no content arrives within the hedge delay.
+        The first provider with a content chunk wins, the other requests are cancelled.
+        Args:
+            hedge_delay (float): Seconds to wait for content before starting the next provider.
+            max_hedged (int): Maximum number of providers running at the same time.
+        """
+        pending = self.get_providers(ignored, model)
+        queue = asyncio.Queue()
+        tasks: dict[str, asyncio.Task] = {}
+        active: set[str] = set()
+        aliases: dict[str, str] = {}
+        buffers: dict[str, list] = {}
+        trackers: dict[str, ResponseTracker] = {}
+        exceptions = {}
+        winner = None
+        next_hedge = 0
+
+        async def pump(provider: ProviderType, extra_body: dict):
+            try:
+                response = provider.async_create_function(model, messages, **extra_body)
+                if hasattr(response, "__aiter__"):
+                    async for chunk in response:
+                        await queue.put((provider, "chunk", chunk))
+                elif response:
+                    await queue.put((provider, "chunk", await response))
+            except Exception as e:
+                await queue.put((provider, "error", e))
+            else:
+                await queue.put((provider, "done", None))
+
+        def start_next():
+            nonlocal next_hedge
+            provider = pending.pop(0)
+            aliases[provider.__name__], extra_body = self.get_request_args(provider, model, api_key, conversation, kwargs)
+            debug.log(f"Using {provider.__name__} provider with model {aliases[provider.__name__]} (hedged)")
+            buffers[provider.__name__] = []
+            trackers[provider.__name__] = ResponseTracker(self.scorer, self.breaker, provider, model)
+            tasks[provider.__name__] = asyncio.create_task(pump(provider, extra_body))
+            active.add(provider.__name__)
+            next_hedge = time.time() + hedge_delay
+
+        def set_conversation(provider: ProviderType, chunk):
+            nonlocal conversation
+            if isinstance(chunk, JsonConversation):
+                if conversation is None:
+                    conversation = JsonConversation()
+                setattr(conversation, provider.__name__, chunk.get_dict())
+                return conversation
+            return chunk
+
+        try:
+            if pending:
+                start_next()
+            while tasks:
+                timeout = None
+                if winner is None and pending and len(active) < max_hedged:
+                    timeout = max(0, next_hedge - time.time())
+                try:
+                    provider, kind, value = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    start_next()
+                    continue
+                name = provider.__name__
+                if winner is not None and provider is not winner:
+                    continue
+                if kind == "chunk":
+                    if not value:
+                        continue
+                    if winner is not None:
+                        yield set_conversation(provider, value)
+                        if is_content(value):
+                            trackers[name].add_chunk(value)
+                    elif is_content(value):
+                        winner = provider
+                        self.last_provider = provider
+                        for other, task in tasks.items():
+                            if other != name:
+                                task.cancel()
+                        yield ProviderInfo(**provider.get_dict(), model=aliases[name], hedged=list(tasks.keys()))
+                        for chunk in buffers.pop(name):
+                            yield set_conversation(provider, chunk)
+                        trackers[name].add_chunk(value)
+                        yield value
+                    else:
+                        buffers[name].append(value)
+                    continue
+                if provider is winner:
+                    if kind == "error":
+                        trackers[name].error(value)
+                        raise value
+                    trackers[name].success()
+                    return
+                active.discard(name)
+                trackers[name].error(value)
+                if kind == "error":
+                    exceptions[name] = value
+                    debug.error(f"{name}:", value)
+                if pending and len(active) < max_hedged:
+                    start_next()
+                elif not active:
+                    break
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for tracker in trackers.values():
+                tracker.cancel()
 
         raise_exceptions(exceptions)
 
     create_function = create_completion
     async_create_function = create_async_generator
 
-    def get_providers(self, ignored: list[str]) -> list[ProviderType]:
+    def get_request_args(
+        self,
+        provider: ProviderType,
+        model: str,
+        api_key: str,
+        conversation: JsonConversation,
+        kwargs: dict
+    ) -> tuple[str, dict]:
+        alias = model
+        if not model:
+            alias = getattr(provider, "default_model", None)
+        if hasattr(provider, "model_aliases"):
+            alias = provider.model_aliases.get(model, model)
+        if isinstance(alias, list):
+            alias = random.choice(alias)
+        extra_body = kwargs.copy()
+        current_provider_api_key = None
+        if isinstance(api_key, dict):
+            current_provider_api_key = api_key.get(provider.get_parent())
+        if not api_key:
+            current_provider_api_key = AuthManager.load_api_key(provider)
+        if current_provider_api_key:
+            extra_body["api_key"] = current_provider_api_key
+        if conversation is not None and hasattr(conversation, provider.__name__):
+            extra_body["conversation"] = JsonConversation(**getattr(conversation, provider.__name__))
+        return alias, extra_body
+
+    def get_providers(self, ignored: list[str], model: str = None) -> list[ProviderType]:
         providers = [p for p in self.providers if p.__name__ not in ignored]
         if self.shuffle:
-            random.shuffle(providers)
-        return providers
+            providers = self.scorer.order(providers, model)
+        # Providers with an open circuit are only tried as last resort
+        allowed = [p for p in providers if self.breaker.allow(p.__name__, model)]
+        return allowed + [p for p in providers if p not in allowed]
+
+class ResponseTracker:
+    """Measures a single provider response and reports it to the scorer."""
+
+    def __init__(self, scorer: ProviderScorer, breaker: CircuitBreaker, provider: ProviderType, model: str) -> None:
+        self.scorer = scorer
+        self.breaker = breaker
+        self.provider = provider.__name__
+        self.model = model
+        self.start = time.time()
+        self.first_chunk: float = None
+        self.tokens = 0
+        self.done = False
+        # The request is sent now, it is the trial of a half-open circuit
+        self.breaker.claim(self.provider, self.model)
+
+    def add_chunk(self, chunk) -> None:
+        if self.first_chunk is None:
+            self.first_chunk = time.time()
+        if isinstance(chunk, str):
+            self.tokens += 1
+
+    def success(self) -> None:
+        self.done = True
+        first_chunk = self.first_chunk or time.time()
+        self.scorer.record_success(
+            self.provider,
+            self.model,
+            ttft=first_chunk - self.start,
+            tokens=self.tokens,
+            duration=time.time() - first_chunk
+        )
+        self.breaker.record_success(self.provider, self.model)
+
+    def error(self, exception: Exception = None) -> None:
+        self.done = True
+        self.scorer.record_error(self.provider, self.model)
+        self.breaker.record_failure(self.provider, self.model, exception)
+
+    def cancel(self) -> None:
+        """Release the trial of a request that was stopped before it succeeded or failed."""
+        if not self.done:
+            self.done = True
+            self.breaker.release(self.provider, self.model)
 
 class RetryProvider(IterListProvider):
     def __init__(
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+import random
+import threading
+from typing import Optional, Dict, List
+
+from .types import ProviderType
+
+class ProviderStats:
+    """
+    Rolling statistics for a provider and model.
+
+    Attributes:
+        ttft (float): Exponential moving average of the time to first token in seconds.
+        tokens_per_second (float): Exponential moving average of the streaming throughput.
+        error_rate (float): Exponential moving average of failed requests (0.0 - 1.0).
+        requests (int): Total number of recorded requests.
+        errors (int): Total number of recorded errors.
+        last_used (float): Timestamp of the last recorded request.
+    """
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        self.alpha = alpha
+        self.ttft: Optional[float] = None
+        self.tokens_per_second: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.requests: int = 0
+        self.errors: int = 0
+        self.last_used: float = 0
+
+    def _average(self, current: Optional[float], value: float) -> float:
+        if current is None:
+            return value
+        return (1 - self.alpha) * current + self.alpha * value
+
+    def add_success(self, ttft: float, tokens: int = 0, duration: float = 0) -> None:
+        self.requests += 1
+        self.last_used = time.time()
+        self.ttft = self._average(self.ttft, ttft)
+        if tokens and duration > 0:
+            self.tokens_per_second = self._average(self.tokens_per_second, tokens / duration)
+        self.error_rate = self._average(self.error_rate, 0.0)
+
+    def add_error(self) -> None:
+        self.requests += 1
+        self.errors += 1
+        self.last_used = time.time()
+        self.error_rate = self._average(self.error_rate, 1.0)
+
+    def get_dict(self) -> Dict[str, float]:
+        return {
+            "ttft": self.ttft,
+            "tokens_per_second": self.tokens_per_second,
+            "error_rate": self.error_rate,
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_used": self.last_used,
+        }
+
+class ProviderScorer:
+    """
+    Orders providers by their observed latency, throughput and error rate.
+
+    Lower scores are better. Providers without statistics get the best known
+    score, so new or recovered providers are tried. A share of requests
+    (``exploration``) moves a random provider to the front of the list.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        exploration: float = 0.1,
+        error_penalty: float = 30.0,
+        throughput_weight: float = 5.0
+    ) -> None:
+        """
+        Args:
+            alpha (float): Smoothing factor of the moving averages.
+            exploration (float): Probability to try a random provider first.
+            error_penalty (float): Seconds added to the score for a error rate of 1.0.
+            throughput_weight (float): Weight of the throughput in the score.
+        """
+        self.alpha = alpha
+        self.exploration = exploration
+        self.error_penalty = error_penalty
+        self.throughput_weight = throughput_weight
+        self.stats: Dict[str, Dict[str, ProviderStats]] = {}
+        self.lock = threading.Lock()
+
+    def get(self, provider: str, model: str = None) -> Optional[ProviderStats]:
+        """Get the statistics of a provider for a model or for all models."""
+        return self.stats.get(provider, {}).get(model or "")
+
+    def _get_or_create(self, provider: str, model: str = None) -> List[ProviderStats]:
+        models = self.stats.setdefault(provider, {})
+        keys = {"", model or ""}
+        return [models.setdefault(key, ProviderStats(self.alpha)) for key in keys]
+
+    def record_success(self, provider: str, model: str = None, ttft: float = 0, tokens: int = 0, duration: float = 0) -> None:
+        with self.lock:
+            for stats in self._get_or_create(provider, model):
+                stats.add_success(ttft, tokens, duration)
+
+    def record_error(self, provider: str, model: str = None) -> None:
+        with self.lock:
+            for stats in self._get_or_create(provider, model):
+                stats.add_error()
+
+    def score(self, provider: str, model: str = None) -> Optional[float]:
+        """Return the score of a provider, or None if there are no statistics."""
+        stats = self.get(provider, model) or self.get(provider)
+        if stats is None or not stats.requests:
+            return None
+        score = (stats.ttft or 0) + stats.error_rate * self.error_penalty
+        if stats.tokens_per_second is not None:
+            score += self.throughput_weight / (stats.tokens_per_second + 1)
+        return score
+
+    def order(self, providers: List[ProviderType], model: str = None) -> List[ProviderType]:
+        """Return the providers sorted by score, with a random tie-breaker."""
+        scores = [self.score(provider.__name__, model) for provider in providers]
+        known = [score for score in scores if score is not None]
+        default = min(known) if known else 0
+        ordered = [provider for _, _, provider in sorted(
+            [(default if score is None else score, random.random(), provider) for score, provider in zip(scores, providers)],
+            key=lambda item: item[:2]
+        )]
+        if len(ordered) > 1 and random.random() < self.exploration:
+            ordered.insert(0, ordered.pop(random.randrange(1, len(ordered))))
+        return ordered
+
+    def get_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return the statistics of all providers, grouped by provider and model."""
+        with self.lock:
+            return {
+                provider: {model: stats.get_dict() for model, stats in models.items()}
+                for provider, models in self.stats.items()
+            }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.stats = {}
+
+default_scorer = ProviderScorer()
+
+def get_provider_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Return the statistics of the shared scorer used by IterListProvider, RetryProvider and AnyProvider."""
+    return default_scorer.get_stats()
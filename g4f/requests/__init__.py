@@ -44,6 +44,8 @@ from ..errors import MissingRequirementsError
 from ..typing import Cookies
 from ..cookies import get_cookies_dir
 from .defaults import DEFAULT_HEADERS, WEBVIEW_HAEDERS
+from .session_pool import SharedSession, SessionPool, session_pool
+from .sse import SSEDecoder, SSEEvent, aiter_events, aiter_json
 
 class BrowserConfig:
     stop_browser = lambda: None
@@ -216,15 +218,9 @@ async def get_nodriver(
     return browser, on_stop
 
 async def see_stream(iter_lines: Iterator[bytes]) -> AsyncIterator[dict]:
-    if hasattr(iter_lines, "content"):
-        iter_lines = iter_lines.content
-    elif hasattr(iter_lines, "iter_lines"):
-        iter_lines = iter_lines.iter_lines()
-    async for line in iter_lines:
-        if line.startswith(b"data: "):
-            if line[6:].startswith(b"[DONE]"):
-                break
-            yield json.loads(line[6:])
+    """Iterate over the JSON data of a Server-Sent Events response, stream reader or line iterator."""
+    async for data in aiter_json(iter_lines):
+        yield data
 
 async def iter_lines(iter_response: AsyncIterator[bytes], delimiter=None):
     """
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from aiohttp import ClientSession, ClientResponse, ClientTimeout, BaseConnector, FormData
 from typing import AsyncIterator, Any, Optional
 
 from .defaults import DEFAULT_HEADERS
+from .sse import aiter_json
 from ..errors import MissingRequirementsError
 
 class StreamResponse(ClientResponse):
@@ -21,15 +21,8 @@ class StreamResponse(ClientResponse):
 
     async def sse(self) -> AsyncIterator[dict]:
         """Asynchronously iterate over the Server-Sent Events of the response."""
-        async for line in self.content:
-            if line.startswith(b"data: "):
-                chunk = line[6:]
-                if chunk.startswith(b"[DONE]"):
-                    break
-                try:
-                    yield json.loads(chunk)
-                except json.JSONDecodeError:
-                    continue
+        async for data in aiter_json(self, ignore_errors=True):
+            yield data
 
 class StreamSession():
     def __init__(
@@ -15,6 +15,8 @@ from typing import AsyncGenerator, Any
 from functools import partialmethod
 import json
 
+from .sse import aiter_json
+
 class StreamResponse:
     """
     A wrapper class for handling asynchronous streaming responses.
@@ -49,15 +51,8 @@ class StreamResponse:
 
     async def sse(self) -> AsyncGenerator[dict, None]:
         """Asynchronously iterate over the Server-Sent Events of the response."""
-        async for line in self.iter_lines():
-            if line.startswith(b"data: "):
-                chunk = line[6:]
-                if chunk == b"[DONE]":
-                    break
-                try:
-                    yield json.loads(chunk)
-                except json.JSONDecodeError:
-                    continue
+        async for data in aiter_json(self, ignore_errors=True):
+            yield data
 
     async def __aenter__(self):
         """Asynchronously enter the runtime context for the response object."""
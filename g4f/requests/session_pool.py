@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import time
+import asyncio
+from http.cookiejar import CookieJar
+from functools import partialmethod
+from urllib.parse import urlparse
+from typing import Dict, Optional, Tuple
+
+try:
+    from .curl_cffi import StreamSession, StreamResponse
+    has_curl_cffi = True
+except ImportError:
+    from aiohttp import TCPConnector, ClientTimeout, DummyCookieJar
+    from .aiohttp import StreamSession, StreamResponse, get_connector
+    has_curl_cffi = False
+from .. import debug
+
+class NoCookieJar(CookieJar):
+    """
+    Cookie jar that stores nothing, like aiohttp's DummyCookieJar.
+    Concurrent requests share a pooled session, so cookies of a response must not be sent with the others.
+    Cookies passed to a request are still sent with it.
+    """
+
+    def set_cookie(self, cookie) -> None:
+        pass
+
+    def extract_cookies(self, response, request) -> None:
+        pass
+
+class PooledSession:
+    """A session of the pool with its usage counters."""
+
+    def __init__(self, session: StreamSession, loop: asyncio.AbstractEventLoop) -> None:
+        self.session = session
+        self.loop = loop
+        self.inner = None
+        self.opening: Optional[asyncio.Task] = None
+        self.in_use = 0
+        self.last_used = time.time()
+
+    async def open(self) -> None:
+        self.inner = await self.session.__aenter__()
+
+    async def close(self) -> None:
+        try:
+            await self.session.__aexit__(None, None, None)
+        except Exception as e:
+            debug.error("Failed to close pooled session:", e)
+
+class SessionPool:
+    """
+    Process-wide registry of keep-alive sessions.
+
+    Sessions are keyed by event loop, proxy, impersonate profile and host.
+    They stay open between requests and are closed after ``idle_timeout`` seconds without use.
+    A guard task on each loop closes its sessions when the loop shuts down, because
+    ``asyncio.run`` and ``to_sync_generator`` cancel the remaining tasks before closing the loop.
+    """
+
+    def __init__(self, idle_timeout: float = 120, limit_per_host: int = 10) -> None:
+        """
+        Args:
+            idle_timeout (float): Seconds before an unused session is closed.
+            limit_per_host (int): Maximum number of connections of a session.
+        """
+        self.idle_timeout = idle_timeout
+        self.limit_per_host = limit_per_host
+        self.sessions: Dict[Tuple, PooledSession] = {}
+        self.guards: Dict[int, asyncio.Task] = {}
+
+    @staticmethod
+    def get_key(base_url: str, proxy: str = None, impersonate: str = None) -> Tuple:
+        return (id(asyncio.get_running_loop()), proxy, impersonate, urlparse(base_url).netloc)
+
+    def create_session(self, proxy: str = None, impersonate: str = None) -> StreamSession:
+        # Don't share cookies between requests
+        if has_curl_cffi:
+            return StreamSession(proxy=proxy, impersonate=impersonate, max_clients=self.limit_per_host, cookies=NoCookieJar())
+        connector = None
+        if proxy is None:
+            connector = TCPConnector(limit_per_host=self.limit_per_host, keepalive_timeout=self.idle_timeout)
+        else:
+            connector = get_connector(None, proxy)
+        return StreamSession(connector=connector, impersonate=impersonate, cookie_jar=DummyCookieJar())
+
+    async def acquire(self, base_url: str, proxy: str = None, impersonate: str = None) -> PooledSession:
+        loop = asyncio.get_running_loop()
+        key = self.get_key(base_url, proxy, impersonate)
+        pooled = self.sessions.get(key)
+        if pooled is None or pooled.loop is not loop:
+            if id(loop) not in self.guards:
+                self.guards[id(loop)] = loop.create_task(self.guard(loop))
+            pooled = PooledSession(self.create_session(proxy, impersonate), loop)
+            # Concurrent requests wait for the same session to open
+            pooled.opening = loop.create_task(pooled.open())
+            self.sessions[key] = pooled
+        pooled.in_use += 1
+        if pooled.inner is None:
+            try:
+                # A cancelled request must not cancel the opening for the others
+                await asyncio.shield(pooled.opening)
+            except BaseException:
+                pooled.in_use -= 1
+                if pooled.opening.done() and self.sessions.get(key) is pooled:
+                    del self.sessions[key]
+                raise
+        await self.evict_idle()
+        return pooled
+
+    def release(self, pooled: PooledSession) -> None:
+        pooled.in_use -= 1
+        pooled.last_used = time.time()
+
+    async def guard(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wait until the loop cancels its tasks on shutdown, then close the sessions of the loop."""
+        try:
+            await loop.create_future()
+        except asyncio.CancelledError:
+            await self.close()
+            raise
+        finally:
+            self.guards.pop(id(loop), None)
+
+    async def evict_idle(self) -> None:
+        """Close sessions that are unused for ``idle_timeout`` and drop sessions of closed loops."""
+        now = time.time()
+        loop = asyncio.get_running_loop()
+        for key, pooled in list(self.sessions.items()):
+            if pooled.loop.is_closed():
+                # The loop was closed without cancelling its tasks, the session can't be closed anymore
+                debug.error("Dropped pooled session of a closed event loop")
+                del self.sessions[key]
+            elif pooled.loop is loop and not pooled.in_use and now - pooled.last_used > self.idle_timeout:
+                del self.sessions[key]
+                await pooled.close()
+
+    async def close(self) -> None:
+        """Close all sessions of the running event loop."""
+        loop = asyncio.get_running_loop()
+        for key, pooled in list(self.sessions.items()):
+            if pooled.loop is loop or pooled.loop.is_closed():
+                del self.sessions[key]
+                if pooled.loop is loop:
+                    await pooled.close()
+
+session_pool = SessionPool()
+
+class SharedSession():
+    """
+    Drop-in replacement for ``StreamSession`` that borrows a warm session from the pool.
+    Headers and timeout are sent with every request instead of being stored in the session.
+
+    Example:
+        async with SharedSession(api_base, headers=headers, timeout=timeout) as session:
+            async with session.post(url, json=data) as response:
+                ...
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict = None,
+        timeout: int = None,
+        proxy: str = None,
+        impersonate: str = None,
+        pool: SessionPool = None
+    ) -> None:
+        self.base_url = base_url
+        self.headers = {} if headers is None else headers
+        self.timeout = timeout
+        self.proxy = proxy
+        self.impersonate = impersonate
+        self.pool = session_pool if pool is None else pool
+        self.pooled: PooledSession = None
+
+    async def __aenter__(self) -> SharedSession:
+        self.pooled = await self.pool.acquire(self.base_url, self.proxy, self.impersonate)
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.pool.release(self.pooled)
+
+    def request(self, method: str, url: str, headers: dict = None, timeout: int = None, **kwargs) -> StreamResponse:
+        timeout = self.timeout if timeout is None else timeout
+        if timeout is not None:
+            if not has_curl_cffi:
+                timeout = ClientTimeout(*timeout[::-1]) if isinstance(timeout, tuple) else ClientTimeout(timeout)
+            kwargs["timeout"] = timeout
+        return self.pooled.inner.request(
+            method,
+            url,
+            headers={**self.headers, **({} if headers is None else headers)},
+            **kwargs
+        )
+
+    head = partialmethod(request, "HEAD")
+    get = partialmethod(request, "GET")
+    post = partialmethod(request, "POST")
+    put = partialmethod(request, "PUT")
+    patch = partialmethod(request, "PATCH")
+    delete = partialmethod(request, "DELETE")
+    options = partialmethod(request, "OPTIONS")
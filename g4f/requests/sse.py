@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import re
+import json
+from typing import AsyncIterator, Iterator, List, Optional, Union
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSONDecodeError = (orjson.JSONDecodeError, ValueError)
+except ImportError:
+    try:
+        import msgspec
+        json_loads = msgspec.json.decode
+        JSONDecodeError = (msgspec.DecodeError, ValueError)
+    except ImportError:
+        json_loads = json.loads
+        JSONDecodeError = (json.JSONDecodeError, ValueError)
+
+LINE_END = re.compile(rb"\r\n|\r|\n")
+
+class SSEEvent:
+    """
+    A dispatched Server-Sent Event.
+
+    Attributes:
+        event (str): The event type, "message" by default.
+        data (bytes): The data lines of the event joined with "\\n".
+        id (str): The last event id.
+        retry (int): The reconnection time in milliseconds, if set.
+        parsed: The JSON data, if it was already decoded.
+    """
+    __slots__ = ("event", "data", "id", "retry", "parsed")
+
+    def __init__(self, data: bytes, event: str = "message", id: str = None, retry: int = None, parsed=None) -> None:
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+        self.parsed = parsed
+
+    def json(self):
+        if self.parsed is None:
+            self.parsed = json_loads(self.data)
+        return self.parsed
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(event={self.event!r}, data={self.data!r}, id={self.id!r})"
+
+class SSEDecoder:
+    """
+    Incremental decoder for the Server-Sent Events stream format.
+
+    Bytes are buffered until a line ends, and events are dispatched on empty lines.
+    Supports ``data``, ``event``, ``id`` and ``retry`` fields, comments, multi-line
+    data and "\\r\\n", "\\r" and "\\n" line endings, also when split between chunks.
+    Some providers send one JSON document per ``data`` line without empty lines.
+    Until the first empty line is received, a ``data`` line that completes a JSON
+    document is dispatched at once, with the decoded document.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.data: List[bytes] = []
+        self.event: Optional[str] = None
+        self.last_id: Optional[str] = None
+        self.retry: Optional[int] = None
+        self.skip_lf = False
+        # Set on the first empty line, the stream delimits its events
+        self.delimited = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Add raw bytes and return the completed events."""
+        if self.skip_lf and chunk[:1] == b"\n":
+            chunk = chunk[1:]
+        self.skip_lf = False
+        buffer = self.buffer
+        buffer += chunk
+        events = []
+        start = 0
+        size = len(buffer)
+        with memoryview(buffer) as view:
+            while start < size:
+                match = LINE_END.search(buffer, start)
+                if match is None:
+                    break
+                end = match.start()
+                # A "\r" at the end of the buffer can be the first part of "\r\n"
+                if match.end() == size and match.end() - end == 1 and buffer[end] == 13:
+                    self.skip_lf = True
+                event = self.feed_line(view[start:end])
+                if event is not None:
+                    events.append(event)
+                start = match.end()
+        if start:
+            del buffer[:start]
+        return events
+
+    def feed_line(self, line: Union[bytes, bytearray, memoryview]) -> Optional[SSEEvent]:
+        """Process one line without line ending and return an event if one is completed."""
+        if not line:
+            self.delimited = True
+            return self.dispatch()
+        if line[:6] == b"data: ":
+            self.data.append(bytes(line[6:]))
+            return None if self.delimited else self.dispatch_json()
+        if line[:1] == b":":
+            return None
+        field, sep, value = bytes(line).partition(b":")
+        if sep and value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self.data.append(value)
+            return None if self.delimited else self.dispatch_json()
+        elif field == b"event":
+            self.event = value.decode(errors="replace")
+        elif field == b"id":
+            if b"\0" not in value:
+                self.last_id = value.decode(errors="replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self.retry = int(value)
+        return None
+
+    def dispatch(self, parsed=None) -> Optional[SSEEvent]:
+        if not self.data:
+            self.event = None
+            return None
+        data = self.data[0] if len(self.data) == 1 else b"\n".join(self.data)
+        event = SSEEvent(data, self.event or "message", self.last_id, self.retry, parsed)
+        self.data = []
+        self.event = None
+        return event
+
+    def dispatch_json(self) -> Optional[SSEEvent]:
+        """Dispatch the pending data if it is a complete JSON document."""
+        if not self.data:
+            return None
+        data = self.data[0] if len(self.data) == 1 else b"\n".join(self.data)
+        if data[:1] not in (b"{", b"["):
+            return None
+        try:
+            parsed = json_loads(data)
+        except JSONDecodeError:
+            return None
+        return self.dispatch(parsed)
+
+    def close(self) -> List[SSEEvent]:
+        """Dispatch the pending data of a stream that ends without an empty line."""
+        events = []
+        if self.buffer:
+            event = self.feed_line(self.buffer)
+            self.buffer = bytearray()
+            if event is not None:
+                events.append(event)
+        event = self.dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+def iter_events(chunks: Iterator[bytes]) -> Iterator[SSEEvent]:
+    """Decode the events of a synchronous byte stream."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+async def aiter_events(response) -> AsyncIterator[SSEEvent]:
+    """
+    Decode the events of a response.
+
+    Accepts a response with ``iter_content``, a aiohttp ``StreamReader`` or
+    an async iterator over lines without line endings.
+    """
+    decoder = SSEDecoder()
+    if hasattr(response, "iter_content"):
+        chunks = response.iter_content()
+    elif hasattr(response, "content") and hasattr(response.content, "iter_any"):
+        chunks = response.content.iter_any()
+    elif hasattr(response, "iter_any"):
+        chunks = response.iter_any()
+    else:
+        async for line in response:
+            event = decoder.feed_line(line.rstrip(b"\r\n"))
+            if event is not None:
+                yield event
+        for event in decoder.close():
+            yield event
+        return
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.close():
+        yield event
+
+def decode_data(data: bytes) -> list:
+    """Decode the JSON data of an event. Data with one JSON document per line is also accepted."""
+    try:
+        return [json_loads(data)]
+    except JSONDecodeError:
+        if b"\n" not in data:
+            raise
+        return [json_loads(line) for line in data.split(b"\n") if line and line[:6] != b"[DONE]"]
+
+async def aiter_json(response, ignore_errors: bool = False) -> AsyncIterator[dict]:
+    """Iterate over the JSON data of the events until "[DONE]" is received."""
+    async for event in aiter_events(response):
+        if event.data[:6] == b"[DONE]":
+            break
+        if event.parsed is not None:
+            yield event.parsed
+            continue
+        try:
+            for data in decode_data(event.data):
+                yield data
+        except JSONDecodeError:
+            if not ignore_errors:
+                raise
+        if event.data.endswith(b"\n[DONE]"):
+            break
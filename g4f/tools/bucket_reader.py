@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import os
+import mmap
+import bisect
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from .. import debug
+
+PLAIN_CACHE = "plain.cache"
+LINES_SUFFIX = ".lines"
+LINES_VERSION = 1
+# Header of a line index: version, size and mtime in nanoseconds of the indexed file
+HEADER_SIZE = 3
+CHUNK_SIZE = 64 * 1024
+# Number of offsets that are buffered while a line index is written
+FLUSH_SIZE = 64 * 1024
+
+def get_cache_files(bucket_dir: Path) -> List[Path]:
+    """Return the cache files of a bucket in reading order, the refined part if it exists, otherwise the plain one."""
+    files = []
+    cache_file = bucket_dir / PLAIN_CACHE
+    if not (bucket_dir / "spacy_0001.cache").is_file() and cache_file.is_file():
+        files.append(cache_file)
+    for idx in range(1, 1000):
+        spacy_file = bucket_dir / f"spacy_{idx:04d}.cache"
+        plain_file = bucket_dir / f"plain_{idx:04d}.cache"
+        if spacy_file.is_file():
+            files.append(spacy_file)
+        elif plain_file.is_file():
+            files.append(plain_file)
+        else:
+            break
+    return files
+
+def get_lines_file(path: Path) -> Path:
+    return path.with_name(f"{path.name}{LINES_SUFFIX}")
+
+def build_line_index(path: Path) -> Path:
+    """
+    Write the byte offsets of the line starts of a file to its ``.lines`` sidecar.
+    The file is scanned through a memory map, and only a block of offsets is kept in memory.
+    Concurrent readers write to their own temporary file and the last one replaces the sidecar.
+    """
+    stat_result = path.stat()
+    lines_file = get_lines_file(path)
+    fd, tmp_file = tempfile.mkstemp(prefix=f"{lines_file.name}.", suffix=".tmp", dir=lines_file.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            array("Q", [LINES_VERSION, stat_result.st_size, stat_result.st_mtime_ns]).tofile(f)
+            if stat_result.st_size:
+                with path.open("rb") as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    offsets = array("Q", [0])
+                    position = data.find(b"\n")
+                    while position != -1 and position + 1 < stat_result.st_size:
+                        offsets.append(position + 1)
+                        if len(offsets) >= FLUSH_SIZE:
+                            offsets.tofile(f)
+                            offsets = array("Q")
+                        position = data.find(b"\n", position + 1)
+                    offsets.tofile(f)
+        os.replace(tmp_file, lines_file)
+    except BaseException:
+        Path(tmp_file).unlink(missing_ok=True)
+        raise
+    return lines_file
+
+def is_index_valid(lines_file: Path, stat_result: os.stat_result) -> bool:
+    try:
+        with lines_file.open("rb") as f:
+            header = array("Q")
+            header.fromfile(f, HEADER_SIZE)
+    except (OSError, EOFError):
+        return False
+    return list(header) == [LINES_VERSION, stat_result.st_size, stat_result.st_mtime_ns]
+
+class CacheFile:
+    """A memory-mapped cache file with its line offsets."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        stat_result = path.stat()
+        self.size = stat_result.st_size
+        lines_file = get_lines_file(path)
+        if not is_index_valid(lines_file, stat_result):
+            build_line_index(path)
+        self.file = path.open("rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.lines = lines_file.open("rb")
+        self.index = mmap.mmap(self.lines.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = [memoryview(self.index)]
+        self.views.append(self.views[0].cast("Q"))
+        self.offsets = self.views[1][HEADER_SIZE:]
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets)
+
+    def get_line_offset(self, line: int) -> int:
+        return self.offsets[line] if line < len(self.offsets) else self.size
+
+    def close(self) -> None:
+        self.offsets.release()
+        for view in reversed(self.views):
+            view.release()
+        self.index.close()
+        self.lines.close()
+        if self.data is not None:
+            self.data.close()
+        self.file.close()
+
+class BucketReader:
+    """
+    Reads byte and line ranges of the cached text of a bucket without loading it.
+
+    The cache files are memory mapped and read as one text. Line numbers are looked up in
+    precomputed ``.lines`` sidecars, so any page of a large bucket is read in constant memory.
+    Ranges are moved to UTF-8 character boundaries.
+
+    Example:
+        with BucketReader(bucket_dir) as reader:
+            text, end = reader.read(offset, 65536)
+    """
+
+    def __init__(self, bucket_dir: Path) -> None:
+        self.files: List[CacheFile] = []
+        try:
+            for path in get_cache_files(Path(bucket_dir)):
+                self.files.append(CacheFile(path))
+        except BaseException:
+            self.close()
+            raise
+        self.starts = []
+        self.line_starts = []
+        size = lines = 0
+        for cache_file in self.files:
+            self.starts.append(size)
+            self.line_starts.append(lines)
+            size += cache_file.size
+            lines += cache_file.line_count
+        self.size = size
+        self.line_count = lines
+
+    def __enter__(self) -> BucketReader:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for cache_file in self.files:
+            try:
+                cache_file.close()
+            except (OSError, BufferError) as e:
+                debug.error(f"Bucket reader: Failed to close {cache_file.path.name}:", e)
+        self.files = []
+
+    def get_byte(self, position: int) -> int:
+        index = bisect.bisect_right(self.starts, position) - 1
+        return self.files[index].data[position - self.starts[index]]
+
+    def align(self, position: int) -> int:
+        """Move a position back to the start of a UTF-8 character."""
+        while 0 < position < self.size and self.get_byte(position) & 0xC0 == 0x80:
+            position -= 1
+        return position
+
+    def read_bytes(self, start: int, end: int) -> bytes:
+        parts = []
+        index = max(0, bisect.bisect_right(self.starts, start) - 1)
+        while start < end and index < len(self.files):
+            cache_file = self.files[index]
+            offset = self.starts[index]
+            if cache_file.size and start < offset + cache_file.size:
+                stop = min(end, offset + cache_file.size)
+                parts.append(cache_file.data[start - offset:stop - offset])
+                start = stop
+            index += 1
+        return b"".join(parts)
+
+    def read(self, offset: int = 0, length: int = CHUNK_SIZE) -> Tuple[str, int]:
+        """Read about ``length`` bytes from ``offset``. Returns the text and the offset of the next page."""
+        start = self.align(max(0, min(offset, self.size)))
+        end = self.align(min(self.size, start + max(0, length)))
+        if end == start < self.size and length > 0:
+            # A single character is longer than the page
+            end = self.align(min(self.size, start + 4))
+        return self.read_bytes(start, end).decode(errors="replace"), end
+
+    def get_line_offset(self, line: int) -> int:
+        if line >= self.line_count:
+            return self.size
+        index = bisect.bisect_right(self.line_starts, line) - 1
+        # Skip empty files, they have no lines
+        while self.files[index].line_count <= line - self.line_starts[index]:
+            index += 1
+        return self.starts[index] + self.files[index].get_line_offset(line - self.line_starts[index])
+
+    def read_lines(self, line: int = 0, count: int = 100) -> str:
+        """Read ``count`` lines from the line number ``line``."""
+        line = max(0, line)
+        start = self.get_line_offset(line)
+        end = self.get_line_offset(line + max(0, count))
+        return self.read_bytes(start, end).decode(errors="replace")
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        """Yield the whole text in chunks of about ``chunk_size`` bytes."""
+        offset = 0
+        while offset < self.size:
+            text, offset = self.read(offset, chunk_size)
+            yield text
+
+def read_bucket_range(bucket_dir: Path, offset: int = None, length: int = CHUNK_SIZE, line: int = None, lines: int = 100) -> Optional[dict]:
+    """
+    Read a page of the cached text of a bucket by byte offset or by line number.
+    Returns None if the bucket has no cached text.
+    """
+    with BucketReader(bucket_dir) as reader:
+        if not reader.files:
+            return None
+        page = {"size": reader.size, "lines": reader.line_count}
+        if line is not None:
+            page.update(line=line, next_line=min(line + lines, reader.line_count), text=reader.read_lines(line, lines))
+        else:
+            offset = 0 if offset is None else offset
+            text, next_offset = reader.read(offset, length)
+            page.update(offset=reader.align(max(0, min(offset, reader.size))), next_offset=next_offset, text=text)
+        return page
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import urllib.parse
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .. import debug
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(url: str) -> Optional[str]:
+    """Return a normalized http(s) url for deduplication, or None for other urls."""
+    try:
+        parsed = urllib.parse.urlsplit(url.strip())
+        port = parsed.port
+    except ValueError:
+        return None
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return None
+    netloc = parsed.hostname.lower()
+    if port is not None and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    return urllib.parse.urlunsplit((scheme, netloc, parsed.path or "/", parsed.query, ""))
+
+class HostLimiter:
+    """Limits the concurrent requests and the request rate per host."""
+
+    def __init__(self, max_per_host: int = 2, delay: float = 0.5) -> None:
+        """
+        Args:
+            max_per_host (int): Maximum concurrent requests to one host.
+            delay (float): Minimum seconds between the starts of two requests to one host.
+        """
+        self.max_per_host = max_per_host
+        self.delay = delay
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        semaphore = self.semaphores.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with semaphore:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self.next_start.get(host, 0))
+            self.next_start[host] = start + self.delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+# Downloads an url with the remaining depth, returns a result and the found links
+FetchFunction = Callable[[str, int], Awaitable[Tuple[Optional[str], Iterable[str]]]]
+
+class Crawler:
+    """
+    Crawls urls breadth-first with a pool of workers.
+
+    Urls are deduplicated by their normalized form and queued in a bounded frontier.
+    Requests are limited per host by a ``HostLimiter`` instead of global sleeps.
+    Results are yielded as soon as a download is finished.
+    """
+
+    def __init__(
+        self,
+        fetch: FetchFunction,
+        workers: int = 8,
+        max_per_host: int = 2,
+        delay: float = 0.5,
+        max_urls: int = 1000
+    ) -> None:
+        """
+        Args:
+            fetch (Callable): Downloads an url, see ``FetchFunction``.
+            workers (int): Number of concurrent downloads.
+            max_per_host (int): Maximum concurrent downloads from one host.
+            delay (float): Minimum seconds between two requests to one host.
+            max_urls (int): Maximum number of urls to crawl, more links are dropped.
+        """
+        self.fetch = fetch
+        self.workers = max(1, workers)
+        self.limiter = HostLimiter(max_per_host, delay)
+        self.max_urls = max_urls
+        self.seen: Set[str] = set()
+        self.dropped = 0
+
+    def add(self, queue: asyncio.Queue, url: str, depth: int) -> bool:
+        normalized = normalize_url(url)
+        if normalized is None or normalized in self.seen:
+            return False
+        if len(self.seen) >= self.max_urls:
+            self.dropped += 1
+            return False
+        self.seen.add(normalized)
+        queue.put_nowait((url, depth))
+        return True
+
+    async def crawl(self, urls: List[str], max_depth: int = 0) -> AsyncIterator[str]:
+        """Download the urls and the links found up to ``max_depth`` levels deep."""
+        queue = asyncio.Queue()
+        results = asyncio.Queue()
+        for url in urls:
+            self.add(queue, url, max_depth)
+
+        async def worker() -> None:
+            while True:
+                url, depth = await queue.get()
+                try:
+                    async with self.limiter.slot(urllib.parse.urlsplit(url).hostname):
+                        result, links = await self.fetch(url, depth)
+                    if depth > 0:
+                        for link in links:
+                            self.add(queue, link, depth - 1)
+                    if result is not None:
+                        results.put_nowait(result)
+                except Exception as e:
+                    debug.log(f"Crawler: Failed to download {url}: {type(e).__name__}: {e}")
+                finally:
+                    queue.task_done()
+
+        tasks = [asyncio.create_task(worker()) for _ in range(self.workers)]
+        finished = asyncio.create_task(queue.join())
+        try:
+            while True:
+                next_result = asyncio.create_task(results.get())
+                await asyncio.wait((next_result, finished), return_when=asyncio.FIRST_COMPLETED)
+                if not next_result.done():
+                    next_result.cancel()
+                    while not results.empty():
+                        yield results.get_nowait()
+                    break
+                yield next_result.result()
+        finally:
+            for task in (*tasks, finished):
+                task.cancel()
+            await asyncio.gather(*tasks, finished, return_exceptions=True)
+        if self.dropped:
+            debug.log(f"Crawler: Dropped {self.dropped} urls over the limit of {self.max_urls}")
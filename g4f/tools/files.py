@@ -4,16 +4,23 @@ import re
 import os
 import json
 from pathlib import Path
-from typing import Iterator, Optional, AsyncIterator
+from typing import Iterator, Optional, AsyncIterator, Callable, Tuple
 from aiohttp import ClientSession, ClientError, ClientResponse, ClientTimeout
 import urllib.parse
 import time
 import zipfile
 import asyncio
+import io
+import itertools
 import hashlib
 import base64
 import tempfile
 import shutil
+import atexit
+import importlib.metadata
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
     import PyPDF2
@@ -69,12 +76,17 @@ try:
 except ImportError:
     has_beautifulsoup4 = False
 try:
-    from markitdown import MarkItDown
+    from markitdown import StreamInfo
+    from ..integration.markitdown import markitdown_pool
     has_markitdown = True
 except ImportError:
     has_markitdown = False
 
 from .web_search import scrape_text
+from .model_pool import ModelPool
+from .crawler import Crawler
+from .retrieval import build_segment, has_segment, get_segment, load_segment, search, format_chunks
+from .bucket_reader import BucketReader, build_line_index, get_lines_file
 from ..files import secure_filename, get_bucket_dir
 from ..image import is_allowed_extension
 from ..requests.aiohttp import get_connector
@@ -122,23 +134,32 @@ def supports_filename(filename: str):
             return True
     return False
 
+SPACY_MODEL = "en_core_web_sm"
+# Pages per batch of nlp.pipe
+SPACY_BATCH_SIZE = 8
+
+def load_spacy_model():
+    return spacy.load(SPACY_MODEL)
+
+spacy_pool = ModelPool(load_spacy_model, max_size=1)
+
 def spacy_refine_chunks(source_iterator):
     if not has_spacy:
         raise MissingRequirementsError(f'Install "spacy" requirements | pip install -U g4f[files]')
 
-    nlp = spacy.load("en_core_web_sm")
-    for page in source_iterator:
-        doc = nlp(page)
-        #for chunk in doc.noun_chunks:
-        #    yield " ".join([token.lemma_ for token in chunk if not token.is_stop])
-        # for token in doc:
-        #     if not token.is_space:
-        #         yield token.lemma_.lower()
-        #         yield " "
-        sentences = list(doc.sents)
-        summary = sorted(sentences, key=lambda x: len(x.text), reverse=True)[:2]
-        for sent in summary:
-            yield sent.text
+    # The model is held for one batch of chunks only, not for the life of the generator.
+    # Worker processes would load the model again for every batch, so none are used.
+    source_iterator = iter(source_iterator)
+    while True:
+        chunks = list(itertools.islice(source_iterator, SPACY_BATCH_SIZE))
+        if not chunks:
+            break
+        with spacy_pool.acquire() as nlp:
+            summaries = []
+            for doc in nlp.pipe(chunks, batch_size=SPACY_BATCH_SIZE):
+                sentences = list(doc.sents)
+                summaries += [sent.text for sent in sorted(sentences, key=lambda x: len(x.text), reverse=True)[:2]]
+        yield from summaries
 
 def get_filenames(bucket_dir: Path):
     files = bucket_dir / FILE_LIST
@@ -147,15 +168,209 @@ def get_filenames(bucket_dir: Path):
             return [filename.strip() for filename in f.readlines()]
     return []
 
+# Extractors of a format, fastest first. One is used per file,
+# the order can be checked with etc/testing/benchmark_extraction.py
+EXTRACTORS = {
+    "pdf": [("pypdf2", has_pypdf2), ("pdfminer", has_pdfminer), ("pdfplumber", has_pdfplumber)],
+    "docx": [("docx2txt", has_docx2txt), ("docx", has_docx)],
+    "odt": [("odfpy", has_odfpy)],
+    "epub": [("ebooklib", has_ebooklib)],
+    "xlsx": [("openpyxl", has_openpyxl)],
+    "html": [("beautifulsoup4", has_beautifulsoup4)],
+}
+# Every task opens the PDF again, so pages are split in about two tasks per worker
+MIN_PAGES_PER_TASK = 32
+EXTRACTION_LOG = "extraction.jsonl"
+
+def get_extractor(extension: str) -> Optional[str]:
+    for name, available in EXTRACTORS.get(extension, []):
+        if available:
+            return name
+    return None
+
+def count_pdf_pages(file_path: str, extractor: str) -> Optional[int]:
+    """Return the page count of a PDF, or None if the extractor reads whole files."""
+    if extractor == "pypdf2":
+        return len(PyPDF2.PdfReader(file_path).pages)
+    elif extractor == "pdfplumber":
+        with pdfplumber.open(file_path) as pdf:
+            return len(pdf.pages)
+    return None
+
+def extract_pages(file_path: str, extractor: str, start: int, end: int) -> list[str]:
+    """Extract the text of the PDF pages from start to end."""
+    if extractor == "pypdf2":
+        reader = PyPDF2.PdfReader(file_path)
+        return [reader.pages[page_num].extract_text() for page_num in range(start, end)]
+    with pdfplumber.open(file_path, pages=list(range(start + 1, end + 1))) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+def extract_document(file_path: str, extractor: str) -> list[str]:
+    """Extract the text of a whole file."""
+    if extractor == "pdfminer":
+        return [extract_text(file_path)]
+    elif extractor == "docx2txt":
+        return [docx2txt.process(file_path)]
+    elif extractor == "docx":
+        return [para.text for para in Document(file_path).paragraphs]
+    elif extractor == "odfpy":
+        return [p.firstChild.data if p.firstChild else "" for p in load(file_path).getElementsByType(P)]
+    elif extractor == "ebooklib":
+        book = epub.read_epub(file_path)
+        return [
+            doc_item.get_content().decode(errors='ignore')
+            for doc_item in book.get_items()
+            if doc_item.get_type() == ebooklib.ITEM_DOCUMENT
+        ]
+    elif extractor == "openpyxl":
+        df = pd.read_excel(file_path)
+        return [" ".join(str(cell) for cell in row) for row in df.itertuples(index=False)]
+    elif extractor == "beautifulsoup4":
+        return list(scrape_text(Path(file_path).read_text(errors="ignore")))
+    raise ValueError(f"Unknown extractor: {extractor}")
+
+def run_timed(func: Callable, *args) -> Tuple[list[str], float]:
+    start = time.time()
+    return func(*args), time.time() - start
+
+class ExtractionPool:
+    """
+    Extracts the text of bucket files in a worker pool.
+
+    Files and batches of PDF pages are extracted in parallel,
+    but the results are yielded in document order as soon as the leading tasks are done.
+    At most ``max_pending`` tasks are scheduled ahead. The cost of each file is
+    appended to ``extraction.jsonl`` in the bucket dir.
+    """
+
+    def __init__(self, max_workers: int = None, use_processes: bool = True, max_pending: int = None) -> None:
+        """
+        Args:
+            max_workers (int): Number of worker processes or threads, defaults to the CPU count.
+            use_processes (bool): Use a process pool, otherwise a thread pool.
+            max_pending (int): Maximum number of scheduled tasks, defaults to 4 per worker.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self.max_pending = max_pending or self.max_workers * 4
+        self.executor: Optional[Executor] = None
+
+    def get_executor(self) -> Executor:
+        if self.executor is None:
+            if self.use_processes:
+                try:
+                    self.executor = ProcessPoolExecutor(self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    debug.error("Extraction: Process pool not available:", e)
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="g4f-extract")
+            atexit.register(self.shutdown)
+        return self.executor
+
+    def schedule(self, bucket_dir: Path, filenames: list[str]) -> Iterator[Tuple[dict, object]]:
+        """Yield the output of the files in order as (cost, text or future) items."""
+        for filename in filenames:
+            file_path = bucket_dir / filename
+            extension = os.path.splitext(filename)[1][1:]
+            extractor = get_extractor(extension)
+            cost = {"filename": filename, "extractor": extractor, "size": file_path.stat().st_size, "tasks": 0, "seconds": 0, "start": time.time()}
+            yield cost, f"<!-- File: {filename} -->\n"
+            if extractor is None:
+                if extension in PLAIN_FILE_EXTENSIONS:
+                    yield cost, file_path.read_text(errors="ignore").strip()
+            else:
+                try:
+                    pages = count_pdf_pages(str(file_path), extractor)
+                except Exception as e:
+                    debug.error(f"Extraction: Failed to read {filename}:", e)
+                    cost["error"] = f"{type(e).__name__}: {e}"
+                    pages = 0
+                if pages is None:
+                    cost["tasks"] += 1
+                    yield cost, self.get_executor().submit(run_timed, extract_document, str(file_path), extractor)
+                else:
+                    cost["pages"] = pages
+                    pages_per_task = max(MIN_PAGES_PER_TASK, -(-pages // (self.max_workers * 2)))
+                    for start in range(0, pages, pages_per_task):
+                        cost["tasks"] += 1
+                        end = min(start + pages_per_task, pages)
+                        yield cost, self.get_executor().submit(run_timed, extract_pages, str(file_path), extractor, start, end)
+            yield cost, None
+
+    def stream(self, bucket_dir: Path, filenames: list[str]) -> Iterator[str]:
+        for _, chunk in self.stream_files(bucket_dir, filenames):
+            yield chunk
+
+    def stream_files(self, bucket_dir: Path, filenames: list[str]) -> Iterator[Tuple[dict, str]]:
+        """Yield the output of the files in order as (cost, chunk) tuples."""
+        items = self.schedule(bucket_dir, filenames)
+        scheduled = deque()
+        pending = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and pending < self.max_pending:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                    else:
+                        scheduled.append(item)
+                        if isinstance(item[1], Future):
+                            pending += 1
+                if not scheduled:
+                    break
+                cost, value = scheduled.popleft()
+                if isinstance(value, Future):
+                    pending -= 1
+                    if "error" in cost:
+                        value.cancel()
+                        continue
+                    try:
+                        chunks, seconds = value.result()
+                    except Exception as e:
+                        debug.error(f"Extraction: Failed to read {cost['filename']}:", e)
+                        cost["error"] = f"{type(e).__name__}: {e}"
+                        continue
+                    cost["seconds"] += seconds
+                    for chunk in chunks:
+                        yield cost, chunk
+                elif value is None:
+                    self.record_cost(bucket_dir, cost)
+                    yield cost, f"\n<-- End -->\n\n"
+                else:
+                    yield cost, value
+        finally:
+            for _, value in scheduled:
+                if isinstance(value, Future):
+                    value.cancel()
+
+    def record_cost(self, bucket_dir: Path, cost: dict) -> None:
+        cost["elapsed"] = time.time() - cost.pop("start")
+        debug.log(f"Extraction: {cost['filename']} with {cost['extractor']} in {cost['elapsed']:.2f}s ({cost['seconds']:.2f}s in workers)")
+        try:
+            with (bucket_dir / EXTRACTION_LOG).open("a") as f:
+                f.write(f"{json.dumps(cost)}\n")
+        except OSError as e:
+            debug.error("Extraction: Failed to record cost:", e)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+extraction_pool = ExtractionPool()
+
 def stream_read_files(bucket_dir: Path, filenames: list[str], delete_files: bool = False) -> Iterator[str]:
+    batch = []
     for filename in filenames:
         if filename.startswith(DOWNLOADS_FILE):
             continue
         file_path: Path = bucket_dir / filename
         if not file_path.exists() or file_path.lstat().st_size <= 0:
             continue
-        extension = os.path.splitext(filename)[1][1:]
         if filename.endswith(".zip"):
+            yield from extraction_pool.stream(bucket_dir, batch)
+            batch = []
             with zipfile.ZipFile(file_path, 'r') as zip_ref:
                 zip_ref.extractall(bucket_dir)
                 try:
@@ -172,59 +387,230 @@ def stream_read_files(bucket_dir: Path, filenames: list[str], delete_files: bool
                                 else:
                                     os.unlink(filepath)
             continue
-        yield f"<!-- File: {filename} -->\n"
-        if has_pypdf2 and filename.endswith(".pdf"):
-            try:
-                reader = PyPDF2.PdfReader(file_path)
-                for page_num in range(len(reader.pages)):
-                    page = reader.pages[page_num]
-                    yield page.extract_text()
-            except PdfReadError:
-                continue
-        if has_pdfplumber and filename.endswith(".pdf"):
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    yield page.extract_text()
-        if has_pdfminer and filename.endswith(".pdf"):
-            yield extract_text(file_path)
-        elif has_docx and filename.endswith(".docx"):
-            doc = Document(file_path)
-            for para in doc.paragraphs:
-                yield para.text
-        elif has_docx2txt and filename.endswith(".docx"):
-            yield docx2txt.process(file_path)
-        elif has_odfpy and filename.endswith(".odt"):
-            textdoc = load(file_path)
-            allparas = textdoc.getElementsByType(P)
-            for p in allparas:
-                yield p.firstChild.data if p.firstChild else ""
-        elif has_ebooklib and filename.endswith(".epub"):
-            book = epub.read_epub(file_path)
-            for doc_item in book.get_items():
-                if doc_item.get_type() == ebooklib.ITEM_DOCUMENT:
-                    yield doc_item.get_content().decode(errors='ignore')
-        elif has_openpyxl and filename.endswith(".xlsx"):
-            df = pd.read_excel(file_path)
-            for row in df.itertuples(index=False):
-                yield " ".join(str(cell) for cell in row)
-        elif has_beautifulsoup4 and filename.endswith(".html"):
-            yield from scrape_text(file_path.read_text(errors="ignore"))
-        elif extension in PLAIN_FILE_EXTENSIONS:
-            yield file_path.read_text(errors="ignore").strip()
-        yield f"\n<-- End -->\n\n"
-
-def cache_stream(stream: Iterator[str], bucket_dir: Path) -> Iterator[str]:
+        batch.append(filename)
+    yield from extraction_pool.stream(bucket_dir, batch)
+
+# Increase when the output of the extractors changes, to invalidate all caches
+EXTRACTION_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+CACHE_DIR = ".cache"
+INDEX_DIR = ".index"
+# Larger buckets are searched for the chunks relevant to the prompt
+RETRIEVAL_MIN_SIZE = 32 * 1024
+RETRIEVAL_TOP_K = 8
+EXTRACTOR_PACKAGES = {
+    "pypdf2": "PyPDF2",
+    "pdfplumber": "pdfplumber",
+    "pdfminer": "pdfminer.six",
+    "docx2txt": "docx2txt",
+    "docx": "python-docx",
+    "odfpy": "odfpy",
+    "ebooklib": "EbookLib",
+    "openpyxl": "openpyxl",
+    "beautifulsoup4": "beautifulsoup4",
+}
+
+@lru_cache
+def get_extractor_version(extractor: str) -> str:
+    package = EXTRACTOR_PACKAGES.get(extractor)
+    if package is not None:
+        try:
+            return f"{extractor}-{importlib.metadata.version(package)}"
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return extractor
+
+def get_cache_key(file_path: Path) -> str:
+    """Return the cache key of a file from its name, its content hash and the version of its extractor."""
+    extension = os.path.splitext(file_path.name)[1][1:]
+    extractor = "zip" if extension == "zip" else get_extractor(extension) or "plain"
+    hasher = hashlib.sha256(f"{EXTRACTION_VERSION}:{get_extractor_version(extractor)}:{file_path.name}:".encode())
+    with file_path.open("rb") as f:
+        while chunk := f.read(1024 * 1024):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def read_manifest(bucket_dir: Path) -> list[dict]:
+    manifest_file = bucket_dir / MANIFEST_FILE
+    if manifest_file.exists():
+        try:
+            with manifest_file.open("r") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            pass
+    return []
+
+def write_manifest(bucket_dir: Path, entries: list[dict]) -> None:
+    tmp_file = bucket_dir / f"{MANIFEST_FILE}.{time.time()}.tmp"
+    with tmp_file.open("w") as f:
+        json.dump(entries, f)
+    tmp_file.replace(bucket_dir / MANIFEST_FILE)
+
+def invalidate_cache(bucket_dir: Path) -> None:
+    """Drop the manifest and all cached texts of a bucket."""
+    bucket_dir = Path(bucket_dir)
+    (bucket_dir / MANIFEST_FILE).unlink(missing_ok=True)
+    (bucket_dir / PLAIN_CACHE).unlink(missing_ok=True)
+    collect_garbage(bucket_dir)
+
+def collect_garbage(bucket_dir: Path) -> int:
+    """Delete cached texts and indexes that are not in the manifest. Returns the number of deleted files."""
+    keys = {entry["key"] for entry in read_manifest(bucket_dir)}
+    # Release the memory maps of the segments
+    load_segment.cache_clear()
+    deleted = 0
+    for directory in (bucket_dir / CACHE_DIR, bucket_dir / INDEX_DIR):
+        if not directory.is_dir():
+            continue
+        for cache_file in directory.iterdir():
+            if cache_file.name.split(".", 1)[0] not in keys:
+                try:
+                    cache_file.unlink()
+                    deleted += 1
+                except OSError as e:
+                    debug.error(f"Failed to delete {cache_file.name}:", e)
+    return deleted
+
+def update_manifest(bucket_dir: Path) -> Tuple[list[dict], bool]:
+    """
+    Add the new files of the bucket to the manifest and update the changed ones.
+    Files are only hashed again if their size or modification time changed.
+    Entries with an ``error`` are kept, so a failed file is only extracted again when it changes.
+    Returns the entries in document order and if the manifest has changed.
+    """
+    entries = read_manifest(bucket_dir)
+    known = {entry["filename"]: entry for entry in entries}
+    filenames = [entry["filename"] for entry in entries]
+    filenames += [
+        filename for filename in dict.fromkeys(get_filenames(bucket_dir))
+        if filename not in known and not filename.startswith(DOWNLOADS_FILE)
+    ]
+    cache_dir = bucket_dir / CACHE_DIR
+    updated = []
+    for filename in filenames:
+        entry = known.get(filename)
+        file_path = bucket_dir / filename
+        if file_path.is_file() and file_path.stat().st_size > 0:
+            stat_result = file_path.stat()
+            if entry is None or entry["size"] != stat_result.st_size or entry["mtime"] != stat_result.st_mtime:
+                entry = {
+                    "filename": filename,
+                    "size": stat_result.st_size,
+                    "mtime": stat_result.st_mtime,
+                    "key": get_cache_key(file_path),
+                }
+        elif entry is None or not (cache_dir / f"{entry['key']}.txt").exists():
+            # Source and cache are gone
+            continue
+        updated.append(entry)
+    return updated, updated != entries
+
+def stream_bucket(bucket_dir: Path, delete_files: bool = False) -> Iterator[str]:
+    """
+    Stream the text of a bucket. Only new and changed files are extracted,
+    the others are read from the per-file cache in ``.cache``.
+    The whole text is also written to ``plain.cache`` for ``read_bucket``.
+    The output of a file that failed to extract is cached too, with an ``error`` in its entry.
+    """
+    entries, changed = update_manifest(bucket_dir)
     cache_file = bucket_dir / PLAIN_CACHE
-    tmp_file = bucket_dir / f"{PLAIN_CACHE}.{time.time()}.tmp"
-    if cache_file.exists():
-        for chunk in read_path_chunked(cache_file):
-            yield chunk
+    if not changed and cache_file.exists():
+        yield from read_path_chunked(cache_file)
         return
-    with open(tmp_file, "wb") as f:
-        for chunk in stream:
-            f.write(chunk.encode(errors="replace"))
+    cache_dir = bucket_dir / CACHE_DIR
+    cache_dir.mkdir(exist_ok=True)
+    missing = [entry for entry in entries if not (cache_dir / f"{entry['key']}.txt").exists()]
+    extracted = extraction_pool.stream_files(bucket_dir, [entry["filename"] for entry in missing if not entry["filename"].endswith(".zip")])
+    entry_errors = {}
+    next_item = None
+    def iter_extracted(filename: str) -> Iterator[str]:
+        nonlocal next_item
+        while True:
+            item = next(extracted, None) if next_item is None else next_item
+            next_item = None
+            if item is None:
+                return
+            cost, chunk = item
+            if cost["filename"] != filename:
+                next_item = item
+                return
+            if "error" in cost:
+                entry_errors[filename] = cost["error"]
             yield chunk
-    tmp_file.rename(cache_file)
+    tmp_file = bucket_dir / f"{PLAIN_CACHE}.{time.time()}.tmp"
+    with tmp_file.open("wb") as plain:
+        for entry in entries:
+            entry_cache = cache_dir / f"{entry['key']}.txt"
+            if entry_cache.exists():
+                for chunk in read_path_chunked(entry_cache):
+                    plain.write(chunk.encode(errors="replace"))
+                    yield chunk
+                index_entry(bucket_dir, entry)
+                continue
+            if entry["filename"].endswith(".zip"):
+                chunks = stream_read_files(bucket_dir, [entry["filename"]], delete_files)
+            else:
+                chunks = iter_extracted(entry["filename"])
+            entry_tmp = cache_dir / f"{entry['key']}.{time.time()}.tmp"
+            with entry_tmp.open("wb") as f:
+                for chunk in chunks:
+                    data = chunk.encode(errors="replace")
+                    f.write(data)
+                    plain.write(data)
+                    yield chunk
+            if entry["filename"] in entry_errors:
+                # Extract it again when its size or modification time changes
+                entry["error"] = entry_errors[entry["filename"]]
+            entry_tmp.replace(entry_cache)
+            index_entry(bucket_dir, entry)
+    tmp_file.replace(cache_file)
+    build_line_index(cache_file)
+    # The refined parts are outdated
+    for part in list(bucket_dir.glob("plain_*.cache")) + list(bucket_dir.glob("spacy_*.cache")):
+        part.unlink()
+        get_lines_file(part).unlink(missing_ok=True)
+    write_manifest(bucket_dir, entries)
+    collect_garbage(bucket_dir)
+
+def index_entry(bucket_dir: Path, entry: dict) -> bool:
+    """Build the retrieval index of a cached file if it is missing."""
+    index_dir = bucket_dir / INDEX_DIR
+    text_file = bucket_dir / CACHE_DIR / f"{entry['key']}.txt"
+    if has_segment(index_dir, entry["key"]):
+        return True
+    if not text_file.exists():
+        return False
+    try:
+        build_segment(index_dir, entry["key"], text_file, entry["filename"])
+        return True
+    except Exception as e:
+        debug.error(f"Failed to index {entry['filename']}:", e)
+        return False
+
+def read_bucket_context(bucket_dir: Path, query: str = None, top_k: int = RETRIEVAL_TOP_K) -> str:
+    """
+    Return the text of a bucket for a prompt.
+    Small buckets are returned as a whole, of larger ones only the chunks most relevant to the query.
+    """
+    bucket_dir = Path(bucket_dir)
+    cache_file = bucket_dir / PLAIN_CACHE
+    entries = read_manifest(bucket_dir)
+    if query and entries and cache_file.exists() and cache_file.stat().st_size > RETRIEVAL_MIN_SIZE:
+        segments = []
+        for entry in entries:
+            if not index_entry(bucket_dir, entry):
+                break
+            segment = get_segment(bucket_dir / INDEX_DIR, entry["key"], bucket_dir / CACHE_DIR / f"{entry['key']}.txt")
+            if segment is None:
+                break
+            segments.append(segment)
+        else:
+            results = search(segments, query, top_k)
+            if not results:
+                # Nothing matches, start at the beginning
+                results = [(index, chunk_id) for index, segment in enumerate(segments) for chunk_id in range(len(segment.chunks))][:top_k]
+            return format_chunks(segments, results)
+    return "".join(read_bucket(bucket_dir))
 
 def is_complete(data: str):
     return data.endswith("\n```\n\n") and data.count("```") % 2 == 0
@@ -232,33 +618,21 @@ def is_complete(data: str):
 def read_path_chunked(path: Path):
     with path.open("r", encoding='utf-8') as f:
         current_chunk_size = 0
-        buffer = ""
+        buffer = []
         for line in f:
             current_chunk_size += len(line.encode('utf-8'))
-            buffer += line
+            buffer.append(line)
             if current_chunk_size >= 4096:
-                if is_complete(buffer) or current_chunk_size >= 8192:
-                    yield buffer
-                    buffer = ""
+                if current_chunk_size >= 8192 or is_complete(line if len(buffer) == 1 else "".join(buffer)):
+                    yield "".join(buffer)
+                    buffer = []
                     current_chunk_size = 0
         if current_chunk_size > 0:
-            yield buffer
+            yield "".join(buffer)
 
 def read_bucket(bucket_dir: Path):
-    bucket_dir = Path(bucket_dir)
-    cache_file = bucket_dir / PLAIN_CACHE
-    spacy_file = bucket_dir / f"spacy_0001.cache"
-    if not spacy_file.is_file() and cache_file.is_file():
-        yield cache_file.read_text(errors="replace")
-    for idx in range(1, 1000):
-        spacy_file = bucket_dir / f"spacy_{idx:04d}.cache"
-        plain_file = bucket_dir / f"plain_{idx:04d}.cache"
-        if spacy_file.is_file():
-            yield spacy_file.read_text(errors="replace")
-        elif plain_file.is_file():
-            yield plain_file.read_text(errors="replace")
-        else:
-            break
+    with BucketReader(Path(bucket_dir)) as reader:
+        yield from reader.iter_chunks()
 
 def stream_read_parts_and_refine(bucket_dir: Path, delete_files: bool = False) -> Iterator[str]:
     cache_file = bucket_dir / PLAIN_CACHE
@@ -407,86 +781,88 @@ def read_links(html: str, base: str) -> set[str]:
     for link in soup.select("a"):
         if "rel" not in link.attrs or "nofollow" not in link.attrs["rel"]:
             url = link.attrs.get("href")
-            if url and url.startswith("https://") or url.startswith("/"):
+            if url and (url.startswith("https://") or url.startswith("/")):
                 urls.append(url.split("#")[0])
     return set([urllib.parse.urljoin(base, link) for link in urls])
 
+def convert_to_markdown(body: bytes, url: str, extension: str) -> Optional[str]:
+    with markitdown_pool.acquire() as md:
+        return md.convert_stream(io.BytesIO(body), stream_info=StreamInfo(url=url, extension=extension)).text_content
+
 async def download_urls(
     bucket_dir: Path,
     urls: list[str],
     max_depth: int = 0,
-    loading_urls: set[str] = set(),
-    lock: asyncio.Lock = None,
-    delay: int = 3,
-    new_urls: list[str] = list(),
-    group_size: int = 5,
+    delay: float = 0.5,
+    group_size: int = 8,
     timeout: int = 10,
-    proxy: Optional[str] = None
+    proxy: Optional[str] = None,
+    max_per_host: int = 2,
+    max_urls: int = 1000
 ) -> AsyncIterator[str]:
-    if lock is None:
-        lock = asyncio.Lock()
-    md = MarkItDown()
+    """
+    Download urls and the pages they link to into a bucket and yield the filenames.
+
+    Args:
+        max_depth (int): How many levels of links of html pages are followed.
+        delay (float): Minimum seconds between two requests to the same host.
+        group_size (int): Number of concurrent downloads.
+        max_per_host (int): Maximum concurrent downloads from the same host.
+        max_urls (int): Maximum number of downloaded urls.
+    """
     async with ClientSession(
         connector=get_connector(proxy=proxy),
         timeout=ClientTimeout(timeout)
     ) as session:
-        async def download_url(url: str, max_depth: int) -> str:
-            text_content = None
-            if has_markitdown:
-                try:
-                    text_content = md.convert(url).text_content
-                    if text_content:
-                        filename = get_filename_from_url(url)
-                        target = bucket_dir / filename
-                        text_content = f"{text_content.strip()}\n\nSource: {url}\n"
-                        target.write_text(text_content, errors="replace")
-                        return filename
-                except Exception as e:
-                    debug.log(f"Failed to convert URL to text: {type(e).__name__}: {e}")
+        async def download_url(url: str, max_depth: int) -> Tuple[Optional[str], set[str]]:
+            links = set()
             try:
                 async with session.get(url) as response:
                     response.raise_for_status()
                     filename = await get_filename(response)
                     if not filename:
                         debug.log(f"Failed to get filename for {url}")
-                        return None
+                        return None, links
                     if not is_allowed_extension(filename) and not supports_filename(filename) or filename == DOWNLOADS_FILE:
-                        return None
-                    if filename.endswith(".html") and max_depth > 0:
-                        add_urls = read_links(await response.text(), str(response.url))
-                        if add_urls:
-                            async with lock:
-                                add_urls = [add_url for add_url in add_urls if add_url not in loading_urls]
-                                [loading_urls.add(add_url) for add_url in add_urls]
-                                [new_urls.append(add_url) for add_url in add_urls if add_url not in new_urls]
+                        return None, links
+                    # The body is only read at once if it is needed, otherwise it is streamed to the file
+                    body = None
+                    if filename.endswith(".html") and max_depth > 0 and has_beautifulsoup4:
+                        links = read_links(await response.text(), str(response.url))
+                        body = await response.read()
                     if is_allowed_extension(filename):
                         target = bucket_dir / "media" / filename
                         target.parent.mkdir(parents=True, exist_ok=True)
                     else:
+                        if has_markitdown:
+                            try:
+                                body = await response.read()
+                                text_content = await asyncio.get_running_loop().run_in_executor(None, convert_to_markdown, body, url, os.path.splitext(filename)[1])
+                                if text_content:
+                                    filename = get_filename_from_url(url)
+                                    text_content = f"{text_content.strip()}\n\nSource: {url}\n"
+                                    (bucket_dir / filename).write_text(text_content, errors="replace")
+                                    return filename, links
+                            except Exception as e:
+                                debug.log(f"Failed to convert URL to text: {type(e).__name__}: {e}")
                         target = bucket_dir / filename
+                    def add_canonical(chunk: bytes) -> bytes:
+                        if filename.endswith(".html") and b'<link rel="canonical"' not in chunk:
+                            return chunk.replace(b'</head>', f'<link rel="canonical" href="{response.url}">\n</head>'.encode())
+                        return chunk
                     with target.open("wb") as f:
-                        async for chunk in response.content.iter_any():
-                            if filename.endswith(".html") and b'<link rel="canonical"' not in chunk:
-                                f.write(chunk.replace(b'</head>', f'<link rel="canonical" href="{response.url}">\n</head>'.encode()))
-                            else:
-                                f.write(chunk)
-                    return filename
+                        if body is not None:
+                            f.write(add_canonical(body))
+                        else:
+                            async for chunk in response.content.iter_any():
+                                f.write(add_canonical(chunk))
+                    return filename, links
             except (ClientError, asyncio.TimeoutError) as e:
                 debug.log(f"Download failed: {e.__class__.__name__}: {e}")
-            return None
-        for filename in await asyncio.gather(*[download_url(url, max_depth) for url in urls]):
-            if filename:
-                yield filename
-            else:
-                await asyncio.sleep(delay)
-        while new_urls:
-            next_urls = list()
-            for i in range(0, len(new_urls), group_size):
-                chunked_urls = new_urls[i:i + group_size]
-                async for filename in download_urls(bucket_dir, chunked_urls, max_depth - 1, loading_urls, lock, delay + 1, next_urls):
-                    yield filename
-                await asyncio.sleep(delay)
-            new_urls = next_urls
+            return None, links
+        crawler = Crawler(download_url, workers=group_size, max_per_host=max_per_host, delay=delay, max_urls=max_urls)
+        async for filename in crawler.crawl(urls, max_depth):
+            yield filename
 
 def get_downloads_urls(bucket_dir: Path, delete_files: bool = False) -> Iterator[str]:
     download_file = bucket_dir / DOWNLOADS_FILE
@@ -536,9 +912,7 @@ def stream_chunks(bucket_dir: Path, delete_files: bool = False, refine_chunks_wi
             else:
                 yield chunk
     else:
-        streaming = stream_read_files(bucket_dir, get_filenames(bucket_dir), delete_files)
-        streaming = cache_stream(streaming, bucket_dir)
-        for chunk in streaming:
+        for chunk in stream_bucket(bucket_dir, delete_files):
             if event_stream:
                 size += len(chunk.encode())
                 yield f'data: {json.dumps({"action": "load", "size": size})}\n\n'
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from ..typing import Messages
 from ..image import is_data_an_media, to_input_audio, is_valid_media, is_valid_audio, to_data_uri
-from .files import get_bucket_dir, read_bucket
+from ..files import get_bucket_dir
 
 def render_media(bucket_id: str, name: str, url: str, as_path: bool = False, as_base64: bool = False, **kwargs) -> Union[str, Path]:
     if (as_base64 or as_path or url.startswith("/")):
@@ -35,6 +35,7 @@ def render_part(part: dict) -> dict:
         }
     filename = part.get("name")
     if (filename is None):
+        from .files import read_bucket
         bucket_dir = Path(get_bucket_dir(part.get("bucket_id")))
         return {
             "type": "text",
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, List
+
+class PoolTimeoutError(TimeoutError):
+    pass
+
+class ModelPool:
+    """
+    Bounded pool of shared model or converter instances.
+
+    Instances are created by ``factory`` on first use, at most ``max_size`` of them,
+    and are handed out to one caller at a time. Callers wait when all instances are
+    in use, so loading a model happens once per instance instead of once per request.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_size: int = 1) -> None:
+        """
+        Args:
+            factory (Callable): Creates a new instance.
+            max_size (int): Maximum number of instances.
+        """
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.idle: List[Any] = []
+        self.size = 0
+        self.condition = threading.Condition()
+
+    def get(self, timeout: float = None) -> Any:
+        """Take an instance from the pool, create one or wait for one."""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.idle or self.size < self.max_size, timeout):
+                raise PoolTimeoutError(f"No instance available after {timeout} seconds")
+            if self.idle:
+                return self.idle.pop()
+            self.size += 1
+        # Loading can be slow, so it is done outside of the lock
+        try:
+            return self.factory()
+        except BaseException:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+    def put(self, instance: Any) -> None:
+        """Return an instance to the pool."""
+        with self.condition:
+            self.idle.append(instance)
+            self.condition.notify()
+
+    @contextmanager
+    def acquire(self, timeout: float = None) -> Iterator[Any]:
+        instance = self.get(timeout)
+        try:
+            yield instance
+        finally:
+            self.put(instance)
+
+    @asynccontextmanager
+    async def acquire_async(self, timeout: float = None) -> AsyncIterator[Any]:
+        """Like ``acquire``, but waits and loads in a worker thread."""
+        task = asyncio.get_running_loop().run_in_executor(None, self.get, timeout)
+        try:
+            instance = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # The worker thread still takes an instance, return it when the thread is done
+            task.add_done_callback(self._put_result)
+            raise
+        try:
+            yield instance
+        finally:
+            self.put(instance)
+
+    def _put_result(self, task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is None:
+            self.put(task.result())
+
+    def clear(self) -> None:
+        """Drop the idle instances to free their memory."""
+        with self.condition:
+            self.size -= len(self.idle)
+            self.idle = []
+            self.condition.notify_all()
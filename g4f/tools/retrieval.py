@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import re
+import os
+import json
+import math
+import mmap
+import heapq
+from array import array
+from pathlib import Path
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
+from .. import debug
+
+INDEX_VERSION = 1
+CHUNK_SIZE = 1500
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Rank constant of the reciprocal rank fusion of BM25 and vector results
+RRF_K = 60
+
+SECTION_REGEX = re.compile(rb"<!-- File: (.+?) -->\n(.*?)(?:\n<-- End -->\n*|\Z)", re.DOTALL)
+SOURCE_REGEX = re.compile(rb"\nSource: (\S+)")
+TOKEN_REGEX = re.compile(r"\w\w+")
+
+class Embedder:
+    """
+    Creates embeddings for chunks and queries.
+
+    Attributes:
+        name (str): Part of the file name of stored vectors, change it with the model.
+        embed (Callable): Returns one vector per text.
+    """
+
+    def __init__(self, name: str, embed: Callable[[List[str]], Sequence[Sequence[float]]]) -> None:
+        self.name = secure_name(name)
+        self.embed = embed
+
+embedder: Optional[Embedder] = None
+
+def set_embedder(value: Optional[Embedder]) -> None:
+    """Enable vector search with an embedder, in addition to BM25. Requires numpy."""
+    global embedder
+    if value is not None and not has_numpy:
+        debug.error("Retrieval: Install numpy to use embeddings")
+        return
+    embedder = value
+
+def secure_name(name: str) -> str:
+    return re.sub(r"[^\w.-]", "_", name)
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_REGEX.findall(text.lower())
+
+def split_chunks(data: bytes, start: int, end: int, size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Split a byte range into chunks of at most ``size`` bytes at paragraph, line or word ends."""
+    chunks = []
+    while start < end:
+        if end - start <= size:
+            chunks.append((start, end))
+            break
+        limit = start + size
+        for separator in (b"\n\n", b"\n", b" "):
+            cut = data.rfind(separator, start + size // 2, limit)
+            if cut != -1:
+                cut += len(separator)
+                break
+        else:
+            # Do not cut a UTF-8 character
+            cut = limit
+            while cut > start and data[cut] & 0xC0 == 0x80:
+                cut -= 1
+        chunks.append((start, cut))
+        start = cut
+    return chunks
+
+def iter_sections(data: bytes, filename: str):
+    """Yield (filename, source, start, end) for the file sections of an extracted text."""
+    found = False
+    for match in SECTION_REGEX.finditer(data):
+        found = True
+        body = match.group(2)
+        sources = SOURCE_REGEX.findall(body)
+        yield match.group(1).decode(errors="replace"), sources[-1].decode(errors="replace") if sources else None, match.start(2), match.end(2)
+    if not found:
+        sources = SOURCE_REGEX.findall(data)
+        yield filename, sources[-1].decode(errors="replace") if sources else None, 0, len(data)
+
+def build_segment(index_dir: Path, key: str, text_file: Path, filename: str) -> None:
+    """
+    Index the extracted text of one file.
+
+    The chunks are byte ranges of ``text_file``, so only the term dictionary is written
+    to ``<key>.json`` and the postings, pairs of chunk number and term frequency,
+    to ``<key>.postings``. With an embedder the vectors are written to ``<key>.<name>.npy``.
+    """
+    data = text_file.read_bytes()
+    sections = []
+    chunks = []
+    lengths = []
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    texts = []
+    for name, source, start, end in iter_sections(data, filename):
+        sections.append([name, source])
+        for chunk_start, chunk_end in split_chunks(data, start, end):
+            text = data[chunk_start:chunk_end].decode(errors="replace")
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            chunk_id = len(chunks)
+            chunks.append([chunk_start, chunk_end, len(sections) - 1])
+            lengths.append(len(tokens))
+            texts.append(text)
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                postings.setdefault(token, []).append((chunk_id, count))
+    values = array("I")
+    terms = {}
+    for token, items in postings.items():
+        terms[token] = [len(values) // 2, len(items)]
+        for chunk_id, count in items:
+            values.append(chunk_id)
+            values.append(count)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    with (index_dir / f"{key}.postings").open("wb") as f:
+        values.tofile(f)
+    if embedder is not None and texts:
+        try:
+            vectors = np.asarray(embedder.embed(texts), dtype=np.float32)
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+            np.save(index_dir / f"{key}.{embedder.name}.npy", vectors)
+        except Exception as e:
+            debug.error(f"Retrieval: Failed to embed {filename}:", e)
+    # The json file is written last, it marks a complete segment
+    tmp_file = index_dir / f"{key}.json.tmp"
+    with tmp_file.open("w") as f:
+        json.dump({
+            "version": INDEX_VERSION,
+            "sections": sections,
+            "chunks": chunks,
+            "lengths": lengths,
+            "terms": terms,
+        }, f)
+    tmp_file.replace(index_dir / f"{key}.json")
+
+def has_segment(index_dir: Path, key: str) -> bool:
+    return (index_dir / f"{key}.json").exists()
+
+class Segment:
+    """A loaded segment with memory-mapped postings and text."""
+
+    def __init__(self, index_dir: Path, key: str, text_file: Path) -> None:
+        with (index_dir / f"{key}.json").open("r") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Outdated index version: {data.get('version')}")
+        self.sections: List[list] = data["sections"]
+        self.chunks: List[list] = data["chunks"]
+        self.lengths: List[int] = data["lengths"]
+        self.terms: Dict[str, list] = data["terms"]
+        self.postings = map_file(index_dir / f"{key}.postings")
+        self.postings = self.postings.cast("I") if self.postings is not None else memoryview(array("I"))
+        self.text = map_file(text_file)
+        self.vectors = None
+        if embedder is not None:
+            vectors_file = index_dir / f"{key}.{embedder.name}.npy"
+            if vectors_file.exists():
+                self.vectors = np.load(vectors_file, mmap_mode="r")
+
+    def get_postings(self, token: str) -> memoryview:
+        start, count = self.terms.get(token, (0, 0))
+        return self.postings[start * 2:(start + count) * 2]
+
+    def get_text(self, chunk_id: int) -> str:
+        start, end, _ = self.chunks[chunk_id]
+        return bytes(self.text[start:end]).decode(errors="replace")
+
+def map_file(path: Path) -> Optional[memoryview]:
+    if path.stat().st_size == 0:
+        return None
+    with path.open("rb") as f:
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+@lru_cache(maxsize=64)
+def load_segment(index_dir: Path, key: str, text_file: Path, mtime: float, embedder_name: Optional[str]) -> Segment:
+    return Segment(index_dir, key, text_file)
+
+def get_segment(index_dir: Path, key: str, text_file: Path) -> Optional[Segment]:
+    try:
+        mtime = os.stat(index_dir / f"{key}.json").st_mtime
+        return load_segment(index_dir, key, text_file, mtime, None if embedder is None else embedder.name)
+    except (OSError, ValueError, KeyError) as e:
+        debug.error(f"Retrieval: Failed to load segment {key}:", e)
+        return None
+
+def search(segments: List[Segment], query: str, top_k: int) -> List[Tuple[int, int]]:
+    """
+    Return the (segment number, chunk number) of the best chunks for a query.
+    BM25 is computed with the statistics of all segments. With an embedder the
+    BM25 ranking is fused with the cosine similarity ranking.
+    """
+    total = sum(len(segment.lengths) for segment in segments)
+    if not total:
+        return []
+    average_length = sum(sum(segment.lengths) for segment in segments) / total
+    scores: Dict[Tuple[int, int], float] = {}
+    for token in set(tokenize(query)):
+        frequency = sum(segment.terms.get(token, (0, 0))[1] for segment in segments)
+        if not frequency:
+            continue
+        idf = math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+        for index, segment in enumerate(segments):
+            postings = segment.get_postings(token)
+            for position in range(0, len(postings), 2):
+                chunk_id, count = postings[position], postings[position + 1]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * segment.lengths[chunk_id] / average_length)
+                scores[(index, chunk_id)] = scores.get((index, chunk_id), 0) + idf * count * (BM25_K1 + 1) / (count + norm)
+    ranking = heapq.nlargest(top_k * 4, scores, key=scores.get)
+    if embedder is not None and all(segment.vectors is not None for segment in segments):
+        try:
+            ranking = fuse_rankings(ranking, search_vectors(segments, query, top_k * 4))
+        except Exception as e:
+            debug.error("Retrieval: Vector search failed:", e)
+    return ranking[:top_k]
+
+def search_vectors(segments: List[Segment], query: str, limit: int) -> List[Tuple[int, int]]:
+    """Brute-force cosine similarity over the memory-mapped vectors."""
+    vector = np.asarray(embedder.embed([query])[0], dtype=np.float32)
+    vector /= max(float(np.linalg.norm(vector)), 1e-12)
+    results = []
+    for index, segment in enumerate(segments):
+        if not len(segment.vectors):
+            continue
+        similarities = segment.vectors @ vector
+        for chunk_id in np.argsort(-similarities)[:limit]:
+            results.append((float(similarities[chunk_id]), index, int(chunk_id)))
+    return [(index, chunk_id) for _, index, chunk_id in heapq.nlargest(limit, results)]
+
+def fuse_rankings(*rankings: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    scores: Dict[Tuple[int, int], float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking):
+            scores[item] = scores.get(item, 0) + 1 / (RRF_K + rank + 1)
+    return sorted(scores, key=scores.get, reverse=True)
+
+def format_chunks(segments: List[Segment], results: List[Tuple[int, int]]) -> str:
+    """Format the chunks in document order, grouped by file with their source."""
+    parts = []
+    current = None
+    source = None
+    for index, chunk_id in sorted(results):
+        segment = segments[index]
+        section = (index, segment.chunks[chunk_id][2])
+        if section != current:
+            if current is not None:
+                parts.append(f"Source: {source}\n<-- End -->\n\n" if source else "<-- End -->\n\n")
+            current = section
+            filename, source = segment.sections[section[1]]
+            parts.append(f"<!-- File: {filename} -->\n")
+        parts.append(f"{segment.get_text(chunk_id).strip()}\n[...]\n")
+    if current is not None:
+        parts.append(f"Source: {source}\n<-- End -->\n\n" if source else "<-- End -->\n\n")
+    return "".join(parts)
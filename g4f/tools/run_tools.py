@@ -3,20 +3,17 @@ from __future__ import annotations
 import os
 import re
 import json
-import asyncio
 import time
-import datetime
-from pathlib import Path
 from typing import Optional, AsyncIterator, Iterator, Dict, Any, Tuple, List, Union
 
 from ..typing import Messages
 from ..providers.helper import filter_none
-from ..providers.asyncio import to_async_iterator
+from ..providers.asyncio import to_async_iterator, run_coroutine_sync
 from ..providers.response import Reasoning, FinishReason, Sources, Usage, ProviderInfo
 from ..providers.types import ProviderType
-from ..cookies import get_cookies_dir
 from .web_search import do_search, get_search_message
-from .files import read_bucket, get_bucket_dir
+from .usage import usage_recorder
+from .tokenizer import TokenCounter, count_message_tokens
 from .. import debug
 
 # Constants
@@ -30,6 +27,20 @@ TOOL_NAMES = {
     "BUCKET": "bucket_tool"
 }
 
+def get_bucket_query(messages: Messages) -> Optional[str]:
+    """Return the last user message without bucket references, to search the buckets"""
+    for message in reversed(messages):
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            return re.sub(r'{"bucket_id":\s*"([^"]*)"}', "", message["content"]).strip() or None
+    return None
+
+def estimate_usage(messages: Messages, model: str, token_counter: TokenCounter) -> Usage:
+    """Count the tokens of a response for providers that do not report usage"""
+    return Usage(prompt_tokens=count_message_tokens(messages, model), completion_tokens=token_counter.total)
+
+def record_usage(provider: ProviderType, model: str, usage: Usage, user: Optional[str] = None) -> None:
+    usage_recorder.record({"user": user, "model": model, "provider": provider.get_parent(), **usage.get_dict()})
+
 class ToolHandler:
     """Handles processing of different tool types"""
     
@@ -74,10 +85,12 @@ class ToolHandler:
     @staticmethod
     def process_bucket_tool(messages: Messages, tool: dict) -> Messages:
         """Process bucket tool requests"""
+        from .files import read_bucket_context, get_bucket_dir
         messages = messages.copy()
-        
+        query = get_bucket_query(messages)
+
         def on_bucket(match):
-            return "".join(read_bucket(get_bucket_dir(match.group(1))))
+            return read_bucket_context(get_bucket_dir(match.group(1)), query)
             
         has_bucket = False
         for message in messages:
@@ -253,17 +266,29 @@ async def async_iter_run_tools(
     response = to_async_iterator(provider.async_create_function(model=model, messages=messages, **kwargs))
     
     model_info = model
-    async for chunk in response:
-        if isinstance(chunk, ProviderInfo):
-            model_info = getattr(chunk, 'model', model_info)
-        elif isinstance(chunk, Usage):
-            usage = {"user": kwargs.get("user"), "model": model_info, "provider": provider.get_parent(), **chunk.get_dict()}
-            usage_dir = Path(get_cookies_dir()) / ".usage"
-            usage_file = usage_dir / f"{datetime.date.today()}.jsonl"
-            usage_dir.mkdir(parents=True, exist_ok=True)
-            with usage_file.open("a" if usage_file.exists() else "w") as f:
-                f.write(f"{json.dumps(usage)}\n")
-        yield chunk
+    token_counter = TokenCounter(model)
+    has_usage = False
+    try:
+        async for chunk in response:
+            if isinstance(chunk, ProviderInfo):
+                model_info = getattr(chunk, 'model', model_info)
+            elif isinstance(chunk, Usage):
+                has_usage = True
+                record_usage(provider, model_info, chunk, kwargs.get("user"))
+            elif isinstance(chunk, str):
+                token_counter.add(chunk)
+            elif isinstance(chunk, Reasoning) and chunk.token:
+                token_counter.add(chunk.token)
+            yield chunk
+        if not has_usage:
+            has_usage = True
+            usage = estimate_usage(messages, model_info, token_counter)
+            record_usage(provider, model_info, usage, kwargs.get("user"))
+            yield usage
+    finally:
+        # Also record responses that are closed before the end
+        if not has_usage and (token_counter.count or token_counter.pending):
+            record_usage(provider, model_info, estimate_usage(messages, model_info, token_counter), kwargs.get("user"))
 
     # Yield sources if available
     if sources:
@@ -286,8 +311,7 @@ def iter_run_tools(
         try:
             messages = messages.copy()
             search_query = web_search if isinstance(web_search, str) and web_search != "true" else None
-            # Note: Using asyncio.run inside sync function is not ideal, but maintaining original pattern
-            messages[-1]["content"], sources = asyncio.run(do_search(messages[-1]["content"], search_query))
+            messages[-1]["content"], sources = run_coroutine_sync(do_search(messages[-1]["content"], search_query))
         except Exception as e:
             debug.error(f"Couldn't do web search:", e)
     
@@ -319,8 +343,10 @@ def iter_run_tools(
                         # Enable provider native continue
                         kwargs["action"] = "continue"
                 elif function_name == TOOL_NAMES["BUCKET"]:
+                    from .files import read_bucket_context, get_bucket_dir
+                    query = get_bucket_query(messages)
                     def on_bucket(match):
-                        return "".join(read_bucket(get_bucket_dir(match.group(1))))
+                        return read_bucket_context(get_bucket_dir(match.group(1)), query)
                     has_bucket = False
                     for message in messages:
                         if "content" in message and isinstance(message["content"], str):
@@ -337,33 +363,44 @@ def iter_run_tools(
     thinking_start_time = 0
     processor = ThinkingProcessor()
     model_info = model
-    for chunk in provider.create_function(model=model, messages=messages, provider=provider, **kwargs):
-        if isinstance(chunk, FinishReason):
-            if sources is not None:
-                yield sources
+    token_counter = TokenCounter(model)
+    has_usage = False
+    try:
+        for chunk in provider.create_function(model=model, messages=messages, provider=provider, **kwargs):
+            if isinstance(chunk, FinishReason):
+                if sources is not None:
+                    yield sources
+                    sources = None
+                yield chunk
+                continue
+            elif isinstance(chunk, Sources):
                 sources = None
-            yield chunk
-            continue
-        elif isinstance(chunk, Sources):
-            sources = None
-        elif isinstance(chunk, ProviderInfo):
-            model_info = getattr(chunk, 'model', model_info)
-        elif isinstance(chunk, Usage):
-            usage = {"user": kwargs.get("user"), "model": model_info, "provider": provider.get_parent(), **chunk.get_dict()}
-            usage_dir = Path(get_cookies_dir()) / ".usage"
-            usage_file = usage_dir / f"{datetime.date.today()}.jsonl"
-            usage_dir.mkdir(parents=True, exist_ok=True)
-            with usage_file.open("a" if usage_file.exists() else "w") as f:
-                f.write(f"{json.dumps(usage)}\n")
-
-        if not isinstance(chunk, str):
-            yield chunk
-            continue
-            
-        thinking_start_time, results = processor.process_thinking_chunk(chunk, thinking_start_time)
-        
-        for result in results:
-            yield result
+            elif isinstance(chunk, ProviderInfo):
+                model_info = getattr(chunk, 'model', model_info)
+            elif isinstance(chunk, Usage):
+                has_usage = True
+                record_usage(provider, model_info, chunk, kwargs.get("user"))
+            elif isinstance(chunk, Reasoning) and chunk.token:
+                token_counter.add(chunk.token)
+
+            if not isinstance(chunk, str):
+                yield chunk
+                continue
+
+            token_counter.add(chunk)
+            thinking_start_time, results = processor.process_thinking_chunk(chunk, thinking_start_time)
+
+            for result in results:
+                yield result
+        if not has_usage:
+            has_usage = True
+            usage = estimate_usage(messages, model_info, token_counter)
+            record_usage(provider, model_info, usage, kwargs.get("user"))
+            yield usage
+    finally:
+        # Also record responses that are closed before the end
+        if not has_usage and (token_counter.count or token_counter.pending):
+            record_usage(provider, model_info, estimate_usage(messages, model_info, token_counter), kwargs.get("user"))
 
     if sources is not None:
         yield sources
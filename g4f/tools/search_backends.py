@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+try:
+    from ddgs import DDGS
+    from ddgs.exceptions import DDGSException
+    has_ddgs = True
+except ImportError:
+    has_ddgs = False
+    class DDGSException(Exception):
+        pass
+
+from ..requests import SharedSession, raise_for_status
+from ..errors import MissingRequirementsError
+from .crawler import normalize_url
+from .. import debug
+
+class SearchBackend:
+    """
+    Base class of web search backends.
+    ``search`` returns a list of results with ``title``, ``url`` and ``snippet``.
+    """
+    name: str = None
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        region: str = "wt-wt",
+        backend: str = "auto",
+        timeout: int = 5
+    ) -> List[dict]:
+        raise NotImplementedError()
+
+class DDGSBackend(SearchBackend):
+    """DuckDuckGo search with the blocking ``ddgs`` package, run in a bounded thread pool."""
+    name = "DDG"
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="g4f-search")
+        return self.executor
+
+    def search_sync(self, query: str, max_results: int, region: str, backend: str) -> List[dict]:
+        if not has_ddgs:
+            raise MissingRequirementsError('Install "ddgs" | pip install -U g4f[search]')
+        results = []
+        with DDGS() as ddgs:
+            for result in ddgs.text(
+                query,
+                region=region,
+                safesearch="moderate",
+                timelimit="y",
+                max_results=max_results,
+                backend=backend,
+            ):
+                if ".google." in result["href"]:
+                    continue
+                results.append({"title": result["title"], "url": result["href"], "snippet": result["body"]})
+        return results
+
+    async def search(self, query: str, max_results: int = 5, region: str = "wt-wt", backend: str = "auto", timeout: int = 5) -> List[dict]:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.get_executor(),
+            partial(self.search_sync, query, max_results, region, backend)
+        )
+
+class SearXNGBackend(SearchBackend):
+    """Search with the JSON API of a SearXNG instance over a shared keep-alive session."""
+    name = "SearXNG"
+
+    def __init__(self, url: str = None) -> None:
+        self.url = url
+
+    async def search(self, query: str, max_results: int = 5, region: str = "wt-wt", backend: str = "auto", timeout: int = 5) -> List[dict]:
+        url = self.url or os.environ.get("SEARXNG_URL", "http://searxng:8080")
+        async with SharedSession(url, timeout=timeout) as session:
+            async with session.get(f"{url}/search", params={
+                "q": query,
+                "format": "json",
+                "safesearch": 0,
+                "categories": "general",
+            }) as response:
+                await raise_for_status(response)
+                data = await response.json()
+        return [{
+            "title": result.get("title") or "",
+            "url": result["url"],
+            "snippet": result.get("content") or "",
+        } for result in data.get("results", []) if result.get("url")][:max_results]
+
+class FakeBackend(SearchBackend):
+    """Local backend with fixed results, for tests."""
+    name = "Fake"
+
+    def __init__(self, results: Union[List[dict], Dict[str, List[dict]]] = None, name: str = None) -> None:
+        """
+        Args:
+            results: The results of every query, or the results by query.
+            name (str): The name of the backend in the registry.
+        """
+        self.results = [] if results is None else results
+        if name is not None:
+            self.name = name
+        self.queries: List[str] = []
+
+    async def search(self, query: str, max_results: int = 5, region: str = "wt-wt", backend: str = "auto", timeout: int = 5) -> List[dict]:
+        self.queries.append(query)
+        results = self.results.get(query, []) if isinstance(self.results, dict) else self.results
+        return [dict(result) for result in results[:max_results]]
+
+backends: Dict[str, SearchBackend] = {}
+
+def register_backend(backend: SearchBackend) -> SearchBackend:
+    backends[backend.name] = backend
+    return backend
+
+register_backend(DDGSBackend())
+register_backend(SearXNGBackend())
+
+def get_backend_names(provider: Union[str, List[str]]) -> List[str]:
+    if isinstance(provider, str):
+        provider = provider.split(",")
+    return [name.strip() for name in provider if name.strip()]
+
+async def search_backends(query: str, provider: Union[str, List[str]] = "DDG", max_results: int = 5, **kwargs) -> List[dict]:
+    """
+    Search with one or more backends in parallel and merge the results.
+    The results are interleaved by rank and deduplicated by url.
+    The error of the first backend is raised if all backends fail.
+    """
+    names = get_backend_names(provider)
+    for name in names:
+        if name not in backends:
+            raise ValueError(f"Unknown search backend: {name}")
+    responses = await asyncio.gather(
+        *[backends[name].search(query, max_results, **kwargs) for name in names],
+        return_exceptions=True
+    )
+    errors = [response for response in responses if isinstance(response, Exception)]
+    if errors and len(errors) == len(responses):
+        raise errors[0]
+    for name, response in zip(names, responses):
+        if isinstance(response, Exception):
+            debug.error(f"Search backend {name} failed:", response)
+    lists = [response for response in responses if not isinstance(response, Exception)]
+    merged = []
+    seen = set()
+    for rank in range(max((len(results) for results in lists), default=0)):
+        for results in lists:
+            if rank < len(results):
+                key = normalize_url(results[rank]["url"]) or results[rank]["url"]
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(results[rank])
+    return merged[:max_results]
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import json
+import time
+import sqlite3
+import asyncio
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from ..cookies import get_cookies_dir
+from .. import debug
+
+def get_cache_file() -> Path:
+    return Path(get_cookies_dir()) / ".scrape_cache" / "web_search.sqlite"
+
+def normalize_query(query: str) -> str:
+    """Normalize unicode, case and whitespace, so equal queries share a cache entry."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+class SQLiteCache:
+    """
+    Table of a SQLite database with expiry after ``ttl`` seconds and LRU eviction above ``max_size`` bytes.
+
+    The methods block on disk, coroutines use the ``*_async`` variants that run them in a worker thread.
+    """
+
+    table = "results"
+    columns = "key TEXT PRIMARY KEY, value TEXT, size INTEGER, created REAL, accessed REAL"
+    # Least recently used rows read per eviction query
+    evict_batch = 64
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = 24 * 60 * 60, max_size: int = 64 * 1024 * 1024) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.connection: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        self.evictions = 0
+        # Size of all rows, read once on connect and updated on every write
+        self.total_size = 0
+
+    def connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            if self.path is None:
+                self.path = get_cache_file()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({self.columns})")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_accessed ON {self.table} (accessed)")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_created ON {self.table} (created)")
+            self.total_size = self.connection.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        return self.connection
+
+    def _insert(self, connection: sqlite3.Connection, key: str, size: int, values: tuple, now: float) -> None:
+        row = connection.execute(f"SELECT size FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        connection.execute(f"INSERT OR REPLACE INTO {self.table} VALUES ({', '.join('?' * len(values))})", values)
+        self.total_size += size - (row[0] if row else 0)
+        if self.total_size > self.max_size:
+            self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Delete the expired rows, then the least recently used rows until the table fits in ``max_size``."""
+        count, size = connection.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table} WHERE created <= ?", (now - self.ttl,)
+        ).fetchone()
+        if count:
+            connection.execute(f"DELETE FROM {self.table} WHERE created <= ?", (now - self.ttl,))
+        evicted = count
+        self.total_size -= size
+        while self.total_size > self.max_size:
+            rows = connection.execute(
+                f"SELECT key, size FROM {self.table} ORDER BY accessed LIMIT ?", (self.evict_batch,)
+            ).fetchall()
+            if not rows:
+                self.total_size = 0
+                break
+            for key, size in rows:
+                connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                evicted += 1
+                self.total_size -= size
+                if self.total_size <= self.max_size:
+                    break
+        self.evictions += evicted
+
+    def get_disk_stats(self) -> dict:
+        try:
+            entries, size = self.connect().execute(f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}").fetchone()
+            return {"disk_entries": entries, "disk_size": size}
+        except sqlite3.Error:
+            return {}
+
+    def clear(self) -> None:
+        with self.lock:
+            try:
+                self.connect().execute(f"DELETE FROM {self.table}")
+                self.total_size = 0
+            except sqlite3.Error as e:
+                debug.error("Cache: Failed to clear:", e)
+
+    async def get_async(self, key: str) -> Optional[dict]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def set_async(self, *args) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.set, *args)
+
+class SearchCache(SQLiteCache):
+    """
+    Two tier cache for web search results.
+
+    Results are kept in an in-process LRU and in a SQLite database. Entries expire
+    after ``ttl`` seconds, and the least recently used entries are evicted when the
+    database grows over ``max_size`` bytes. Concurrent searches for the same key,
+    also from different event loops, wait for the first one instead of searching again.
+    """
+
+    columns = "key TEXT PRIMARY KEY, query TEXT, value TEXT, size INTEGER, created REAL, accessed REAL, seconds REAL"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = 24 * 60 * 60,
+        max_entries: int = 256,
+        max_size: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            path (Path): The database file, defaults to ``.scrape_cache/web_search.sqlite`` in the cookies dir.
+            ttl (float): Seconds until an entry expires.
+            max_entries (int): Number of entries in memory.
+            max_size (int): Maximum size in bytes of the cached results on disk.
+        """
+        super().__init__(path, ttl, max_size)
+        self.max_entries = max_entries
+        # Guards the memory tier, the inflight searches and the stats, ``lock`` guards the database
+        self.memory_lock = threading.Lock()
+        self.memory: OrderedDict[str, Tuple[float, float, dict]] = OrderedDict()
+        self.inflight: Dict[str, Future] = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "inflight_hits": 0, "misses": 0, "saved_seconds": 0.0}
+
+    @staticmethod
+    def get_key(query: str, **kwargs) -> str:
+        data = json.dumps({"query": normalize_query(query), **kwargs}, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode(errors="ignore")).hexdigest()
+
+    def _remember(self, key: str, created: float, seconds: float, value: dict) -> None:
+        self.memory[key] = (created, seconds, value)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def get_memory(self, key: str) -> Optional[dict]:
+        """Return an entry that is not expired from memory, without disk access."""
+        now = time.time()
+        with self.memory_lock:
+            item = self.memory.get(key)
+            if item is not None:
+                created, seconds, value = item
+                if created + self.ttl > now:
+                    self.memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    self.stats["saved_seconds"] += seconds
+                    return value
+                del self.memory[key]
+        return None
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return an entry that is not expired from memory or disk."""
+        value = self.get_memory(key)
+        if value is not None:
+            return value
+        now = time.time()
+        with self.lock:
+            try:
+                connection = self.connect()
+                row = connection.execute(
+                    "SELECT value, created, seconds FROM results WHERE key = ? AND created > ?",
+                    (key, now - self.ttl)
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+                value = json.loads(row[0])
+            except (sqlite3.Error, json.JSONDecodeError) as e:
+                debug.error("Search cache: Failed to read entry:", e)
+                return None
+        with self.memory_lock:
+            self._remember(key, row[1], row[2], value)
+            self.stats["disk_hits"] += 1
+            self.stats["saved_seconds"] += row[2]
+        return value
+
+    def set(self, key: str, query: str, value: dict, seconds: float = 0) -> None:
+        now = time.time()
+        data = json.dumps(value)
+        with self.memory_lock:
+            self._remember(key, now, seconds, value)
+        with self.lock:
+            try:
+                self._insert(self.connect(), key, len(data), (key, query, data, len(data), now, now, seconds), now)
+            except sqlite3.Error as e:
+                debug.error("Search cache: Failed to write entry:", e)
+
+    async def get_or_create(self, key: str, query: str, create: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        Return a cached entry or create it. Concurrent calls with the same key share one call of ``create``.
+        Entries without results are not cached. The database is read and written in a worker thread.
+        If the first call is cancelled, one of the waiting calls creates the entry instead.
+        """
+        while True:
+            value = self.get_memory(key)
+            if value is None:
+                value = await self.get_async(key)
+            if value is not None:
+                return value
+            with self.memory_lock:
+                future = self.inflight.get(key)
+                if future is None:
+                    future = Future()
+                    self.inflight[key] = future
+                    break
+                self.stats["inflight_hits"] += 1
+            # A cancelled waiter must not cancel the shared future
+            value = await asyncio.shield(asyncio.wrap_future(future))
+            if value is not None:
+                return value
+        with self.memory_lock:
+            self.stats["misses"] += 1
+        start = time.time()
+        try:
+            value = await create()
+            if value.get("results"):
+                await self.set_async(key, query, value, time.time() - start)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # Let the waiters try again instead of cancelling them too
+            with self.memory_lock:
+                del self.inflight[key]
+            future.set_result(None)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.memory_lock:
+                if self.inflight.get(key) is future:
+                    del self.inflight[key]
+
+    def get_stats(self) -> dict:
+        with self.memory_lock:
+            stats = {**self.stats, "evictions": self.evictions, "memory_entries": len(self.memory)}
+        with self.lock:
+            stats.update(self.get_disk_stats())
+        requests = stats["memory_hits"] + stats["disk_hits"] + stats["inflight_hits"] + stats["misses"]
+        stats["hit_rate"] = (requests - stats["misses"]) / requests if requests else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self.memory_lock:
+            self.memory.clear()
+        super().clear()
+
+search_cache = SearchCache()
+
+class PageCache(SQLiteCache):
+    """
+    Cache of scraped web pages, keyed by url and scrape options.
+
+    A page is used without a request for ``fresh_ttl`` seconds. Then it is
+    revalidated with a conditional request using its ETag and Last-Modified headers,
+    and it is only scraped again if it has changed.
+    """
+
+    table = "pages"
+    columns = "key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT, value TEXT, size INTEGER, created REAL, accessed REAL"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = 7 * 24 * 60 * 60,
+        fresh_ttl: float = 60 * 60,
+        max_size: int = 128 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            path (Path): The database file, defaults to ``.scrape_cache/web_search.sqlite`` in the cookies dir.
+            ttl (float): Seconds until a page expires if it is not revalidated.
+            fresh_ttl (float): Seconds until a page is revalidated.
+            max_size (int): Maximum size in bytes of the cached pages.
+        """
+        super().__init__(path, ttl, max_size)
+        self.fresh_ttl = fresh_ttl
+        self.stats = {"hits": 0, "not_modified": 0, "misses": 0}
+
+    @staticmethod
+    def get_key(url: str, **kwargs) -> str:
+        data = json.dumps({"url": url, **kwargs}, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode(errors="ignore")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a page that is not expired, with its ``etag``, ``last_modified``, ``value`` and ``fresh`` state."""
+        now = time.time()
+        with self.lock:
+            try:
+                connection = self.connect()
+                row = connection.execute(
+                    f"SELECT etag, last_modified, value, created FROM {self.table} WHERE key = ? AND created > ?",
+                    (key, now - self.ttl)
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(f"UPDATE {self.table} SET accessed = ? WHERE key = ?", (now, key))
+            except sqlite3.Error as e:
+                debug.error("Page cache: Failed to read entry:", e)
+                return None
+        etag, last_modified, value, created = row
+        return {"etag": etag, "last_modified": last_modified, "value": value, "fresh": created + self.fresh_ttl > now}
+
+    def set(self, key: str, url: str, value: str, etag: str = None, last_modified: str = None) -> None:
+        now = time.time()
+        with self.lock:
+            try:
+                size = len(value.encode(errors="replace"))
+                self._insert(self.connect(), key, size, (key, url, etag, last_modified, value, size, now, now), now)
+            except sqlite3.Error as e:
+                debug.error("Page cache: Failed to write entry:", e)
+
+    def touch(self, key: str) -> None:
+        """Mark a revalidated page as fresh."""
+        now = time.time()
+        with self.lock:
+            try:
+                self.connect().execute(f"UPDATE {self.table} SET created = ?, accessed = ? WHERE key = ?", (now, now, key))
+            except sqlite3.Error as e:
+                debug.error("Page cache: Failed to update entry:", e)
+
+    async def touch_async(self, key: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.touch, key)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            stats = {**self.stats, "evictions": self.evictions, **self.get_disk_stats()}
+        requests = stats["hits"] + stats["not_modified"] + stats["misses"]
+        stats["hit_rate"] = (requests - stats["misses"]) / requests if requests else 0.0
+        return stats
+
+page_cache = PageCache()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    import tiktoken
+    has_tiktoken = True
+except ImportError:
+    has_tiktoken = False
+
+from ..typing import Messages
+from .. import debug
+
+HEURISTIC = "heuristic"
+DEFAULT_ENCODING = "cl100k_base"
+# Encodings of model name prefixes that tiktoken does not know. Other models are
+# counted with the default encoding, which is close enough for billing estimates.
+MODEL_ENCODINGS: List[Tuple[str, str]] = [
+    ("gpt-5", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4o", "o200k_base"),
+    ("chatgpt-4o", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+    ("gpt-oss", "o200k_base"),
+]
+# Tokens added per message and for the reply, as counted by OpenAI chat models
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+TOKENS_PER_REPLY = 3
+# Streamed text without whitespace is counted in pieces of this size
+MAX_PENDING = 256
+# Counts of message texts that are kept, by encoding and digest of the text
+COUNT_CACHE_SIZE = 4096
+
+WORD_REGEX = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+WHITESPACE_REGEX = re.compile(r"\s(?=\S*\Z)")
+
+class Encoder:
+    """Counts the tokens of texts."""
+    name: str = None
+
+    def count(self, text: str) -> int:
+        raise NotImplementedError()
+
+class HeuristicEncoder(Encoder):
+    """
+    Estimates tokens without a vocabulary. Text is split like the tiktoken pre-tokenizer.
+    ASCII words are one token per six characters, other scripts one per four UTF-8 bytes.
+    """
+    name = HEURISTIC
+
+    def count(self, text: str) -> int:
+        count = 0
+        for word in WORD_REGEX.findall(text):
+            if word.isascii():
+                count += 1 + (len(word) - 1) // 6
+            else:
+                count += 1 + (len(word.encode()) - 1) // 4
+        return count
+
+class TiktokenEncoder(Encoder):
+    """Exact counts with a tiktoken encoding, the vocabulary is loaded on first use."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.encoding = tiktoken.get_encoding(name)
+
+    def encode(self, text: str) -> List[int]:
+        return self.encoding.encode(text, disallowed_special=())
+
+    def count(self, text: str) -> int:
+        return len(self.encode(text))
+
+# Factories of the encoders by encoding name
+encoders: Dict[str, Callable[[], Encoder]] = {HEURISTIC: HeuristicEncoder}
+if has_tiktoken:
+    for name in ("cl100k_base", "o200k_base"):
+        encoders[name] = partial(TiktokenEncoder, name)
+
+def register_encoder(name: str, factory: Callable[[], Encoder]) -> None:
+    """Add an encoder, for example for the tokenizer of a local model."""
+    encoders[name] = factory
+    with _load_lock:
+        _loaded.pop(name, None)
+        _loading.discard(name)
+    with _count_lock:
+        _counts.clear()
+
+def get_encoding_name(model: Optional[str]) -> str:
+    model = (model or "").lower().split("/")[-1]
+    for prefix, name in MODEL_ENCODINGS:
+        if model.startswith(prefix):
+            return name
+    if has_tiktoken and model:
+        try:
+            return tiktoken.encoding_name_for_model(model)
+        except KeyError:
+            pass
+    return DEFAULT_ENCODING
+
+# Encoders by encoding name, and the names that are loaded in a background thread
+_loaded: Dict[str, Encoder] = {HEURISTIC: HeuristicEncoder()}
+_loading: Set[str] = set()
+_load_lock = threading.Lock()
+
+def load_encoder(name: str) -> Encoder:
+    """
+    Load an encoder once and wait for it. tiktoken reads or downloads the vocabulary,
+    so this can block for a long time. Falls back to the heuristic encoder.
+    """
+    encoder = _loaded.get(name)
+    if encoder is not None:
+        return encoder
+    factory = encoders.get(name)
+    encoder = _loaded[HEURISTIC]
+    if factory is not None:
+        try:
+            encoder = factory()
+        except Exception as e:
+            # tiktoken downloads the vocabulary, it can fail offline
+            debug.error(f"Tokenizer: Failed to load {name}:", e)
+    with _load_lock:
+        _loaded[name] = encoder
+        _loading.discard(name)
+    return encoder
+
+def preload_encoder(name: str = DEFAULT_ENCODING) -> None:
+    """Start loading an encoder in a background thread, for example at startup."""
+    with _load_lock:
+        if name in _loaded or name in _loading:
+            return
+        _loading.add(name)
+    threading.Thread(target=load_encoder, args=(name,), name=f"g4f-tokenizer-{name}", daemon=True).start()
+
+def get_encoder(model: Optional[str] = None) -> Encoder:
+    """
+    Return the encoder of a model without waiting for it. Until it is loaded
+    in a background thread, tokens are estimated with the heuristic encoder.
+    """
+    name = get_encoding_name(model)
+    encoder = _loaded.get(name)
+    if encoder is None:
+        preload_encoder(name)
+        return _loaded[HEURISTIC]
+    return encoder
+
+_count_lock = threading.Lock()
+_counts: OrderedDict[Tuple[str, bytes], int] = OrderedDict()
+
+def _count_cached(encoder: Encoder, text: str) -> int:
+    # Keyed on a digest, so long prompts are not kept alive by the cache
+    key = (encoder.name, hashlib.sha1(text.encode(errors="surrogatepass")).digest())
+    with _count_lock:
+        count = _counts.get(key)
+        if count is not None:
+            _counts.move_to_end(key)
+            return count
+    count = encoder.count(text)
+    with _count_lock:
+        _counts[key] = count
+        while len(_counts) > COUNT_CACHE_SIZE:
+            _counts.popitem(last=False)
+    return count
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    return get_encoder(model).count(text)
+
+def get_text(content) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part.get("text") or "" if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return "" if content is None else json.dumps(content, default=str)
+
+def count_message_tokens(messages: Messages, model: Optional[str] = None) -> int:
+    """Count the prompt tokens of messages. The count of each message is cached, so a growing conversation is counted once."""
+    encoder = get_encoder(model)
+    count = TOKENS_PER_REPLY
+    for message in messages:
+        count += TOKENS_PER_MESSAGE
+        count += _count_cached(encoder, message.get("role", ""))
+        count += _count_cached(encoder, get_text(message.get("content")))
+        if message.get("name"):
+            count += TOKENS_PER_NAME + _count_cached(encoder, message["name"])
+    return count
+
+class TokenCounter:
+    """
+    Counts the tokens of a streamed text.
+
+    Tokens rarely span a whitespace followed by a word, so the text up to the last
+    whitespace is counted and only the last word is kept for the next delta.
+    Every delta is counted once, and the sum is close to counting the whole text.
+    """
+
+    def __init__(self, model: Optional[str] = None) -> None:
+        self.encoder = get_encoder(model)
+        self.count = 0
+        self.pending = ""
+
+    def add(self, text: str) -> int:
+        """Add a delta. Returns the tokens of the completed words."""
+        buffer = self.pending + text
+        match = WHITESPACE_REGEX.search(buffer, max(0, len(self.pending) - 1))
+        cut = match.start() if match is not None and match.start() > 0 else -1
+        if cut == -1 and len(buffer) > MAX_PENDING:
+            cut = len(buffer) - 1
+        if cut > 0:
+            self.count += self.encoder.count(buffer[:cut])
+            buffer = buffer[cut:]
+        self.pending = buffer
+        return self.count
+
+    @property
+    def total(self) -> int:
+        """The tokens of the whole text, with the last word."""
+        return self.count + (self.encoder.count(self.pending) if self.pending else 0)
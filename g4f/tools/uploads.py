@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import uuid
+import atexit
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from ..integration.markitdown import markitdown_pool, StreamInfo
+    has_markitdown = True
+except ImportError:
+    has_markitdown = False
+try:
+    from werkzeug.sansio.multipart import MultipartDecoder, NeedData, File, Data, Epilogue
+    has_multipart_decoder = True
+except ImportError:
+    has_multipart_decoder = False
+
+from ..image import is_allowed_extension
+from ..image.derivatives import create_derivatives, has_requirements as has_pillow
+from .files import supports_filename, FILE_LIST
+from .. import debug
+
+CHUNK_SIZE = 64 * 1024
+UPLOAD_PREFIX = ".upload-"
+
+file_list_lock = threading.Lock()
+
+def save_upload(stream: BinaryIO, bucket_dir: str, suffix: str = None, chunk_size: int = CHUNK_SIZE) -> Tuple[str, str, int]:
+    """
+    Copy an upload to a temporary file in the bucket dir, hashing the bytes as they arrive.
+    Only one chunk is in memory, and the file can be renamed in the same file system.
+
+    Returns:
+        Tuple[str, str, int]: The path, the sha256 hex digest and the size.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=bucket_dir, prefix=UPLOAD_PREFIX, suffix=suffix, delete=False) as f:
+        try:
+            while chunk := stream.read(chunk_size):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    return f.name, digest.hexdigest(), size
+
+def iter_multipart_uploads(
+    stream: BinaryIO,
+    boundary: str,
+    bucket_dir: str,
+    field: str = "files",
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[str, str, str, str, int]]:
+    """
+    Save the files of a multipart/form-data body to temporary files in the bucket dir while it is read.
+    Unlike ``request.files``, the body is not buffered first, so each upload is written once.
+
+    Yields:
+        Tuple[str, str, str, str, int]: The filename, the mime type, the path, the sha256 hex digest and the size.
+    """
+    decoder = MultipartDecoder(boundary.encode())
+    upload = None
+    complete = False
+    try:
+        while True:
+            event = decoder.next_event()
+            if isinstance(event, NeedData):
+                if complete:
+                    raise ValueError("Incomplete multipart body")
+                chunk = stream.read(chunk_size)
+                complete = not chunk
+                decoder.receive_data(chunk or None)
+            elif isinstance(event, File):
+                if event.name == field:
+                    suffix = os.path.splitext(event.filename or "")[1].lower()
+                    f = tempfile.NamedTemporaryFile(dir=bucket_dir, prefix=UPLOAD_PREFIX, suffix=suffix, delete=False)
+                    upload = (event.filename or "", event.headers.get("content-type", ""), f, hashlib.sha256())
+            elif isinstance(event, Data):
+                if upload is None:
+                    continue
+                filename, mimetype, f, digest = upload
+                digest.update(event.data)
+                f.write(event.data)
+                if not event.more_data:
+                    upload = None
+                    f.close()
+                    yield filename, mimetype, f.name, digest.hexdigest(), os.path.getsize(f.name)
+            elif isinstance(event, Epilogue):
+                break
+    except BaseException:
+        if upload is not None:
+            upload[2].close()
+            os.remove(upload[2].name)
+        raise
+
+def append_file_list(bucket_dir: str, filenames: List[str]) -> None:
+    """Append filenames to the file list of a bucket with a single write, so lines of concurrent jobs never interleave."""
+    if not filenames:
+        return
+    data = "".join(f"{filename}\n" for filename in filenames).encode()
+    with file_list_lock:
+        fd = os.open(os.path.join(bucket_dir, FILE_LIST), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+def write_atomic(path: str, text: str) -> None:
+    tmp_file = f"{path}.tmp"
+    with open(tmp_file, "w") as f:
+        f.write(text)
+    os.replace(tmp_file, path)
+
+def convert_upload(path: str, suffix: str, mimetype: str, language: str = None) -> Optional[str]:
+    with markitdown_pool.acquire() as md:
+        return md.convert(path, stream_info=StreamInfo(
+            extension=suffix,
+            mimetype=mimetype,
+        ), recognition_language=language).text_content
+
+class UploadJob:
+    """A saved upload that is waiting for conversion and thumbnails."""
+
+    def __init__(self, bucket_dir: str, filename: str, path: str, sha256: str, size: int, mimetype: str = None, language: str = None) -> None:
+        self.id = uuid.uuid4().hex
+        self.bucket_dir = bucket_dir
+        self.filename = filename
+        self.path = path
+        self.sha256 = sha256
+        self.size = size
+        self.mimetype = mimetype
+        self.language = language
+        self.status = "queued"
+        self.files: List[str] = []
+        self.media: List[dict] = []
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.future: Optional[Future] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "error")
+
+    def get_dict(self) -> dict:
+        data = {"id": self.id, "filename": self.filename, "status": self.status, "sha256": self.sha256, "size": self.size}
+        if self.status == "done":
+            data.update(files=self.files, media=self.media)
+        elif self.error is not None:
+            data["error"] = {"message": self.error}
+        return data
+
+def process_upload(job: UploadJob) -> None:
+    """Convert a saved upload to markdown, create its thumbnail and move it into the bucket."""
+    filename = job.filename
+    suffix = os.path.splitext(filename)[1].lower()
+    result = None
+    if has_markitdown and not filename.endswith((".md", ".json", ".zip")):
+        try:
+            result = convert_upload(job.path, suffix, job.mimetype, job.language)
+        except Exception as e:
+            debug.error(f"Upload: Failed to convert {filename}:", e)
+    is_media = is_allowed_extension(filename)
+    is_supported = result or supports_filename(filename)
+    if not is_media and not is_supported:
+        os.remove(job.path)
+        raise ValueError(f"Unsupported file type: {filename}")
+    if not is_media and result:
+        write_atomic(os.path.join(job.bucket_dir, f"{filename}.md"), f"{result}\n")
+        job.files.append(f"{filename}.md")
+    if is_media:
+        media_dir = os.path.join(job.bucket_dir, "media")
+        os.makedirs(media_dir, exist_ok=True)
+        newfile = os.path.join(media_dir, filename)
+        image_size = {}
+        if has_pillow:
+            try:
+                image_size = create_derivatives(job.path, os.path.join(job.bucket_dir, "thumbnail", filename))
+            except Exception as e:
+                debug.error(f"Upload: Failed to create thumbnail of {filename}:", e)
+        job.media.append({"name": filename, "text": result, **image_size} if result else {"name": filename, **image_size})
+    elif not result:
+        newfile = os.path.join(job.bucket_dir, filename)
+        job.files.append(filename)
+    else:
+        os.remove(job.path)
+        newfile = None
+    if newfile is not None:
+        os.replace(job.path, newfile)
+    append_file_list(job.bucket_dir, job.files)
+
+class UploadQueue:
+    """
+    Processes saved uploads in a background thread pool.
+
+    The upload request only saves the files and returns the job ids. Conversion and
+    thumbnails run in the workers, and the state changes of the jobs can be followed
+    with ``iter_events``. Finished jobs are kept until ``max_jobs`` is reached.
+    """
+
+    def __init__(self, max_workers: int = 2, max_jobs: int = 1000) -> None:
+        """
+        Args:
+            max_workers (int): Number of worker threads.
+            max_jobs (int): Number of jobs to keep for status requests.
+        """
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.jobs: OrderedDict[str, UploadJob] = OrderedDict()
+        self.condition = threading.Condition()
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="g4f-upload")
+            atexit.register(self.shutdown)
+        return self.executor
+
+    def submit(self, job: UploadJob) -> UploadJob:
+        with self.condition:
+            self.jobs[job.id] = job
+            while len(self.jobs) > self.max_jobs:
+                oldest = next(iter(self.jobs.values()))
+                if not oldest.finished:
+                    break
+                self.jobs.popitem(last=False)
+            job.future = self.get_executor().submit(self._run, job)
+        return job
+
+    def _set_status(self, job: UploadJob, status: str, error: str = None) -> None:
+        with self.condition:
+            job.status = status
+            job.error = error
+            self.condition.notify_all()
+
+    def _run(self, job: UploadJob) -> None:
+        self._set_status(job, "processing")
+        try:
+            process_upload(job)
+        except Exception as e:
+            debug.error(f"Upload: Failed to process {job.filename}:", e)
+            if os.path.exists(job.path):
+                os.remove(job.path)
+            self._set_status(job, "error", f"{type(e).__name__}: {e}")
+        else:
+            self._set_status(job, "done")
+
+    def get(self, job_id: str) -> Optional[UploadJob]:
+        with self.condition:
+            return self.jobs.get(job_id)
+
+    def wait(self, jobs: List[UploadJob], timeout: float = None) -> None:
+        """Block until the jobs are finished."""
+        with self.condition:
+            self.condition.wait_for(lambda: all(job.finished for job in jobs), timeout)
+
+    def iter_events(self, job_ids: List[str], timeout: float = 300) -> Iterator[str]:
+        """Yield a server-sent event for each state change of the jobs, until all are finished."""
+        with self.condition:
+            jobs = [self.jobs[job_id] for job_id in job_ids if job_id in self.jobs]
+        states: Dict[str, str] = {}
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.condition:
+                changed = [job.get_dict() for job in jobs if states.get(job.id) != job.status]
+                for item in changed:
+                    states[item["id"]] = item["status"]
+                finished = all(job.finished for job in jobs)
+                if not changed and not finished:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    self.condition.wait(left)
+                    continue
+            for item in changed:
+                yield f'data: {json.dumps({"action": "upload", "job": item})}\n\n'
+            if finished:
+                break
+        yield f'data: {json.dumps({"action": "done", "finished": all(job.finished for job in jobs)})}\n\n'
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+upload_queue = UploadQueue()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import os
+import re
+import json
+import atexit
+import datetime
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Iterator
+
+from ..cookies import get_cookies_dir
+from .. import debug
+
+FSYNC_NEVER = "never"
+FSYNC_BATCH = "batch"
+FSYNC_ALWAYS = "always"
+
+TOKEN_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens")
+GROUPS = ("user", "model", "provider")
+
+def get_usage_dir() -> Path:
+    return Path(get_cookies_dir()) / ".usage"
+
+class UsageRecorder:
+    """
+    Records usage without blocking the caller.
+
+    Records are appended to an in-memory ring buffer and written by a background
+    thread to ``.usage/<date>.jsonl`` when ``flush_size`` records are pending or
+    every ``flush_interval`` seconds. Files larger than ``max_file_size`` are rotated
+    to ``<date>.<n>.jsonl``. Per user, model and provider totals of today are kept
+    in memory, other dates are read from their files on every query.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 10000,
+        flush_size: int = 100,
+        flush_interval: float = 2.0,
+        fsync: str = FSYNC_NEVER,
+        max_file_size: int = 50 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            buffer_size (int): Maximum number of pending records, the oldest are dropped.
+            flush_size (int): Number of pending records that triggers a write.
+            flush_interval (float): Maximum seconds between writes.
+            fsync (str): "never", "batch" (after every write) or "always" (after every record).
+            max_file_size (int): Size in bytes when a usage file is rotated.
+        """
+        self.buffer: deque[Tuple[str, dict]] = deque(maxlen=buffer_size)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_file_size = max_file_size
+        self.dropped = 0
+        # Totals of aggregates_date by group and key, updated by ``record``
+        self.aggregates_date: Optional[str] = None
+        self.aggregates: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def record(self, usage: dict) -> None:
+        """Add a usage record. Never does file I/O."""
+        date = str(datetime.date.today())
+        with self.condition:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append((date, usage))
+            if date == self.aggregates_date:
+                self._add_to_aggregates(self.aggregates, usage)
+            if self.thread is None:
+                self._start()
+            if len(self.buffer) >= self.flush_size:
+                self.condition.notify()
+
+    def _start(self) -> None:
+        self.thread = threading.Thread(target=self._run, name="g4f-usage-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: len(self.buffer) >= self.flush_size, self.flush_interval)
+            self.flush()
+
+    def _drain(self) -> List[Tuple[str, dict]]:
+        with self.condition:
+            records = list(self.buffer)
+            self.buffer.clear()
+            if self.dropped:
+                debug.error(f"Usage recorder: {self.dropped} records dropped")
+                self.dropped = 0
+        return records
+
+    def flush(self) -> None:
+        """Write all pending records to disk."""
+        with self.write_lock:
+            records = self._drain()
+            if not records:
+                return
+            by_date: Dict[str, List[dict]] = {}
+            for date, usage in records:
+                by_date.setdefault(date, []).append(usage)
+            try:
+                usage_dir = get_usage_dir()
+                usage_dir.mkdir(parents=True, exist_ok=True)
+                for date, items in by_date.items():
+                    self._write(usage_dir, date, items)
+            except OSError as e:
+                debug.error("Usage recorder: Failed to write usage:", e)
+
+    def _write(self, usage_dir: Path, date: str, items: List[dict]) -> None:
+        usage_file = usage_dir / f"{date}.jsonl"
+        if usage_file.exists() and usage_file.stat().st_size > self.max_file_size:
+            index = 1
+            while (usage_dir / f"{date}.{index}.jsonl").exists():
+                index += 1
+            os.replace(usage_file, usage_dir / f"{date}.{index}.jsonl")
+        with usage_file.open("a") as f:
+            for usage in items:
+                f.write(f"{json.dumps(usage)}\n")
+                if self.fsync == FSYNC_ALWAYS:
+                    f.flush()
+                    os.fsync(f.fileno())
+            if self.fsync == FSYNC_BATCH:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def get_files(self, date: str) -> List[Path]:
+        """Return the rotated and the current usage file of a date, oldest first."""
+        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+            return []
+        usage_dir = get_usage_dir()
+        rotated = sorted(
+            usage_dir.glob(f"{date}.*.jsonl"),
+            key=lambda file: int(file.name[len(date) + 1:-len(".jsonl")]) if file.name[len(date) + 1:-len(".jsonl")].isdigit() else 0
+        )
+        current = usage_dir / f"{date}.jsonl"
+        return rotated + ([current] if current.exists() else [])
+
+    def iter_records(self, date: str) -> Iterator[dict]:
+        """Flush pending records and iterate over all records of a date."""
+        self.flush()
+        yield from self._iter_records(date)
+
+    def _iter_records(self, date: str) -> Iterator[dict]:
+        for file in self.get_files(date):
+            with file.open("r") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+    def read(self, date: str) -> Optional[str]:
+        """Flush pending records and return the raw usage data of a date, or None."""
+        self.flush()
+        files = self.get_files(date)
+        if not files:
+            return None
+        return "".join(file.read_text() for file in files)
+
+    @staticmethod
+    def _add_to_aggregates(aggregates: Dict[str, Dict[str, Dict[str, int]]], usage: dict) -> None:
+        for group in GROUPS:
+            totals = aggregates.setdefault(group, {}).setdefault(str(usage.get(group)), {"requests": 0})
+            totals["requests"] += 1
+            for field in TOKEN_FIELDS:
+                value = usage.get(field)
+                if isinstance(value, (int, float)):
+                    totals[field] = totals.get(field, 0) + value
+
+    def get_aggregates(self, date: str = None, group: str = "model") -> Dict[str, Dict[str, int]]:
+        """
+        Return the total requests and tokens of a date grouped by user, model or provider.
+        The usage files of today are only read on the first query, other dates are not cached.
+        """
+        if group not in GROUPS:
+            raise ValueError(f"Invalid group: {group}")
+        today = str(datetime.date.today())
+        date = today if date is None else date
+        with self.write_lock:
+            if date == today and date == self.aggregates_date:
+                aggregates = self.aggregates
+            else:
+                aggregates = {}
+                for usage in self._iter_records(date):
+                    self._add_to_aggregates(aggregates, usage)
+                with self.condition:
+                    # Records that are still in the buffer are not in the files
+                    for record_date, usage in self.buffer:
+                        if record_date == date:
+                            self._add_to_aggregates(aggregates, usage)
+                    if date == today:
+                        self.aggregates_date = date
+                        self.aggregates = aggregates
+        with self.condition:
+            return {key: totals.copy() for key, totals in aggregates.get(group, {}).items()}
+
+usage_recorder = UsageRecorder()
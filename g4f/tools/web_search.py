@@ -1,32 +1,23 @@
 from __future__ import annotations
 
 from aiohttp import ClientSession, ClientTimeout, ClientError
-import json
-import hashlib
-from pathlib import Path
-from urllib.parse import urlparse, quote_plus
-from datetime import date
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+import codecs
 import asyncio
 
-# Optional dependencies using the new 'ddgs' package name
-try:
-    from ddgs import DDGS
-    from ddgs.exceptions import DDGSException
-    from bs4 import BeautifulSoup
-    has_requirements = True
-except ImportError:
-    has_requirements = False
-
 try:
     import spacy
     has_spacy = True
 except ImportError:
     has_spacy = False
 
-from typing import Iterator, List, Optional
-from ..cookies import get_cookies_dir
+from typing import Iterator, List, Optional, Union
 from ..providers.response import format_link, JsonMixin, Sources
 from ..errors import MissingRequirementsError
+from ..providers.asyncio import run_coroutine_sync
+from .search_cache import search_cache, page_cache
+from .search_backends import DDGSException, search_backends
 from .. import debug
 
 DEFAULT_INSTRUCTIONS = """
@@ -91,82 +82,224 @@ class SearchResultEntry(JsonMixin):
     def set_text(self, text: str) -> None:
         self.text = text
 
-def scrape_text(html: str, max_words: Optional[int] = None, add_source: bool = True, count_images: int = 2) -> Iterator[str]:
+CONTENT_SELECTORS = [
+    "main", ".main-content-wrapper", ".main-content", ".emt-container-inner",
+    ".content-wrapper", "#content", "#mainContent",
+]
+REMOVE_SELECTORS = [".c-globalDisclosure"]
+TEXT_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6", "p", "pre", "li", "tr"}
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+FEED_SIZE = 64 * 1024
+
+def matches_selector(tag: str, attrs: dict, selector: str) -> bool:
+    if selector.startswith("."):
+        return selector[1:] in (attrs.get("class") or "").split()
+    if selector.startswith("#"):
+        return attrs.get("id") == selector[1:]
+    return tag == selector
+
+class TextScraper(HTMLParser):
     """
-    Parses the provided HTML and yields text fragments.
-    """
-    soup = BeautifulSoup(html, "html.parser")
-    for selector in [
-        "main", ".main-content-wrapper", ".main-content", ".emt-container-inner",
-        ".content-wrapper", "#content", "#mainContent",
-    ]:
-        selected = soup.select_one(selector)
-        if selected:
-            soup = selected
-            break
+    Streaming scraper for the text of a web page.
 
-    for remove_selector in [".c-globalDisclosure"]:
-        unwanted = soup.select_one(remove_selector)
-        if unwanted:
-            unwanted.extract()
-
-    image_selector = "img[alt][src^=http]:not([alt='']):not(.avatar):not([width])"
-    image_link_selector = f"a:has({image_selector})"
-    seen_texts = []
-    
-    for element in soup.select(f"h1, h2, h3, h4, h5, h6, p, pre, table:not(:has(p)), ul:not(:has(p)), {image_link_selector}"):
-        if count_images > 0:
-            image = element.select_one(image_selector)
-            if image:
-                title = str(element.get("title", element.text))
-                if title:
-                    yield f"!{format_link(image['src'], title)}\n"
-                    if max_words is not None:
-                        max_words -= 10
-                    count_images -= 1
-                continue
+    The text of headings, paragraphs, list items and table rows is collected while
+    the HTML is fed. If a main content element is found, only its text is used.
+    Parsing stops when ``max_words`` words of the main content are collected, so the
+    rest of the page doesn't need to be downloaded or parsed. Outside of it, the
+    lines are capped at ``max_words`` words while a main content element is searched.
+    """
 
-        for line in element.get_text(" ").splitlines():
-            words = [word for word in line.split() if word]
+    def __init__(self, max_words: Optional[int] = None, count_images: int = 2) -> None:
+        super().__init__(convert_charrefs=True)
+        self.max_words = max_words
+        self.count_images = count_images
+        self.done = False
+        self.canonical: Optional[str] = None
+        # Lines outside and inside of the main content, with their remaining words
+        self.outside = {"lines": [], "seen": set(), "words": max_words}
+        self.content: Optional[dict] = None
+        self.content_tag: Optional[str] = None
+        self.content_depth = 0
+        self.skip_tag: Optional[str] = None
+        self.skip_depth = 0
+        self.text_depth = 0
+        self.buffer: List[str] = []
+        self.link: Optional[dict] = None
+        self.images: List[str] = []
+
+    @property
+    def output(self) -> dict:
+        return self.outside if self.content is None else self.content
+
+    def feed(self, data: str) -> None:
+        for start in range(0, len(data), FEED_SIZE):
+            if self.done:
+                break
+            super().feed(data[start:start + FEED_SIZE])
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if self.done:
+            return
+        attrs = dict(attrs)
+        if tag == "link" and self.canonical is None and attrs.get("href") and "canonical" in (attrs.get("rel") or "").split():
+            self.canonical = attrs["href"]
+        if self.skip_tag is not None:
+            if tag == self.skip_tag:
+                self.skip_depth += 1
+            return
+        if tag in SKIP_TAGS or any(matches_selector(tag, attrs, selector) for selector in REMOVE_SELECTORS):
+            if tag not in VOID_TAGS:
+                self.skip_tag = tag
+                self.skip_depth = 1
+            return
+        if self.content_tag is None and self.content is None and any(matches_selector(tag, attrs, selector) for selector in CONTENT_SELECTORS):
+            self.flush()
+            self.content = {"lines": [], "seen": set(), "words": self.max_words}
+            self.content_tag = tag
+            self.content_depth = 1
+            return
+        if tag == self.content_tag:
+            self.content_depth += 1
+        if tag in TEXT_TAGS:
+            self.flush()
+            self.text_depth += 1
+        elif tag in ("td", "th", "br"):
+            self.buffer.append(" ")
+        elif tag == "a":
+            self.link = {"title": attrs.get("title"), "text": [], "image": None}
+        elif tag == "img" and self.link is not None and self.count_images > 0:
+            src = attrs.get("src") or ""
+            if attrs.get("alt") and src.startswith("http") and "width" not in attrs and "avatar" not in (attrs.get("class") or "").split():
+                self.link["image"] = src
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.done:
+            return
+        if self.skip_tag is not None:
+            if tag == self.skip_tag:
+                self.skip_depth -= 1
+                if self.skip_depth <= 0:
+                    self.skip_tag = None
+            return
+        if tag in TEXT_TAGS:
+            self.flush()
+            self.text_depth = max(0, self.text_depth - 1)
+        elif tag == "a" and self.link is not None:
+            link = self.link
+            self.link = None
+            title = link["title"] or "".join(link["text"]).strip()
+            if link["image"] and title:
+                self.images.append(f"!{format_link(link['image'], title)}\n")
+                if self.text_depth == 0:
+                    self.flush()
+        if tag == self.content_tag:
+            self.content_depth -= 1
+            if self.content_depth <= 0:
+                # Only the first main content element is used
+                self.flush()
+                self.done = True
+
+    def handle_data(self, data: str) -> None:
+        if self.done or self.skip_tag is not None:
+            return
+        if self.link is not None:
+            self.link["text"].append(data)
+        if self.text_depth > 0:
+            self.buffer.append(data)
+
+    def flush(self) -> None:
+        """Add the lines of the current text element and the pending images to the output."""
+        output = self.output
+        text = "".join(self.buffer)
+        self.buffer = []
+        if output["words"] is not None and output["words"] <= 0:
+            # The fallback lines are full, but a main content element may follow
+            self.images = []
+            return
+        for line in text.splitlines():
+            words = line.split()
             if not words:
                 continue
             joined_line = " ".join(words)
-            if joined_line in seen_texts:
+            if joined_line in output["seen"]:
                 continue
-            if max_words is not None:
-                max_words -= len(words)
-                if max_words <= 0:
+            if output["words"] is not None:
+                output["words"] -= len(words)
+                if output["words"] <= 0:
+                    self.done = output is self.content
                     break
-            yield joined_line + "\n"
-            seen_texts.append(joined_line)
+            output["lines"].append(joined_line + "\n")
+            output["seen"].add(joined_line)
+        for image in self.images:
+            if self.count_images > 0:
+                output["lines"].append(image)
+                if output["words"] is not None:
+                    output["words"] -= 10
+                self.count_images -= 1
+        self.images = []
+
+    def get_lines(self, add_source: bool = True) -> Iterator[str]:
+        if not self.done:
+            self.flush()
+        yield from self.output["lines"]
+        if add_source and self.canonical:
+            domain = urlparse(self.canonical).netloc
+            yield f"\nSource: [{domain}]({self.canonical})"
 
-    if add_source:
-        canonical_link = soup.find("link", rel="canonical")
-        if canonical_link and "href" in canonical_link.attrs:
-            link = canonical_link["href"]
-            domain = urlparse(link).netloc
-            yield f"\nSource: [{domain}]({link})"
+def scrape_text(html: str, max_words: Optional[int] = None, add_source: bool = True, count_images: int = 2) -> Iterator[str]:
+    """
+    Parses the provided HTML and yields text fragments.
+    """
+    scraper = TextScraper(max_words, count_images)
+    scraper.feed(html)
+    yield from scraper.get_lines(add_source)
 
 async def fetch_and_scrape(session: ClientSession, url: str, max_words: Optional[int] = None, add_source: bool = False) -> str:
     """
-    Fetches a URL and returns the scraped text, using caching to avoid redundant downloads.
+    Fetches a URL and returns the scraped text.
+
+    Pages are cached by URL and revalidated with their ETag and Last-Modified headers.
+    The download stops as soon as ``max_words`` words are scraped. The cache is read
+    and written in a worker thread.
     """
+    key = page_cache.get_key(url, max_words=max_words, add_source=add_source)
+    cached = await page_cache.get_async(key)
+    if cached is not None and cached["fresh"]:
+        page_cache.stats["hits"] += 1
+        return cached["value"]
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["if-none-match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["if-modified-since"] = cached["last_modified"]
     try:
-        cache_dir: Path = Path(get_cookies_dir()) / ".scrape_cache" / "fetch_and_scrape"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        md5_hash = hashlib.md5(url.encode(errors="ignore")).hexdigest()
-        cache_file = cache_dir / f"{quote_plus(url.split('?')[0].split('//')[1].replace('/', ' ')[:48])}.{date.today()}.{md5_hash[:16]}.cache"
-        if cache_file.exists():
-            return cache_file.read_text()
-
-        async with session.get(url) as response:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                await page_cache.touch_async(key)
+                page_cache.stats["not_modified"] += 1
+                return cached["value"]
             if response.status == 200:
-                html = await response.text(errors="replace")
-                scraped_text = "".join(scrape_text(html, max_words, add_source))
-                with open(cache_file, "wb") as f:
-                    f.write(scraped_text.encode(errors="replace"))
+                page_cache.stats["misses"] += 1
+                scraper = TextScraper(max_words)
+                decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+                async for chunk in response.content.iter_chunked(FEED_SIZE):
+                    scraper.feed(decoder.decode(chunk))
+                    if scraper.done:
+                        break
+                else:
+                    scraper.feed(decoder.decode(b"", final=True))
+                scraped_text = "".join(scraper.get_lines(add_source))
+                if scraped_text:
+                    await page_cache.set_async(key, url, scraped_text, response.headers.get("etag"), response.headers.get("last-modified"))
                 return scraped_text
-    except (ClientError, asyncio.TimeoutError):
+    except (ClientError, asyncio.TimeoutError, LookupError):
         return ""
     return ""
 
@@ -178,57 +311,21 @@ async def search(
     add_text: bool = True,
     timeout: int = 5,
     region: str = "wt-wt",
-    provider: str = "DDG"
+    provider: Union[str, List[str]] = "DDG"
 ) -> SearchResults:
     """
     Performs a web search and returns search results.
+    Multiple providers, as a list or comma separated, are queried in parallel.
     """
-    if provider == "SearXNG":
-        from ..Provider.SearXNG import SearXNG
-        debug.log(f"[SearXNG] Using local container for query: {query}")
-        results_texts = []
-        async for chunk in SearXNG.create_async_generator(
-            "SearXNG",
-            [{"role": "user", "content": query}],
-            max_results=max_results,
-            max_words=max_words,
-            add_text=add_text
-        ):
-            if isinstance(chunk, str):
-                results_texts.append(chunk)
-        used_words = sum(text.count(" ") for text in results_texts)
-        return SearchResults([
-            SearchResultEntry(
-                title=f"Result {i + 1}",
-                url="",
-                snippet=text,
-                text=text
-            ) for i, text in enumerate(results_texts)
-        ], used_words=used_words)
-
-    debug.log(f"[DuckDuckGo] Using local container for query: {query}")
-
-    if not has_requirements:
-        raise MissingRequirementsError('Install "ddgs" and "beautifulsoup4" | pip install -U g4f[search]')
-
-    results: List[SearchResultEntry] = []
-    # Use the new DDGS() context manager style
-    with DDGS() as ddgs:
-        for result in ddgs.text(
-            query,
-            region=region,
-            safesearch="moderate",
-            timelimit="y",
-            max_results=max_results,
-            backend=backend,
-        ):
-            if ".google." in result["href"]:
-                continue
-            results.append(SearchResultEntry(
-                title=result["title"],
-                url=result["href"],
-                snippet=result["body"]
-            ))
+    debug.log(f"[{provider}] Web search for query: {query}")
+    results = [SearchResultEntry(**result) for result in await search_backends(
+        query,
+        provider,
+        max_results,
+        region=region,
+        backend=backend,
+        timeout=timeout
+    )]
 
     if add_text:
         tasks = []
@@ -276,25 +373,11 @@ async def do_search(
     if query is None:
         query = prompt.strip().splitlines()[0]
 
-    json_bytes = json.dumps({"query": query, **kwargs}, sort_keys=True).encode(errors="ignore")
-    md5_hash = hashlib.md5(json_bytes).hexdigest()
-    cache_dir: Path = Path(get_cookies_dir()) / ".scrape_cache" / "web_search" / f"{date.today()}"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / f"{quote_plus(query[:20])}.{md5_hash}.cache"
-
-    search_results: Optional[SearchResults] = None
-    if cache_file.exists():
-        with cache_file.open("r") as f:
-            try:
-                search_results = SearchResults.from_dict(json.loads(f.read()))
-            except json.JSONDecodeError:
-                search_results = None
-
-    if search_results is None:
-        search_results = await search(query, **kwargs)
-        if search_results.results:
-            with cache_file.open("w") as f:
-                f.write(json.dumps(search_results.get_dict()))
+    async def create() -> dict:
+        return (await search(query, **kwargs)).get_dict()
+    search_results = SearchResults.from_dict(
+        await search_cache.get_or_create(search_cache.get_key(query, **kwargs), query, create)
+    )
 
     if instructions:
         new_prompt = f"{search_results}\n\nInstruction: {instructions}\n\nUser request:\n{prompt}"
@@ -307,10 +390,10 @@ async def do_search(
 
 def get_search_message(prompt: str, raise_search_exceptions: bool = False, **kwargs) -> str:
     """
-    Synchronously obtains the search message by wrapping the async search call.
+    Synchronously obtains the search message by running the async search on the background loop.
     """
     try:
-        result, _ = asyncio.run(do_search(prompt, **kwargs))
+        result, _ = run_coroutine_sync(do_search(prompt, **kwargs))
         return result
     # Use the new DDGSError exception
     except (DDGSException, MissingRequirementsError) as e:
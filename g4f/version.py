@@ -1,20 +1,50 @@
 from __future__ import annotations
 
+import os
+import json
+import time
+import threading
 from os import environ
-import requests
+from pathlib import Path
+from typing import Optional
 from functools import cached_property
 from importlib.metadata import version as get_package_version, PackageNotFoundError
 from subprocess import check_output, CalledProcessError, PIPE
 from .errors import VersionNotFoundError
 from .config import PACKAGE_NAME, GITHUB_REPOSITORY
+from .cookies import get_cookies_dir
 from . import debug
 
-def get_pypi_version(package_name: str) -> str:
+# Seconds to wait for PyPI or GitHub
+VERSION_TIMEOUT = 5
+DEFAULT_CHECK_INTERVAL = 24 * 60 * 60
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+def parse_interval(value: Optional[str], default: float = DEFAULT_CHECK_INTERVAL) -> float:
+    """Parse seconds like "3600", "1.5" or with a unit like "30m", "1h" or "2d". Invalid values return the default."""
+    if not value:
+        return default
+    value = value.strip().lower()
+    unit = INTERVAL_UNITS.get(value[-1:])
+    try:
+        seconds = float(value[:-1]) * unit if unit is not None else float(value)
+    except ValueError:
+        seconds = -1
+    if not seconds >= 0:
+        debug.error(f"Invalid version check interval: {value}")
+        return default
+    return seconds
+
+# Seconds between two version checks, the result is cached on disk in between
+VERSION_CHECK_INTERVAL = parse_interval(environ.get("G4F_VERSION_CHECK_INTERVAL"))
+
+def get_pypi_version(package_name: str, timeout: float = VERSION_TIMEOUT) -> str:
     """
     Retrieves the latest version of a package from PyPI.
 
     Args:
         package_name (str): The name of the package for which to retrieve the version.
+        timeout (float): Seconds to wait for the response.
 
     Returns:
         str: The latest version of the specified package from PyPI.
@@ -22,18 +52,20 @@ def get_pypi_version(package_name: str) -> str:
     Raises:
         VersionNotFoundError: If there is an error in fetching the version from PyPI.
     """
+    import requests
     try:
-        response = requests.get(f"https://pypi.org/pypi/{package_name}/json").json()
+        response = requests.get(f"https://pypi.org/pypi/{package_name}/json", timeout=timeout).json()
         return response["info"]["version"]
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError, KeyError) as e:
         raise VersionNotFoundError(f"Failed to get PyPI version: {e}")
 
-def get_github_version(repo: str) -> str:
+def get_github_version(repo: str, timeout: float = VERSION_TIMEOUT) -> str:
     """
     Retrieves the latest release version from a GitHub repository.
 
     Args:
         repo (str): The name of the GitHub repository.
+        timeout (float): Seconds to wait for the response.
 
     Returns:
         str: The latest release version from the specified GitHub repository.
@@ -41,11 +73,12 @@ def get_github_version(repo: str) -> str:
     Raises:
         VersionNotFoundError: If there is an error in fetching the version from GitHub.
     """
+    import requests
     try:
-        response = requests.get(f"https://api.github.com/repos/{repo}/releases/latest")
+        response = requests.get(f"https://api.github.com/repos/{repo}/releases/latest", timeout=timeout)
         response.raise_for_status()
         return response.json()["tag_name"]
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError, KeyError) as e:
         raise VersionNotFoundError(f"Failed to get GitHub release version: {e}")
 
 def get_git_version() -> str:
@@ -96,12 +129,15 @@ class VersionUtils:
         Returns:
             str: The latest version of 'g4f'.
         """
+        return self.get_latest_version()
+
+    def get_latest_version(self, timeout: float = VERSION_TIMEOUT) -> str:
         # Is installed via package manager?
         try:
             get_package_version(PACKAGE_NAME)
         except PackageNotFoundError:
-            return get_github_version(GITHUB_REPOSITORY)
-        return get_pypi_version(PACKAGE_NAME)
+            return get_github_version(GITHUB_REPOSITORY, timeout)
+        return get_pypi_version(PACKAGE_NAME, timeout)
 
     @cached_property
     def latest_version_cached(self) -> str:
@@ -121,3 +157,93 @@ class VersionUtils:
             print(f'Failed to check g4f version: {e}')
 
 utils = VersionUtils()
+
+class VersionCheck:
+    """
+    Checks for a new version in a background thread, at most once per interval.
+
+    The latest version and the time of the check are saved to disk, so restarted
+    workers reuse the result instead of asking PyPI or GitHub again. Failed checks
+    are saved too, an offline deployment only tries once per interval.
+
+    Example:
+        version_check.start()
+    """
+
+    def __init__(self, interval: float = VERSION_CHECK_INTERVAL, timeout: float = VERSION_TIMEOUT, file: Path = None) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.file = file
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def get_file(self) -> Path:
+        return self.file or Path(get_cookies_dir()) / ".version" / "latest_version.json"
+
+    def load(self) -> dict:
+        try:
+            with self.get_file().open("r") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, data: dict) -> None:
+        file = self.get_file()
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = file.with_suffix(".tmp")
+            with tmp.open("w") as f:
+                json.dump(data, f)
+            os.replace(tmp, file)
+        except OSError as e:
+            debug.error("Failed to save version check:", e)
+
+    def is_due(self, data: dict, now: float = None) -> bool:
+        checked_at = data.get("checked_at")
+        return not isinstance(checked_at, (int, float)) or (now or time.time()) - checked_at >= self.interval
+
+    def check(self) -> Optional[str]:
+        """Return the latest version, from the saved result if it is recent enough."""
+        data = self.load()
+        if self.is_due(data):
+            data = {"checked_at": time.time()}
+            try:
+                data["latest_version"] = utils.get_latest_version(self.timeout)
+            except VersionNotFoundError as e:
+                data["error"] = str(e)
+            self.save(data)
+        if data.get("error"):
+            debug.error(f"Failed to check g4f version: {data['error']}")
+        latest_version = data.get("latest_version")
+        try:
+            current_version = utils.current_version
+        except VersionNotFoundError:
+            current_version = None
+        if latest_version and current_version and latest_version != current_version:
+            print(f'New g4f version: {latest_version} (current: {current_version}) | pip install -U g4f')
+        return latest_version
+
+    def get_latest_version(self) -> Optional[str]:
+        """Return the saved latest version without waiting, and start a check in the background if it is due."""
+        data = self.load()
+        if self.is_due(data):
+            self.start()
+        return data.get("latest_version")
+
+    def run(self) -> None:
+        try:
+            self.check()
+        except Exception as e:
+            debug.error("Failed to check g4f version:", e)
+
+    def start(self) -> Optional[threading.Thread]:
+        """Start the check in a daemon thread, unless it already runs. Never blocks."""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return None
+            self.thread = threading.Thread(target=self.run, name="g4f-version-check", daemon=True)
+            self.thread.start()
+            return self.thread
+
+version_check = VersionCheck()